@@ -137,8 +137,8 @@ import matplotlib.cbook as cbook
 import matplotlib.ticker as ticker
 
 
-__all__ = ('date2num', 'num2date', 'drange', 'epoch2num',
-           'num2epoch', 'mx2num', 'DateFormatter',
+__all__ = ('date2num', 'num2date', 'num2datetime64', 'drange',
+           'epoch2num', 'num2epoch', 'mx2num', 'DateFormatter',
            'IndexDateFormatter', 'AutoDateFormatter', 'DateLocator',
            'RRuleLocator', 'AutoDateLocator', 'YearLocator',
            'MonthLocator', 'WeekdayLocator',
@@ -288,6 +288,110 @@ def _from_ordinalf(x, tz=None):
 _from_ordinalf_np_vectorized = np.vectorize(_from_ordinalf)
 
 
+def _dt64_to_ordinalf(d):
+    """
+    Convert :class:`numpy.datetime64` or an ndarray of those types to the
+    Gregorian date as UTC float days, like :func:`_to_ordinalf`.  NaT is
+    converted to NaN.
+
+    The conversion works on the integer microseconds since the epoch, rather
+    than on one :class:`datetime` per element.
+    """
+    us = np.asarray(d).astype('datetime64[us]').astype(np.int64)
+    return _epoch_us_to_ordinalf(us)
+
+
+def _epoch_us_to_ordinalf(us):
+    """
+    Convert an ndarray of integer microseconds since the epoch to float days.
+    The smallest integer, which is NaT as a datetime64, is converted to NaN.
+    """
+    days, remainder = divmod(us, int(MUSECONDS_PER_DAY))
+    # the same rounding as _total_seconds(dt - midnight) / SEC_PER_DAY
+    dt = (days + EPOCH_OFFSET) + (remainder / 1e6) / SEC_PER_DAY
+    dt = np.where(us == np.iinfo(np.int64).min, np.nan, dt)
+    if dt.ndim == 0:
+        return float(dt)
+    return dt
+
+
+def _ordinalf_to_dt64(x):
+    """
+    Convert Gregorian float days to :class:`numpy.datetime64` with
+    microsecond resolution, rounding like :func:`_from_ordinalf`.  NaN and
+    infinite values are converted to NaT.
+    """
+    x = np.asarray(x, dtype=float)
+    finite = np.isfinite(x)
+    x = np.where(finite, x, 0)
+    ix = np.floor(x)
+    # Round down to the nearest microsecond.
+    us = ((x - ix) * MUSECONDS_PER_DAY).astype(np.int64)
+    us += (ix - EPOCH_OFFSET).astype(np.int64) * int(MUSECONDS_PER_DAY)
+
+    # Compensate for rounding errors
+    microsecond = us % 1000000
+    us -= np.where(microsecond < 10, microsecond, 0)
+    us += np.where(microsecond > 999990, 1000000 - microsecond, 0)
+
+    us = np.where(finite, us, np.iinfo(np.int64).min)
+    return us.view('datetime64[us]')
+
+
+def _datestr_to_dt64(d):
+    """
+    Parse an ndarray of ISO 8601 date strings, either bytes or unicode, in
+    bulk with numpy.  Return None if any of the strings is not a complete
+    ISO 8601 date, or has a time zone offset, so that
+    :func:`dateutil.parser.parse` has to be used instead.
+    """
+    if d.dtype.kind == 'S':
+        zero, nine = b'0', b'9'
+    else:
+        zero, nine = '0', '9'
+    # dateutil fills in missing fields from today, and numpy also accepts
+    # strings like 'now' and 'NaT', so only take strings starting with a
+    # complete year-month-day date
+    if not np.all(np.char.str_len(d) >= 10):
+        return None
+    first = d.astype(d.dtype.kind + '1')
+    if not np.all((first >= zero) & (first <= nine)):
+        return None
+    # numpy warns about time zone offsets, and dateutil handles them
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            return d.astype('datetime64[us]')
+        except (ValueError, TypeError, Warning):
+            return None
+
+
+def _naive_to_epoch_us(d):
+    """
+    Return the microseconds since the epoch of an object ndarray of
+    :class:`datetime` and :class:`date` instances, or None if any of them
+    has a time zone or is of another type.
+
+    Without time zones to handle, this is several times cheaper per element
+    than both :func:`_to_ordinalf` and numpy's conversion of datetimes.
+    """
+    epoch = datetime.datetime(1970, 1, 1)
+    epoch_date = epoch.date()
+    us = []
+    for x in d.flat:
+        if isinstance(x, datetime.datetime):
+            if x.tzinfo is not None:
+                return None
+            td = x - epoch
+        elif isinstance(x, datetime.date):
+            td = x - epoch_date
+        else:
+            return None
+        us.append(td.days * 86400000000 + td.seconds * 1000000 +
+                  td.microseconds)
+    return np.array(us, dtype=np.int64).reshape(d.shape)
+
+
 class strpdate2num(object):
     """
     Use this class to parse date strings to matplotlib datenums when
@@ -357,12 +461,17 @@ def datestr2num(d, default=None):
         d = np.asarray(d)
         if not d.size:
             return d
+        if d.dtype.kind in 'SU':
+            dt = _datestr_to_dt64(d)
+            if dt is not None:
+                return _dt64_to_ordinalf(dt)
         return date2num(_dateutil_parser_parse_np_vectorized(d))
 
 
 def date2num(d):
     """
-    *d* is either a :class:`datetime` instance or a sequence of datetimes.
+    *d* is either a :class:`datetime` or :class:`numpy.datetime64` instance
+    or a sequence of those.
 
     Return value is a floating point number (or sequence of floats)
     which gives the number of days (fraction part represents hours,
@@ -370,13 +479,23 @@ def date2num(d):
     The addition of one here is a historical artifact.  Also, note
     that the Gregorian calendar is assumed; this is not universal
     practice.  For details, see the module docstring.
+
+    NaT values of :class:`numpy.datetime64` are converted to NaN.
     """
+    if isinstance(d, np.datetime64):
+        return _dt64_to_ordinalf(d)
     if not cbook.iterable(d):
         return _to_ordinalf(d)
     else:
         d = np.asarray(d)
         if not d.size:
             return d
+        if d.dtype.kind == 'M':
+            return _dt64_to_ordinalf(d)
+        if d.dtype.kind == 'O':
+            us = _naive_to_epoch_us(d)
+            if us is not None:
+                return _epoch_us_to_ordinalf(us)
         return _to_ordinalf_np_vectorized(d)
 
 
@@ -424,6 +543,21 @@ def num2date(x, tz=None):
         return _from_ordinalf_np_vectorized(x, tz).tolist()
 
 
+def num2datetime64(x):
+    """
+    *x* is a float value, or sequence of floats, which gives the number of
+    days since 0001-01-01 00:00:00 UTC *plus* *one*, as returned by
+    :func:`date2num`.
+
+    Return value is a :class:`numpy.datetime64` with microsecond resolution
+    in UTC, or an array of those if *x* is a sequence.  NaN is converted to
+    NaT.  Unlike :func:`num2date`, no :class:`datetime` objects are created.
+    """
+    if not cbook.iterable(x):
+        return _ordinalf_to_dt64(x)[()]
+    return _ordinalf_to_dt64(x)
+
+
 def drange(dstart, dend, delta):
     """
     Return a date range as float Gregorian ordinals.  *dstart* and
@@ -1574,3 +1708,4 @@ class DateConverter(units.ConversionInterface):
 
 units.registry[datetime.date] = DateConverter()
 units.registry[datetime.datetime] = DateConverter()
+units.registry[np.datetime64] = DateConverter()
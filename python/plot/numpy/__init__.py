@@ -103,6 +103,17 @@ Most of the functions in `numpy` return a copy of the array argument
 available as array methods, i.e. ``x = np.array([1,2,3]); x.sort()``.
 Exceptions to this rule are documented.
 
+Import time
+-----------
+If the environment variable ``NUMPY_LAZY_IMPORT`` is set to 1, the
+subpackages `linalg`, `fft`, `polynomial`, `random`, `ctypeslib` and `ma`
+are imported on first attribute access instead of by ``import numpy``, as
+are the docstrings of the objects implemented in C.  `matrixlib` and
+`testing` are always imported: `lib` itself uses `matrix`, whose names
+are part of the numpy namespace, and every subpackage binds its ``test``
+function from `testing` at import time.  The cost of importing numpy,
+module by module, is reported by ``python -m numpy._import_tools``.
+
 """
 from __future__ import division, absolute_import, print_function
 
@@ -134,12 +145,24 @@ else:
     from .version import version as __version__
 
     from ._import_tools import PackageLoader
+    from ._import_tools import (LazyModule as _LazyModule,
+                                lazy_import as _lazy_import,
+                                lazy_import_enabled as _lazy_import_enabled)
 
     def pkgload(*packages, **options):
         loader = PackageLoader(infunc=True)
         return loader(*packages, **options)
 
-    from . import add_newdocs
+    # With NUMPY_LAZY_IMPORT=1, the docstrings of add_newdocs and the
+    # subpackages that are not needed by core and lib are loaded on first
+    # use, which shortens the start up of short-lived processes.
+    _lazy = _lazy_import_enabled()
+    if _lazy:
+        # Import lib (and core) first, as add_newdocs would have done.
+        from . import lib
+        add_newdocs = _lazy_import('numpy.add_newdocs')
+    else:
+        from . import add_newdocs
     __all__ = ['add_newdocs',
                'ModuleDeprecationWarning',
                'VisibleDeprecationWarning']
@@ -160,12 +183,26 @@ else:
     from . import compat
     from . import lib
     from .lib import *
-    from . import linalg
-    from . import fft
-    from . import polynomial
-    from . import random
-    from . import ctypeslib
-    from . import ma
+    if _lazy:
+        def _attach_docs():
+            if isinstance(add_newdocs, _LazyModule):
+                add_newdocs._lazy_load()
+
+        linalg = _lazy_import('numpy.linalg', _attach_docs)
+        fft = _lazy_import('numpy.fft', _attach_docs)
+        polynomial = _lazy_import('numpy.polynomial', _attach_docs)
+        random = _lazy_import('numpy.random', _attach_docs)
+        ctypeslib = _lazy_import('numpy.ctypeslib', _attach_docs)
+        ma = _lazy_import('numpy.ma', _attach_docs)
+    else:
+        from . import linalg
+        from . import fft
+        from . import polynomial
+        from . import random
+        from . import ctypeslib
+        from . import ma
+    # not deferred: numpy.lib already imports matrixlib, and its names are
+    # exported here
     from . import matrixlib as _mat
     from .matrixlib import *
     from .compat import long
@@ -2,9 +2,10 @@ from __future__ import division, absolute_import, print_function
 
 import os
 import sys
+import types
 import warnings
 
-__all__ = ['PackageLoader']
+__all__ = ['PackageLoader', 'LazyModule', 'lazy_import', 'import_profile']
 
 class PackageLoader(object):
     def __init__(self, verbose=False, infunc=False):
@@ -349,3 +350,184 @@ class PackageLoaderDebug(PackageLoader):
 
 if int(os.environ.get('NUMPY_IMPORT_DEBUG', '0')):
     PackageLoader = PackageLoaderDebug
+
+
+class LazyModule(types.ModuleType):
+    """
+    Placeholder for a module that is imported on first attribute access.
+
+    Once the module is imported, its namespace is copied into the
+    placeholder, so that references taken before the import keep working.
+    The import machinery also replaces the placeholder by the real module
+    in the namespace of the parent package.
+
+    Parameters
+    ----------
+    name : str
+        Absolute name of the module.
+    on_load : callable, optional
+        Called without arguments after the module has been imported.
+    """
+
+    def __init__(self, name, on_load=None):
+        types.ModuleType.__init__(self, name)
+        self.__dict__['_lazy_on_load'] = on_load
+
+    def _lazy_load(self):
+        __import__(self.__name__)
+        module = sys.modules[self.__name__]
+        on_load = self.__dict__.pop('_lazy_on_load', None)
+        self.__dict__.update(module.__dict__)
+        if on_load is not None:
+            on_load()
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._lazy_load(), attr)
+
+    def __dir__(self):
+        return dir(self._lazy_load())
+
+    def __repr__(self):
+        if '_lazy_on_load' in self.__dict__:
+            return "<lazy module %r>" % self.__name__
+        return repr(sys.modules[self.__name__])
+
+
+def lazy_import(name, on_load=None):
+    """
+    Return module `name`, or a `LazyModule` for it if it is not loaded yet.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name, on_load)
+
+
+def lazy_import_enabled():
+    """
+    Whether the ``NUMPY_LAZY_IMPORT`` environment variable requests lazy
+    loading of the numpy subpackages.
+    """
+    return bool(int(os.environ.get('NUMPY_LAZY_IMPORT', '0') or '0'))
+
+
+# Executed in a fresh interpreter by import_profile.  Every call of the
+# import statement that loads new modules is timed; the time spent in
+# nested imports is subtracted to get the cost of the module itself.
+_PROFILE_SCRIPT = r"""
+import sys, time
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+_import = builtins.__import__
+_clock = getattr(time, 'perf_counter', time.time)
+records, stack = [], [0.0]
+
+def _module_name(name, globals, fromlist, level):
+    # Absolute name of the module(s) loaded by an import statement.
+    if level > 0 and globals:
+        pkg = globals.get('__package__') or globals['__name__']
+        if '__path__' not in globals and not globals.get('__package__'):
+            pkg = pkg.rpartition('.')[0]
+        for _ in range(level - 1):
+            pkg = pkg.rpartition('.')[0]
+        name = pkg + '.' + name if name else pkg
+    subs = [f for f in fromlist or () if name + '.' + f in sys.modules]
+    if subs:
+        name += '.' + (subs[0] if len(subs) == 1 else
+                       '{' + ','.join(subs) + '}')
+    return name
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    before = len(sys.modules)
+    index = len(records)
+    records.append(None)
+    stack.append(0.0)
+    start = _clock()
+    try:
+        return _import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = _clock() - start
+        nested = stack.pop()
+        stack[-1] += elapsed
+        if len(sys.modules) != before:
+            records[index] = (len(stack), _module_name(name, globals,
+                                                        fromlist, level),
+                              elapsed - nested, elapsed)
+
+builtins.__import__ = _timed_import
+_import_start = _clock()
+__import__(%r)
+total = _clock() - _import_start
+builtins.__import__ = _import
+for rec in filter(None, records):
+    sys.stdout.write('%%d\t%%s\t%%r\t%%r\n' %% rec)
+sys.stdout.write('0\t<total>\t%%r\t%%r\n' %% (total, total))
+"""
+
+
+def import_profile(module='numpy', lazy=None, file=None):
+    """
+    Report the time spent importing a module and each of its dependencies.
+
+    The module is imported in a new Python interpreter, so that the report
+    is not affected by modules that are already loaded.
+
+    Parameters
+    ----------
+    module : str, optional
+        Name of the module to import.  Default is ``'numpy'``.
+    lazy : bool, optional
+        Sets the ``NUMPY_LAZY_IMPORT`` environment variable of the child
+        interpreter.  By default the current environment is inherited.
+    file : file-like, optional
+        If given, a report with one line per loaded module, indented by
+        nesting level, is written to it.
+
+    Returns
+    -------
+    records : list of tuples
+        ``(depth, name, self_time, cumulative_time)`` for each import
+        statement that loaded new modules, in the order the statements
+        were executed, with times in seconds.  The last record, named ``'<total>'``, holds the
+        total import time.
+
+    Examples
+    --------
+    >>> from numpy._import_tools import import_profile
+    >>> records = import_profile('numpy', file=sys.stdout)  # doctest: +SKIP
+    self [ms]  cumulative [ms]  module
+    ...
+
+    """
+    import subprocess
+
+    env = dict(os.environ)
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+    if lazy is not None:
+        env['NUMPY_LAZY_IMPORT'] = '1' if lazy else '0'
+    proc = subprocess.Popen([sys.executable, '-c', _PROFILE_SCRIPT % module],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            env=env)
+    out, err = proc.communicate()
+    if proc.returncode != 0:
+        raise ImportError("importing %s failed:\n%s"
+                          % (module, err.decode('utf-8', 'replace')))
+
+    records = []
+    for line in out.decode('utf-8').splitlines():
+        depth, name, self_time, total = line.split('\t')
+        records.append((int(depth), name, float(self_time), float(total)))
+
+    if file is not None:
+        file.write("%9s  %15s  module\n" % ('self [ms]', 'cumulative [ms]'))
+        for depth, name, self_time, total in records:
+            file.write("%9.2f  %15.2f  %s%s\n" % (
+                1e3 * self_time, 1e3 * total, '  ' * (depth - 1), name))
+    return records
+
+
+if __name__ == '__main__':
+    import_profile(sys.argv[1] if len(sys.argv) > 1 else 'numpy',
+                   file=sys.stdout)
@@ -0,0 +1,447 @@
+"""
+Vectorized operations on the raw buffer of fixed-width string arrays.
+
+The functions of `numpy.core.defchararray` call a Python string method for
+every element through `_vec_string`.  For the common operations on
+``string_`` and ``unicode_`` arrays, the functions here work on the
+character codes instead: the array is viewed as a 2-D array of ``uint8``
+or ``uint32`` codes, one row per element, and every operation is a few
+array operations on blocks of rows.  As in NumPy, the trailing NUL
+characters of an element are not part of the string.
+
+Every function returns None when its arguments are not supported, in
+which case the caller falls back to the string methods.  The results are
+the ones of the Python methods; case mapping and whitespace are those of
+the ASCII characters for ``string_`` arrays, and case mapping is only done
+here for ``unicode_`` arrays whose characters are all ASCII.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+import sys
+
+from numpy.core import numeric as nx
+from numpy.core.multiarray import bincount
+from numpy.core.numeric import (
+    arange, array, ascontiguousarray, empty, zeros, concatenate,
+    uint8, uint32, intp
+    )
+
+if sys.version_info[0] >= 3:
+    _unicode = str
+    _bytes = bytes
+    _unichr = chr
+else:
+    _unicode = unicode
+    _bytes = str
+    _unichr = unichr
+
+# Number of bytes of codes handled at a time, which bounds the size of the
+# temporaries.
+_BLOCK_BYTES = 2 ** 20
+
+# Sets of characters with fewer runs of consecutive codes are compared
+# run by run rather than looked up.
+_MAX_RUNS = 12
+
+_ASCII_SPACE = b' \t\n\r\x0b\x0c'
+_unicode_space = None
+
+
+def _space(codes):
+    # Codes of the whitespace characters of str.split and str.strip
+    global _unicode_space
+    if codes.dtype == uint8:
+        return array(bytearray(_ASCII_SPACE), dtype=uint8)
+    if _unicode_space is None:
+        _unicode_space = array(
+            [c for c in range(0x3001) if _unichr(c).isspace()], dtype=uint32)
+    return _unicode_space
+
+
+def _case_tables():
+    lower = arange(128, dtype=uint8)
+    upper = lower.copy()
+    upper[ord('a'):ord('z') + 1] -= 32
+    lower[ord('A'):ord('Z') + 1] += 32
+    swap = lower.copy()
+    swap[ord('a'):ord('z') + 1] -= 32
+    return {'lower': lower, 'upper': upper, 'swapcase': swap}
+
+_CASE = _case_tables()
+
+
+def _codes(a):
+    """
+    Character codes of the string array `a`, as an array of shape
+    ``(a.size, nchars)``, or None if `a` is not a non-empty ``string_`` or
+    native ``unicode_`` array.
+    """
+    if a.dtype.char == 'S':
+        unit = uint8
+    elif a.dtype.char == 'U' and a.dtype.isnative:
+        unit = uint32
+    else:
+        return None
+    nchars = a.itemsize // nx.dtype(unit).itemsize
+    if a.size == 0 or nchars == 0:
+        return None
+    a = ascontiguousarray(a).reshape(-1)
+    return a.view(unit).reshape(a.size, nchars)
+
+
+def _arg_codes(a, *args):
+    """
+    Codes of the string arguments, which must be of the type of the
+    elements of `a`, or None.
+    """
+    kind = _bytes if a.dtype.char == 'S' else _unicode
+    if not all(isinstance(arg, kind) for arg in args):
+        return None
+    if kind is _bytes:
+        return [array(bytearray(arg), dtype=uint8) for arg in args]
+    return [array([ord(c) for c in arg], dtype=uint32) for arg in args]
+
+
+def _blocks(codes):
+    # Slices of rows of `codes` handled at a time
+    step = max(1, _BLOCK_BYTES // codes[0].nbytes)
+    for start in range(0, len(codes), step):
+        yield slice(start, start + step)
+
+
+def _lengths(codes):
+    # Lengths of the strings, without the trailing NULs
+    return _last(codes != 0) + 1
+
+
+def _last(mask):
+    # Index of the last True of every row of `mask`, or -1
+    last = mask.shape[1] - 1 - mask[:, ::-1].argmax(1)
+    last[~mask[arange(len(mask)), last]] = -1
+    return last
+
+
+def _below(stops, width):
+    """
+    Mask of shape ``(len(stops), width)`` of the positions before `stops`
+    in every row.
+
+    The comparison runs along the rows, much faster than along the short
+    strings, and the mask is a transposed view.
+    """
+    return (arange(width)[:, None] < stops).T
+
+
+def _first(mask):
+    # Index of the first True of every row of `mask`, or its width
+    first = mask.argmax(1)
+    first[~mask[arange(len(mask)), first]] = mask.shape[1]
+    return first
+
+
+def _isin(codes, chars):
+    # Mask of the codes that are in `chars`, compared with the runs of
+    # consecutive codes when there are few, as for the whitespace
+    chars = nx.sort(chars)
+    if len(chars) == 0:
+        return zeros(codes.shape, dtype=bool)
+    breaks = (chars[1:] - chars[:-1] > 1).nonzero()[0] + 1
+    if len(breaks) < _MAX_RUNS:
+        low = chars[concatenate(([0], breaks))]
+        high = chars[concatenate((breaks - 1, [len(chars) - 1]))]
+        out = zeros(codes.shape, dtype=bool)
+        for lo, hi in zip(low, high):
+            # Unsigned wrap-around makes this lo <= code <= hi
+            out |= codes - codes.dtype.type(lo) <= hi - lo
+        return out
+    if codes.dtype == uint8:
+        table = zeros(256, dtype=bool)
+        table[chars] = True
+        return table.take(codes)
+    idx = chars.searchsorted(codes).clip(0, len(chars) - 1)
+    return chars.take(idx) == codes
+
+
+def _border_free(sub):
+    # Whether no proper prefix of `sub` is also a suffix, so that matches
+    # of `sub` never overlap
+    sub = sub.tolist()
+    return not any(sub[:k] == sub[-k:] for k in range(1, len(sub)))
+
+
+def _matches(codes, lengths, sub):
+    """
+    Mask of the positions where `sub` starts in each string, of shape
+    ``(len(codes), nchars - len(sub) + 1)``.
+    """
+    m = len(sub)
+    width = codes.shape[1] - m + 1
+    match = codes[:, :width] == sub[0]
+    for k in range(1, m):
+        match &= codes[:, k:k + width] == sub[k]
+    match &= _below(lengths - m + 1, width)
+    return match
+
+
+def _strings(codes, dtype, shape):
+    return codes.view(dtype).reshape(shape)
+
+
+def str_len(a):
+    codes = _codes(a)
+    if codes is None:
+        return None
+    out = empty(len(codes), dtype=nx.int_)
+    for rows in _blocks(codes):
+        out[rows] = _lengths(codes[rows])
+    return out.reshape(a.shape)
+
+
+def change_case(a, method):
+    """
+    `str.upper`, `lower`, `swapcase` and `capitalize` of the ASCII
+    characters.
+    """
+    codes = _codes(a)
+    if codes is None:
+        return None
+    # The case of other characters, bytes included, is left to the
+    # per-element methods
+    if codes.max() >= 128:
+        return None
+    out = empty(codes.shape, dtype=codes.dtype)
+    for rows in _blocks(codes):
+        block = codes[rows]
+        if method == 'capitalize':
+            out[rows] = _CASE['lower'].take(block)
+            out[rows, 0] = _CASE['upper'].take(block[:, 0])
+        else:
+            out[rows] = _CASE[method].take(block)
+    return _strings(out, a.dtype, a.shape)
+
+
+def strip(a, chars, left, right):
+    """
+    `str.strip`, `lstrip` or `rstrip`.
+    """
+    codes = _codes(a)
+    if codes is None:
+        return None
+    if chars is None:
+        chars = _space(codes)
+    else:
+        chars = _arg_codes(a, chars)
+        if chars is None:
+            return None
+        chars = chars[0]
+    nchars = codes.shape[1]
+    out = empty(codes.shape, dtype=codes.dtype)
+    for rows in _blocks(codes):
+        block = codes[rows]
+        stripped = _isin(block, chars)
+        if right:
+            # The trailing NULs go with the stripped characters
+            stop = _last(~(stripped | (block == 0))) + 1
+        else:
+            stop = _lengths(block)
+        result = out[rows]
+        if left:
+            start = _first(~stripped)
+            stop -= start
+            shifts = bincount(start).nonzero()[0]
+            if len(shifts) == 1:
+                shift = shifts[0]
+                result[:, :nchars - shift] = block[:, shift:]
+            else:
+                # Move the strings left, once for every distinct shift
+                for shift in shifts:
+                    moved = start == shift
+                    result[moved, :nchars - shift] = block[moved, shift:]
+        else:
+            result[...] = block
+        result *= _below(stop, nchars)
+    return _strings(out, a.dtype, a.shape)
+
+
+def startswith(a, prefix, suffix=False):
+    """
+    `str.startswith` or, with `suffix`, `str.endswith`, for the whole
+    strings.
+    """
+    codes = _codes(a)
+    args = None if codes is None else _arg_codes(a, prefix)
+    if args is None:
+        return None
+    sub = args[0]
+    m = len(sub)
+    out = empty(len(codes), dtype=bool)
+    for rows in _blocks(codes):
+        block = codes[rows]
+        lengths = _lengths(block)
+        if m == 0:
+            out[rows] = True
+        elif m > block.shape[1]:
+            out[rows] = False
+        elif not suffix:
+            out[rows] = (block[:, :m] == sub).all(1) & (lengths >= m)
+        else:
+            idx = (lengths - m).clip(0, None)[:, None] + arange(m)
+            tail = block[arange(len(block))[:, None], idx]
+            out[rows] = (tail == sub).all(1) & (lengths >= m)
+    return out.reshape(a.shape)
+
+
+def find(a, sub, reverse=False, count=False):
+    """
+    `str.find`, `rfind` or, with `count`, `str.count`, for the whole
+    strings.
+    """
+    codes = _codes(a)
+    args = None if codes is None else _arg_codes(a, sub)
+    if args is None:
+        return None
+    sub = args[0]
+    m = len(sub)
+    if count and m > 1 and not _border_free(sub):
+        return None
+    out = empty(len(codes), dtype=nx.int_)
+    for rows in _blocks(codes):
+        block = codes[rows]
+        lengths = _lengths(block)
+        if m == 0:
+            out[rows] = lengths + 1 if count else (lengths if reverse else 0)
+            continue
+        if m > block.shape[1]:
+            out[rows] = 0 if count else -1
+            continue
+        match = _matches(block, lengths, sub)
+        if count:
+            out[rows] = match.sum(1)
+        elif reverse:
+            last = match.shape[1] - 1 - match[:, ::-1].argmax(1)
+            out[rows] = nx.where(match.any(1), last, -1)
+        else:
+            out[rows] = nx.where(match.any(1), match.argmax(1), -1)
+    return out.reshape(a.shape)
+
+
+def replace(a, old, new):
+    """
+    `str.replace` of all the occurrences of `old`, as a new array of the
+    smallest width.
+    """
+    codes = _codes(a)
+    args = None if codes is None else _arg_codes(a, old, new)
+    if args is None:
+        return None
+    old, new = args
+    m = len(old)
+    if m == 0 or (len(new) and new[-1] == 0):
+        return None
+    nchars = codes.shape[1]
+    growth = len(new) - m
+    in_place = growth == 0 and _border_free(old)
+    pieces = []
+    for rows in _blocks(codes):
+        block = codes[rows]
+        lengths = _lengths(block)
+        if m > nchars:
+            pieces.append((block, lengths))
+            continue
+        match = _matches(block, lengths, old)
+        if in_place:
+            block = block.copy()
+            for k in range(m):
+                block[:, k:k + match.shape[1]][match] = new[k]
+            pieces.append((block, lengths))
+            continue
+
+        # The strings are copied segment by segment, the t-th segment
+        # after the t-th match moving by t * growth, taking the matches
+        # from left to right as `str.replace`.
+        out = zeros((len(block), nchars + max(growth, 0) * nchars // m),
+                    dtype=codes.dtype)
+        seg_start = zeros(len(block), dtype=intp)
+        nmatch = zeros(len(block), dtype=intp)
+        shift = 0
+        while True:
+            next_match = _first(match)
+            found = next_match < match.shape[1]
+            seg_stop = nx.where(found, next_match, nchars)
+            seg = _below(seg_stop, nchars) & ~_below(seg_start, nchars)
+            if shift >= 0:
+                nx.copyto(out[:, shift:shift + nchars], block, where=seg)
+            else:
+                nx.copyto(out[:, :nchars + shift], block[:, -shift:],
+                          where=seg[:, -shift:])
+            if not found.any():
+                break
+            moved = found.nonzero()[0]
+            at = next_match[moved] + shift
+            for k in range(len(new)):
+                out[moved, at + k] = new[k]
+            nmatch += found
+            seg_start = nx.where(found, next_match + m, nchars)
+            match &= ~_below(seg_start, match.shape[1])
+            shift += growth
+        lengths += nmatch * growth
+        pieces.append((out, lengths))
+    width = max(1, max(lengths.max() for block, lengths in pieces))
+    out = zeros((len(codes), width), dtype=codes.dtype)
+    for rows, (block, lengths) in zip(_blocks(codes), pieces):
+        out[rows, :min(width, block.shape[1])] = block[:, :width]
+    dtype = nx.dtype((a.dtype.type, width))
+    return _strings(out, dtype, a.shape)
+
+
+def split_offsets(a, sep):
+    """
+    Offsets of the tokens of `str.split`, see `defchararray.split_offsets`.
+    """
+    codes = _codes(a)
+    if codes is None:
+        return None
+    if sep is not None:
+        args = _arg_codes(a, sep)
+        if args is None or len(args[0]) == 0 or not _border_free(args[0]):
+            return None
+        sep = args[0]
+    else:
+        space = _space(codes)
+    nchars = codes.shape[1]
+    counts, starts, stops = [], [], []
+    for rows in _blocks(codes):
+        block = codes[rows]
+        lengths = _lengths(block)
+        if sep is None:
+            word = ~_isin(block, space) & _below(lengths, nchars)
+            before = zeros(block.shape, dtype=bool)
+            before[:, 1:] = word[:, :-1]
+            after = zeros(block.shape, dtype=bool)
+            after[:, :-1] = word[:, 1:]
+            row, start = (word & ~before).nonzero()
+            stop = (word & ~after).nonzero()[1] + 1
+            count = bincount(row, minlength=len(block))
+        else:
+            m = len(sep)
+            if m <= nchars:
+                row, pos = _matches(block, lengths, sep).nonzero()
+            else:
+                row = pos = zeros(0, dtype=intp)
+            count = bincount(row, minlength=len(block)) + 1
+            first = count.cumsum() - count
+            start = empty(count.sum(), dtype=intp)
+            stop = empty(count.sum(), dtype=intp)
+            rank = arange(len(row)) + row
+            start[first] = 0
+            start[rank + 1] = pos + m
+            stop[rank] = pos
+            stop[first + count - 1] = lengths
+        counts.append(count)
+        starts.append(start)
+        stops.append(stop)
+    indptr = zeros(len(codes) + 1, dtype=intp)
+    concatenate(counts).cumsum(out=indptr[1:])
+    return (indptr, concatenate(starts).astype(intp),
+            concatenate(stops).astype(intp))
@@ -5,9 +5,9 @@ $Id: arrayprint.py,v 1.9 2005/09/13 13:58:44 teoliphant Exp $
 """
 from __future__ import division, absolute_import, print_function
 
-__all__ = ["array2string", "array_str", "array_repr", "set_string_function",
-           "set_printoptions", "get_printoptions", "format_float_positional",
-           "format_float_scientific"]
+__all__ = ["array2string", "array2file", "array_str", "array_repr",
+           "set_string_function", "set_printoptions", "get_printoptions",
+           "format_float_positional", "format_float_scientific"]
 __docformat__ = 'restructuredtext'
 
 #
@@ -38,6 +38,7 @@ else:
         from dummy_thread import get_ident
 
 import numpy as np
+from numpy.compat import basestring, is_pathlib_path
 from . import numerictypes as _nt
 from .umath import absolute, not_equal, isnan, isinf, isfinite, isnat
 from . import multiarray
@@ -403,6 +404,35 @@ def _get_format_function(data, **options):
         return formatdict['numpystr']()
 
 
+# formatters for the corners of summarized arrays, so that repeatedly printing
+# the same large array does not redo the first formatting pass each time
+_format_function_cache = {}
+_format_function_cache_size = 64
+
+def _get_cached_format_function(data, **options):
+    """
+    Like `_get_format_function`, but reuse the formatter built for identical
+    data and options.
+
+    Only numeric, boolean and datetime data with the default formatters is
+    cached, as those formatters depend on nothing but the values.
+    """
+    if options['formatter'] is not None or data.dtype.kind not in 'biufcmM':
+        return _get_format_function(data, **options)
+
+    key = (data.dtype.str, data.shape, data.tobytes(),
+           tuple(sorted(options.items())))
+    try:
+        return _format_function_cache[key]
+    except KeyError:
+        pass
+    format_function = _get_format_function(data, **options)
+    if len(_format_function_cache) >= _format_function_cache_size:
+        _format_function_cache.clear()
+    _format_function_cache[key] = format_function
+    return format_function
+
+
 def _recursive_guard(fillvalue='...'):
     """
     Like the python 3.2 reprlib.recursive_repr, but forwards *args and **kwargs
@@ -438,18 +468,7 @@ def _array2string(a, options, separator=' ', prefix=""):
     # The formatter __init__s in _get_format_function cannot deal with
     # subclasses yet, and we also need to avoid recursion issues in
     # _formatArray with subclasses which return 0d arrays in place of scalars
-    data = asarray(a)
-    if a.shape == ():
-        a = data
-
-    if a.size > options['threshold']:
-        summary_insert = "..."
-        data = _leading_trailing(data, options['edgeitems'])
-    else:
-        summary_insert = ""
-
-    # find the right formatting function for the array
-    format_function = _get_format_function(data, **options)
+    a, format_function, summary_insert = _setup_format(a, options)
 
     # skip over "["
     next_line_prefix = " "
@@ -462,6 +481,30 @@ def _array2string(a, options, separator=' ', prefix=""):
     return lst
 
 
+def _setup_format(a, options):
+    """
+    Find the array to recurse over, its formatting function and the summary
+    marker.
+
+    Only the elements that will be printed are inspected: the formatting
+    function of a summarized array is built from its corners alone.
+    """
+    data = asarray(a)
+    if a.shape == ():
+        a = data
+
+    if a.size > options['threshold']:
+        summary_insert = "..."
+        data = _leading_trailing(data, options['edgeitems'])
+        format_function = _get_cached_format_function(data, **options)
+    else:
+        summary_insert = ""
+        # find the right formatting function for the array
+        format_function = _get_format_function(data, **options)
+
+    return a, format_function, summary_insert
+
+
 def array2string(a, max_line_width=None, precision=None,
                  suppress_small=None, separator=' ', prefix="",
                  style=np._NoValue, formatter=None, threshold=None,
@@ -633,6 +676,106 @@ def array2string(a, max_line_width=None, precision=None,
     return _array2string(a, options, separator, prefix)
 
 
+def array2file(a, file, max_line_width=None, precision=None,
+               suppress_small=None, separator=' ', prefix="", formatter=None,
+               sign=None, floatmode=None, suffix="", **kwarg):
+    """
+    Write the full string representation of an array to a file.
+
+    The output is the same as that of `array2string` with a `threshold`
+    large enough to never summarize, but it is written out a piece at a time
+    rather than built as a single string, so that very large arrays (for
+    instance memory-mapped ones) can be dumped with little memory.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    a : array_like
+        Input array.
+    file : file, str, or pathlib.Path
+        An open file object, or the name of the file to write to. The file
+        is opened in text mode and truncated if it is a name.
+    max_line_width, precision, suppress_small, separator, prefix, formatter,
+    sign, floatmode, suffix, legacy
+        See `array2string`.
+
+    Raises
+    ------
+    TypeError
+        if a callable in `formatter` does not return a string.
+
+    See Also
+    --------
+    array2string, ndarray.tofile
+
+    Notes
+    -----
+    Like `array2string`, neither `prefix` nor `suffix` is written; they
+    only affect the line wrapping. No newline is added at the end.
+
+    Examples
+    --------
+    >>> import sys
+    >>> np.array2file(np.arange(4), sys.stdout, separator=',')
+    [0,1,2,3]
+
+    """
+    legacy = kwarg.pop('legacy', None)
+    if kwarg:
+        msg = "array2file() got unexpected keyword argument '{}'"
+        raise TypeError(msg.format(kwarg.popitem()[0]))
+
+    overrides = _make_options_dict(precision, None, None, max_line_width,
+                                   suppress_small, None, None, sign,
+                                   formatter, floatmode, legacy)
+    options = _format_options.copy()
+    options.update(overrides)
+    options['threshold'] = sys.maxsize
+
+    if options['legacy'] != '1.13':
+        options['linewidth'] -= len(suffix)
+
+    a = np.asanyarray(a)
+    if options['legacy'] == '1.13' and a.shape == () and not a.dtype.names:
+        pieces = [repr(a.item())]
+    elif a.size == 0:
+        # treat as a null array if any of shape elements == 0
+        pieces = ["[]"]
+    else:
+        a, format_function, summary_insert = _setup_format(a, options)
+        pieces = _iterFormatArray(a, format_function, options['linewidth'],
+                                  " " + " "*len(prefix), separator,
+                                  options['edgeitems'], summary_insert,
+                                  options['legacy'])
+
+    own_fid = False
+    if isinstance(file, basestring):
+        fid = open(file, "w")
+        own_fid = True
+    elif is_pathlib_path(file):
+        fid = file.open("w")
+        own_fid = True
+    else:
+        fid = file
+
+    try:
+        # collect the pieces into blocks of about 64kB before writing
+        block = []
+        size = 0
+        for piece in pieces:
+            block.append(piece)
+            size += len(piece)
+            if size >= 65536:
+                fid.write(''.join(block))
+                block = []
+                size = 0
+        fid.write(''.join(block))
+    finally:
+        if own_fid:
+            fid.close()
+
+
 def _extendLine(s, line, word, line_width, next_line_prefix, legacy):
     needs_wrap = len(line) + len(word) > line_width
     if legacy != '1.13':
@@ -655,6 +798,16 @@ def _formatArray(a, format_function, line_width, next_line_prefix,
 
     2. Summarized output
 
+    """
+    return ''.join(_iterFormatArray(a, format_function, line_width,
+                                    next_line_prefix, separator, edge_items,
+                                    summary_insert, legacy))
+
+def _iterFormatArray(a, format_function, line_width, next_line_prefix,
+                     separator, edge_items, summary_insert, legacy):
+    """
+    Generate the output of `_formatArray` piece by piece, so that it can be
+    written out without building the whole string.
     """
     def recurser(index, hanging_indent, curr_width):
         """
@@ -666,7 +819,25 @@ def _formatArray(a, format_function, line_width, next_line_prefix,
         axes_left = a.ndim - axis
 
         if axes_left == 0:
-            return format_function(a[index])
+            yield format_function(a[index])
+            return
+
+        # remove the hanging indent of the first line, and wrap in []
+        yield '['
+        strip = len(hanging_indent)
+        for piece in body(index, hanging_indent, curr_width):
+            if strip:
+                n = min(strip, len(piece))
+                piece = piece[n:]
+                strip -= n
+            if piece:
+                yield piece
+        yield ']'
+
+    def body(index, hanging_indent, curr_width):
+        # stringify the array with the hanging indent on the first line too
+        axis = len(index)
+        axes_left = a.ndim - axis
 
         # when recursing, add a space to align with the [ added, and reduce the
         # length of the line by 1
@@ -685,9 +856,6 @@ def _formatArray(a, format_function, line_width, next_line_prefix,
             leading_items = 0
             trailing_items = a_len
 
-        # stringify the array with the hanging indent on the first line too
-        s = ''
-
         # last axis (rows) - wrap elements if they would not fit on one line
         if axes_left == 1:
             # the length up until the beginning of the separator / bracket
@@ -696,74 +864,86 @@ def _formatArray(a, format_function, line_width, next_line_prefix,
             else:
                 elem_width = curr_width - max(len(separator.rstrip()), len(']'))
 
+            # the completed lines are yielded as soon as a line wraps
             line = hanging_indent
             for i in range(leading_items):
-                word = recurser(index + (i,), next_hanging_indent, next_width)
+                word = format_function(a[index + (i,)])
                 s, line = _extendLine(
-                    s, line, word, elem_width, hanging_indent, legacy)
+                    '', line, word, elem_width, hanging_indent, legacy)
+                if s:
+                    yield s
                 line += separator
 
             if show_summary:
                 s, line = _extendLine(
-                    s, line, summary_insert, elem_width, hanging_indent, legacy)
+                    '', line, summary_insert, elem_width, hanging_indent, legacy)
+                if s:
+                    yield s
                 if legacy == '1.13':
                     line += ", "
                 else:
                     line += separator
 
             for i in range(trailing_items, 1, -1):
-                word = recurser(index + (-i,), next_hanging_indent, next_width)
+                word = format_function(a[index + (-i,)])
                 s, line = _extendLine(
-                    s, line, word, elem_width, hanging_indent, legacy)
+                    '', line, word, elem_width, hanging_indent, legacy)
+                if s:
+                    yield s
                 line += separator
 
             if legacy == '1.13':
                 # width of the seperator is not considered on 1.13
                 elem_width = curr_width
-            word = recurser(index + (-1,), next_hanging_indent, next_width)
+            word = format_function(a[index + (-1,)])
             s, line = _extendLine(
-                s, line, word, elem_width, hanging_indent, legacy)
+                '', line, word, elem_width, hanging_indent, legacy)
+            if s:
+                yield s
 
-            s += line
+            yield line
 
         # other axes - insert newlines between rows
         else:
-            s = ''
             line_sep = separator.rstrip() + '\n'*(axes_left - 1)
 
             for i in range(leading_items):
-                nested = recurser(index + (i,), next_hanging_indent, next_width)
-                s += hanging_indent + nested + line_sep
+                yield hanging_indent
+                for piece in recurser(index + (i,), next_hanging_indent,
+                                      next_width):
+                    yield piece
+                yield line_sep
 
             if show_summary:
                 if legacy == '1.13':
                     # trailing space, fixed nbr of newlines, and fixed separator
-                    s += hanging_indent + summary_insert + ", \n"
+                    yield hanging_indent + summary_insert + ", \n"
                 else:
-                    s += hanging_indent + summary_insert + line_sep
+                    yield hanging_indent + summary_insert + line_sep
 
             for i in range(trailing_items, 1, -1):
-                nested = recurser(index + (-i,), next_hanging_indent,
-                                  next_width)
-                s += hanging_indent + nested + line_sep
-
-            nested = recurser(index + (-1,), next_hanging_indent, next_width)
-            s += hanging_indent + nested
+                yield hanging_indent
+                for piece in recurser(index + (-i,), next_hanging_indent,
+                                      next_width):
+                    yield piece
+                yield line_sep
 
-        # remove the hanging indent, and wrap in []
-        s = '[' + s[len(hanging_indent):] + ']'
-        return s
+            yield hanging_indent
+            for piece in recurser(index + (-1,), next_hanging_indent,
+                                  next_width):
+                yield piece
 
     try:
         # invoke the recursive part with an initial index and prefix
-        return recurser(index=(),
-                        hanging_indent=next_line_prefix,
-                        curr_width=line_width)
+        for piece in recurser(index=(),
+                              hanging_indent=next_line_prefix,
+                              curr_width=line_width):
+            yield piece
     finally:
         # recursive closures have a cyclic reference to themselves, which
         # requires gc to collect (gh-10620). To avoid this problem, for
         # performance and PyPy friendliness, we break the cycle:
-        recurser = None
+        recurser = body = None
 
 def _none_or_positive_arg(x, name):
     if x is None:
@@ -826,22 +1006,28 @@ class FloatingFormat(object):
             trim, unique = '.', True
             if self.floatmode == 'fixed' or self._legacy == '1.13':
                 trim, unique = 'k', False
-            strs = (dragon4_scientific(x, precision=self.precision,
+            # keep only the running maxima of the part lengths, rather than
+            # holding on to the strings of all the elements
+            int_len = frac_len = exp_len = 0
+            for x in finite_vals:
+                s = dragon4_scientific(x, precision=self.precision,
                                unique=unique, trim=trim, sign=self.sign == '+')
-                    for x in finite_vals)
-            frac_strs, _, exp_strs = zip(*(s.partition('e') for s in strs))
-            int_part, frac_part = zip(*(s.split('.') for s in frac_strs))
-            self.exp_size = max(len(s) for s in exp_strs) - 1
+                mant, _, exp = s.partition('e')
+                int_part, _, frac_part = mant.partition('.')
+                int_len = max(int_len, len(int_part))
+                frac_len = max(frac_len, len(frac_part))
+                exp_len = max(exp_len, len(exp))
+            self.exp_size = exp_len - 1
 
             self.trim = 'k'
-            self.precision = max(len(s) for s in frac_part)
+            self.precision = frac_len
 
             # for back-compat with np 1.13, use 2 spaces & sign and full prec
             if self._legacy == '1.13':
                 self.pad_left = 3
             else:
                 # this should be only 1 or 2. Can be calculated from sign.
-                self.pad_left = max(len(s) for s in int_part)
+                self.pad_left = int_len
             # pad_right is only needed for nan length calculation
             self.pad_right = self.exp_size + 2 + self.precision
 
@@ -851,17 +1037,22 @@ class FloatingFormat(object):
             trim, unique = '.', True
             if self.floatmode == 'fixed':
                 trim, unique = 'k', False
-            strs = (dragon4_positional(x, precision=self.precision,
+            int_len = frac_len = 0
+            for x in finite_vals:
+                s = dragon4_positional(x, precision=self.precision,
                                        fractional=True,
                                        unique=unique, trim=trim,
                                        sign=self.sign == '+')
-                    for x in finite_vals)
-            int_part, frac_part = zip(*(s.split('.') for s in strs))
+                int_part, _, frac_part = s.partition('.')
+                if self._legacy == '1.13':
+                    int_part = int_part.lstrip('-+')
+                int_len = max(int_len, len(int_part))
+                frac_len = max(frac_len, len(frac_part))
             if self._legacy == '1.13':
-                self.pad_left = 1 + max(len(s.lstrip('-+')) for s in int_part)
+                self.pad_left = 1 + int_len
             else:
-                self.pad_left = max(len(s) for s in int_part)
-            self.pad_right = max(len(s) for s in frac_part)
+                self.pad_left = int_len
+            self.pad_right = frac_len
             self.exp_size = -1
 
             if self.floatmode in ['fixed', 'maxprec_equal']:
@@ -22,6 +22,7 @@ from .numerictypes import string_, unicode_, integer, object_, bool_, character
 from .numeric import ndarray, compare_chararrays
 from .numeric import array as narray
 from numpy.core.multiarray import _vec_string
+from numpy.core import _charbuffer
 from numpy.compat import asbytes, long
 import numpy
 
@@ -34,7 +35,7 @@ __all__ = [
     'replace', 'rfind', 'rindex', 'rjust', 'rpartition', 'rsplit',
     'rstrip', 'split', 'splitlines', 'startswith', 'strip', 'swapcase',
     'title', 'translate', 'upper', 'zfill', 'isnumeric', 'isdecimal',
-    'array', 'asarray'
+    'array', 'asarray', 'split_offsets'
     ]
 
 
@@ -84,6 +85,13 @@ def _clean_args(*args):
         newargs.append(chk)
     return newargs
 
+def _whole_string(start, end):
+    """
+    Helper function that tells whether the optional `start` and `end`
+    arguments of a search cover the whole strings.
+    """
+    return end is None and numpy.ndim(start) == 0 and start == 0
+
 def _get_num_chars(a):
     """
     Helper function that returns the number of characters per field in
@@ -257,6 +265,10 @@ def str_len(a):
     --------
     __builtin__.len
     """
+    a = numpy.asarray(a)
+    out = _charbuffer.str_len(a)
+    if out is not None:
+        return out
     return _vec_string(a, integer, '__len__')
 
 def add(x1, x2):
@@ -374,6 +386,9 @@ def capitalize(a):
 
     """
     a_arr = numpy.asarray(a)
+    out = _charbuffer.change_case(a_arr, 'capitalize')
+    if out is not None:
+        return out
     return _vec_string(a_arr, a_arr.dtype, 'capitalize')
 
 
@@ -456,6 +471,11 @@ def count(a, sub, start=0, end=None):
     array([1, 0, 0])
 
     """
+    a = numpy.asarray(a)
+    if _whole_string(start, end):
+        out = _charbuffer.find(a, sub, count=True)
+        if out is not None:
+            return out
     return _vec_string(a, integer, 'count', [sub, start] + _clean_args(end))
 
 
@@ -580,6 +600,11 @@ def endswith(a, suffix, start=0, end=None):
     array([False,  True])
 
     """
+    a = numpy.asarray(a)
+    if _whole_string(start, end):
+        out = _charbuffer.startswith(a, suffix, suffix=True)
+        if out is not None:
+            return out
     return _vec_string(
         a, bool_, 'endswith', [suffix, start] + _clean_args(end))
 
@@ -650,6 +675,11 @@ def find(a, sub, start=0, end=None):
     str.find
 
     """
+    a = numpy.asarray(a)
+    if _whole_string(start, end):
+        out = _charbuffer.find(a, sub)
+        if out is not None:
+            return out
     return _vec_string(
         a, integer, 'find', [sub, start] + _clean_args(end))
 
@@ -678,6 +708,13 @@ def index(a, sub, start=0, end=None):
     find, str.find
 
     """
+    a = numpy.asarray(a)
+    if _whole_string(start, end):
+        out = _charbuffer.find(a, sub)
+        if out is not None:
+            if (out < 0).any():
+                raise ValueError("substring not found")
+            return out
     return _vec_string(
         a, integer, 'index', [sub, start] + _clean_args(end))
 
@@ -945,6 +982,9 @@ def lower(a):
 
     """
     a_arr = numpy.asarray(a)
+    out = _charbuffer.change_case(a_arr, 'lower')
+    if out is not None:
+        return out
     return _vec_string(a_arr, a_arr.dtype, 'lower')
 
 
@@ -1002,6 +1042,9 @@ def lstrip(a, chars=None):
 
     """
     a_arr = numpy.asarray(a)
+    out = _charbuffer.strip(a_arr, chars, True, False)
+    if out is not None:
+        return out
     return _vec_string(a_arr, a_arr.dtype, 'lstrip', (chars,))
 
 
@@ -1067,6 +1110,11 @@ def replace(a, old, new, count=None):
     str.replace
 
     """
+    a = numpy.asarray(a)
+    if count is None:
+        out = _charbuffer.replace(a, old, new)
+        if out is not None:
+            return out
     return _to_string_or_unicode_array(
         _vec_string(
             a, object_, 'replace', [old, new] + _clean_args(count)))
@@ -1100,6 +1148,11 @@ def rfind(a, sub, start=0, end=None):
     str.rfind
 
     """
+    a = numpy.asarray(a)
+    if _whole_string(start, end):
+        out = _charbuffer.find(a, sub, reverse=True)
+        if out is not None:
+            return out
     return _vec_string(
         a, integer, 'rfind', [sub, start] + _clean_args(end))
 
@@ -1129,6 +1182,13 @@ def rindex(a, sub, start=0, end=None):
     rfind, str.rindex
 
     """
+    a = numpy.asarray(a)
+    if _whole_string(start, end):
+        out = _charbuffer.find(a, sub, reverse=True)
+        if out is not None:
+            if (out < 0).any():
+                raise ValueError("substring not found")
+            return out
     return _vec_string(
         a, integer, 'rindex', [sub, start] + _clean_args(end))
 
@@ -1281,6 +1341,9 @@ def rstrip(a, chars=None):
 
     """
     a_arr = numpy.asarray(a)
+    out = _charbuffer.strip(a_arr, chars, False, True)
+    if out is not None:
+        return out
     return _vec_string(a_arr, a_arr.dtype, 'rstrip', (chars,))
 
 
@@ -1318,6 +1381,71 @@ def split(a, sep=None, maxsplit=None):
         a, object_, 'split', [sep] + _clean_args(maxsplit))
 
 
+def split_offsets(a, sep=None):
+    """
+    For each element in `a`, return the positions of the words of
+    `str.split`, as offsets rather than as lists of strings.
+
+    This is a bulk form of `split` for large arrays: no string objects
+    are created, and for ``string_`` and ``unicode_`` arrays the words are
+    found by vectorized operations on the characters.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    a : array_like of str or unicode
+
+    sep : str or unicode, optional
+       If `sep` is not specified or `None`, any whitespace string is a
+       separator.
+
+    Returns
+    -------
+    indptr : ndarray of intp
+        Array of length ``a.size + 1``.  The words of the element
+        ``a.flat[i]`` are the words ``indptr[i]`` to ``indptr[i + 1] - 1``.
+    start, stop : ndarray of intp
+        Position of the first character of every word, and of the first
+        character after it, in its element.
+
+    See also
+    --------
+    split, str.split
+
+    Examples
+    --------
+    >>> a = np.array(['to be', ' or not  to'])
+    >>> indptr, start, stop = np.char.split_offsets(a)
+    >>> indptr
+    array([0, 2, 5])
+    >>> [a[1][i:j] for i, j in zip(start[2:5], stop[2:5])]
+    ['or', 'not', 'to']
+
+    """
+    a = numpy.asarray(a)
+    out = _charbuffer.split_offsets(a, sep)
+    if out is not None:
+        return out
+    counts, start, stop = [], [], []
+    for item in a.flat:
+        words = item.split(sep)
+        pos = 0
+        for word in words:
+            if sep is None:
+                pos = item.find(word, pos)
+            start.append(pos)
+            pos += _len(word)
+            stop.append(pos)
+            if sep is not None:
+                pos += _len(sep)
+        counts.append(_len(words))
+    indptr = numpy.zeros(_len(counts) + 1, dtype=numpy.intp)
+    numpy.cumsum(counts, out=indptr[1:])
+    return (indptr, numpy.array(start, dtype=numpy.intp),
+            numpy.array(stop, dtype=numpy.intp))
+
+
 def splitlines(a, keepends=None):
     """
     For each element in `a`, return a list of the lines in the
@@ -1374,6 +1502,11 @@ def startswith(a, prefix, start=0, end=None):
     str.startswith
 
     """
+    a = numpy.asarray(a)
+    if _whole_string(start, end):
+        out = _charbuffer.startswith(a, prefix)
+        if out is not None:
+            return out
     return _vec_string(
         a, bool_, 'startswith', [prefix, start] + _clean_args(end))
 
@@ -1423,6 +1556,9 @@ def strip(a, chars=None):
 
     """
     a_arr = numpy.asarray(a)
+    out = _charbuffer.strip(a_arr, chars, True, True)
+    if out is not None:
+        return out
     return _vec_string(a_arr, a_arr.dtype, 'strip', _clean_args(chars))
 
 
@@ -1460,6 +1596,9 @@ def swapcase(a):
 
     """
     a_arr = numpy.asarray(a)
+    out = _charbuffer.change_case(a_arr, 'swapcase')
+    if out is not None:
+        return out
     return _vec_string(a_arr, a_arr.dtype, 'swapcase')
 
 
@@ -1571,6 +1710,9 @@ def upper(a):
 
     """
     a_arr = numpy.asarray(a)
+    out = _charbuffer.change_case(a_arr, 'upper')
+    if out is not None:
+        return out
     return _vec_string(a_arr, a_arr.dtype, 'upper')
 
 
@@ -870,7 +870,36 @@ def _mode_from_name(mode):
     return mode
 
 
-def correlate(a, v, mode='valid'):
+# Below this many multiply-adds the direct method always wins, and 'auto'
+# does not bother to consult the cost model in numpy.fft.
+_DIRECT_CONV_MAX_WORK = 2 ** 14
+
+
+def _conv_method(a, v, mode, method):
+    # Resolve the `method` argument of convolve and correlate.
+    if method not in ('auto', 'direct', 'fft', 'overlap-add'):
+        raise ValueError("method must be one of 'auto', 'direct', 'fft' or "
+                         "'overlap-add', got %r" % (method,))
+    if method == 'direct':
+        return method
+    a, v = asarray(a), asarray(v)
+    # Only floating point results are rounded like the transforms, integer
+    # and object results stay exact.
+    if result_type(a, v).kind not in 'fc':
+        return 'direct'
+    if method != 'auto':
+        return method
+    if a.ndim != 1 or v.ndim != 1 or a.size * v.size <= _DIRECT_CONV_MAX_WORK:
+        return 'direct'
+    # A transform smears nan and inf over the whole output, keep them local.
+    if (a.dtype.kind in 'fc' and not isfinite(a).all() or
+            v.dtype.kind in 'fc' and not isfinite(v).all()):
+        return 'direct'
+    from numpy.fft.convolution import choose_conv_method
+    return choose_conv_method(a, v, mode)
+
+
+def correlate(a, v, mode='valid', method='direct'):
     """
     Cross-correlation of two 1-dimensional sequences.
 
@@ -889,6 +918,10 @@ def correlate(a, v, mode='valid'):
     mode : {'valid', 'same', 'full'}, optional
         Refer to the `convolve` docstring.  Note that the default
         is 'valid', unlike `convolve`, which uses 'full'.
+    method : {'auto', 'direct', 'fft', 'overlap-add'}, optional
+        Refer to the `convolve` docstring.
+
+        .. versionadded:: 1.15.0
     old_behavior : bool
         `old_behavior` was removed in NumPy 1.10. If you need the old
         behavior, use `multiarray.correlate`.
@@ -934,11 +967,14 @@ def correlate(a, v, mode='valid'):
     array([ 0.0+0.j ,  3.0+1.j ,  1.5+1.5j,  1.0+0.j ,  0.5+0.5j])
 
     """
+    if _conv_method(a, v, mode, method) != 'direct':
+        from numpy.fft.convolution import _convolve
+        return _convolve(a, v, mode, method, conj_reverse=True)
     mode = _mode_from_name(mode)
     return multiarray.correlate2(a, v, mode)
 
 
-def convolve(a, v, mode='full'):
+def convolve(a, v, mode='full', method='direct'):
     """
     Returns the discrete, linear convolution of two one-dimensional sequences.
 
@@ -972,6 +1008,29 @@ def convolve(a, v, mode='full'):
           ``max(M, N) - min(M, N) + 1``.  The convolution product is only given
           for points where the signals overlap completely.  Values outside
           the signal boundary have no effect.
+    method : {'auto', 'direct', 'fft', 'overlap-add'}, optional
+        'direct':
+          By default, evaluate the sum in the definition directly, in
+          O(N*M).
+
+        'fft':
+          Multiply the transforms of both sequences, see
+          `numpy.fft.fftconvolve`.
+
+        'overlap-add':
+          Convolve blocks of the longer sequence through FFTs and add the
+          overlapping parts, see `numpy.fft.oaconvolve`.  This is the
+          fastest method when one sequence is much longer than the other.
+
+        'auto':
+          Choose the method from the cost model of
+          `numpy.fft.choose_conv_method`.  Inputs that hold nan or inf
+          use 'direct'.
+
+        Inputs that are not floating point or complex always use 'direct',
+        so that integer and object results stay exact.
+
+        .. versionadded:: 1.15.0
 
     Returns
     -------
@@ -980,8 +1039,9 @@ def convolve(a, v, mode='full'):
 
     See Also
     --------
-    scipy.signal.fftconvolve : Convolve two arrays using the Fast Fourier
-                               Transform.
+    numpy.fft.fftconvolve : Convolve two arrays using the Fast Fourier
+                            Transform.
+    numpy.fft.StreamingConvolver : Convolve a signal that arrives in chunks.
     scipy.linalg.toeplitz : Used to construct the convolution operator.
     polymul : Polynomial multiplication. Same output as convolve, but also
               accepts poly1d objects as input.
@@ -996,8 +1056,9 @@ def convolve(a, v, mode='full'):
     is equivalent to the multiplication :math:`X(f) Y(f)` in the Fourier
     domain, after appropriate padding (padding is necessary to prevent
     circular convolution).  Since multiplication is more efficient (faster)
-    than convolution, the function `scipy.signal.fftconvolve` exploits the
-    FFT to calculate the convolution of large data-sets.
+    than convolution, the 'fft' and 'overlap-add' methods exploit the FFT to
+    calculate the convolution of large data-sets.  Their results agree with
+    the direct method up to floating point round-off.
 
     References
     ----------
@@ -1032,6 +1093,9 @@ def convolve(a, v, mode='full'):
         raise ValueError('a cannot be empty')
     if len(v) == 0:
         raise ValueError('v cannot be empty')
+    if _conv_method(a, v, mode, method) != 'direct':
+        from numpy.fft.convolution import _convolve
+        return _convolve(a, v, mode, method)
     mode = _mode_from_name(mode)
     return multiarray.correlate(a, v[::-1], mode)
 
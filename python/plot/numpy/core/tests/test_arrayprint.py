@@ -2,6 +2,9 @@
 from __future__ import division, absolute_import, print_function
 
 import sys, gc
+import os
+import shutil
+from tempfile import mkdtemp
 
 import numpy as np
 from numpy.testing import (
@@ -9,6 +12,11 @@ from numpy.testing import (
 )
 import textwrap
 
+if sys.version_info[0] >= 3:
+    from io import StringIO
+else:
+    from StringIO import StringIO
+
 class TestArrayRepr(object):
     def test_nan_inf(self):
         x = np.array([np.nan, np.inf])
@@ -401,6 +409,70 @@ class TestArray2String(object):
         gc.enable()
         assert_(r1 == r2)
 
+    def test_summarized_cache(self):
+        a = np.arange(2000.)
+        r1 = np.array2string(a)
+        a[1000] = 1e10
+        # the middle is not printed, and does not affect the format
+        assert_equal(np.array2string(a), r1)
+        a[0] = 1e10
+        assert_(np.array2string(a) != r1)
+        assert_equal(np.array2string(a, precision=3),
+                     np.array2string(a.copy(), precision=3))
+
+
+class TestArray2File(object):
+    arrays = [
+        np.arange(3000),
+        np.linspace(0, 1, 1200).reshape(40, 30),
+        np.arange(5*6*7).reshape(5, 6, 7) * 1e9,
+        np.array([np.nan, np.inf, -np.inf, 1.5] * 300),
+        np.arange(1500).view(np.complex128),
+        np.arange(1001) % 3 == 0,
+        np.arange(1100).astype('M8[D]'),
+        np.array(['abc', 'de'] * 600),
+        np.array(3.5),
+        np.zeros((0, 3)),
+    ]
+
+    def _file(self, a, **kw):
+        f = StringIO()
+        np.array2file(a, f, **kw)
+        return f.getvalue()
+
+    def test_matches_array2string(self):
+        for a in self.arrays:
+            for kw in [{}, dict(separator=', ', prefix='array('),
+                       dict(max_line_width=20), dict(legacy='1.13')]:
+                assert_equal(self._file(a, **kw),
+                             np.array2string(a, threshold=sys.maxsize, **kw))
+
+    def test_printoptions(self):
+        a = np.linspace(0, 1, 2000)
+        opts = np.get_printoptions()
+        np.set_printoptions(precision=3, threshold=10)
+        try:
+            assert_equal(self._file(a), np.array2string(a, threshold=4000))
+        finally:
+            np.set_printoptions(**opts)
+
+    def test_filename(self):
+        d = mkdtemp()
+        try:
+            fn = os.path.join(d, 'a.txt')
+            a = np.arange(20000).reshape(200, 100)
+            np.array2file(a, fn)
+            with open(fn) as f:
+                assert_equal(f.read(),
+                             np.array2string(a, threshold=sys.maxsize))
+        finally:
+            shutil.rmtree(d)
+
+    def test_bad_args(self):
+        assert_raises(TypeError, np.array2file, np.arange(3), StringIO(),
+                      threshold=5)
+
+
 class TestPrintOptions(object):
     """Test getting and setting global print options."""
 
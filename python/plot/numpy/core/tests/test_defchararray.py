@@ -3,6 +3,7 @@ from __future__ import division, absolute_import, print_function
 import sys
 
 import numpy as np
+from numpy.core import _charbuffer
 from numpy.core.multiarray import _vec_string
 from numpy.testing import (
     run_module_suite, assert_, assert_equal, assert_array_equal, assert_raises,
@@ -694,6 +695,96 @@ class TestOperations(object):
         assert_(arr[0, 0] == b'abc')
 
 
+class TestStringBuffer(object):
+    # The operations on the character codes against the string methods
+
+    def setup(self):
+        rng = np.random.RandomState(5)
+        chars = np.array(list(' \taAbB.xyz'))
+        words = [''.join(rng.choice(chars, rng.randint(0, 12)))
+                 for i in range(200)]
+        self.arrays = [np.array(words), np.array(words, dtype='U'),
+                       np.array(words + [u'\u0100 a\u3000'], dtype='U')]
+        self.block_bytes = _charbuffer._BLOCK_BYTES
+
+    def teardown(self):
+        _charbuffer._BLOCK_BYTES = self.block_bytes
+
+    def check(self, func, args=()):
+        for a in self.arrays:
+            kind = a.dtype.type
+            args_ = tuple(kind(arg) if arg is not None else None
+                          for arg in args)
+            expected = [getattr(item, func)(*args_) for item in a.tolist()]
+            res = getattr(np.char, func)(a, *args_)
+            assert_equal(res.tolist(), expected)
+
+    def test_operations(self):
+        for block_bytes in [self.block_bytes, 7]:
+            _charbuffer._BLOCK_BYTES = block_bytes
+            for func in ['upper', 'lower', 'swapcase', 'capitalize',
+                         'strip', 'lstrip', 'rstrip']:
+                self.check(func)
+            for args in [('a',), ('aB',), (' \t',), ('',)]:
+                for func in ['find', 'rfind', 'count', 'startswith',
+                             'endswith', 'strip', 'lstrip', 'rstrip']:
+                    self.check(func, args)
+            for args in [('a', 'xyz'), ('aa', ''), ('aba', 'c'),
+                         (' ', '.'), ('xyzxyzxyzxyzxyz', 'x')]:
+                self.check('replace', args)
+            for a in self.arrays:
+                assert_equal(np.char.str_len(a), [len(x) for x in a.tolist()])
+
+    def test_replace_width(self):
+        a = np.array(['abc', 'a'])
+        assert_equal(np.char.replace(a, 'a', '').dtype, np.dtype('S2'))
+        assert_equal(np.char.replace(a, 'a', 'xyz').dtype, np.dtype('S5'))
+        a = np.array([u'abc', u'a'])
+        assert_equal(np.char.replace(a, u'a', u'xy').dtype, np.dtype('U4'))
+
+    def test_index(self):
+        a = np.array(['abc', 'cab'])
+        assert_equal(np.char.index(a, 'ab'), [0, 1])
+        assert_raises(ValueError, np.char.index, a, 'ca')
+        assert_raises(ValueError, np.char.rindex, a, 'x')
+
+    def test_split_offsets(self):
+        for a in self.arrays:
+            for sep in [None, 'a', ' ', 'aB']:
+                if sep is not None:
+                    sep = a.dtype.type(sep)
+                indptr, start, stop = np.char.split_offsets(a, sep)
+                words = [[item[i:j] for i, j in zip(start[lo:hi],
+                                                    stop[lo:hi])]
+                         for item, lo, hi in zip(a.tolist(), indptr[:-1],
+                                                 indptr[1:])]
+                assert_equal(words, [item.split(sep) for item in a.tolist()])
+                assert_equal(start.dtype, np.intp)
+
+    def test_high_bytes(self):
+        # Bytes beyond ASCII, Latin-1 text for example
+        a = np.array([b'a\xe9B', b'\xff z\x80', b''])
+        self.arrays = [a]
+        for func in ['upper', 'lower', 'swapcase', 'capitalize', 'strip']:
+            self.check(func)
+        for args in [(b'\xe9',), (b'z\x80',)]:
+            for func in ['find', 'count', 'replace']:
+                self.check(func, args + (b'x',) * (func == 'replace'))
+
+    def test_fallback(self):
+        # Other arrays and mixed arguments use the string methods
+        a = np.array([u'ab c', u'd'], dtype='>U4' if sys.byteorder == 'little'
+                                               else '<U4')
+        assert_array_equal(np.char.upper(a), [u'AB C', u'D'])
+        a = np.array(['ab c', 'd'], dtype=object)
+        indptr, start, stop = np.char.split_offsets(a)
+        assert_equal(indptr, [0, 2, 3])
+        assert_equal(start, [0, 3, 0])
+        assert_equal(stop, [2, 4, 1])
+        a = np.array(['ab c', 'd'])
+        assert_equal(np.char.find(a, u'c'), [3, -1])
+
+
 def test_empty_indexing():
     """Regression test for ticket 1948."""
     # Check that indexing a chararray with an empty list/array returns an
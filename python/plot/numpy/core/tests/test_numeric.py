@@ -2275,6 +2275,16 @@ class TestCorrelate(object):
         z = np.correlate(y, x, mode='full')
         assert_array_almost_equal(z, r_z)
 
+    def test_methods(self):
+        x = np.random.random(200) + 1j*np.random.random(200)
+        y = np.random.random(31)
+        for method in ['fft', 'overlap-add']:
+            for mode in ['valid', 'same', 'full']:
+                for a, v in [(x, y), (y, x), (x.real, y)]:
+                    assert_array_almost_equal(
+                        np.correlate(a, v, mode, method=method),
+                        np.correlate(a, v, mode, method='direct'))
+
 
 class TestConvolve(object):
     def test_object(self):
@@ -2289,6 +2299,69 @@ class TestConvolve(object):
         assert_array_equal(d, np.ones(100))
         assert_array_equal(k, np.ones(3))
 
+    def test_methods(self):
+        d = np.random.random(500)
+        k = np.random.random(40)
+        for method in ['fft', 'overlap-add']:
+            for mode in ['valid', 'same', 'full']:
+                assert_array_almost_equal(
+                    np.convolve(d, k, mode, method=method),
+                    np.convolve(d, k, mode, method='direct'))
+                assert_array_almost_equal(
+                    np.convolve(k, d, mode, method=method),
+                    np.convolve(k, d, mode, method='direct'))
+
+    def test_method_default(self):
+        # The transforms are opt-in, the default stays exact.
+        d = np.random.random(5000)
+        k = np.random.random(500)
+        assert_array_equal(np.convolve(d, k), np.convolve(d, k, method='direct'))
+        assert_array_equal(np.correlate(d, k),
+                           np.correlate(d, k, method='direct'))
+
+    def test_method_auto(self):
+        # Integer input stays exact, whatever its size.
+        d = np.arange(5000)
+        k = np.arange(500)
+        assert_equal(np.convolve(d, k, method='auto').dtype,
+                     np.result_type(d, k))
+        assert_array_equal(np.convolve(d, k, method='auto'),
+                           np.convolve(d, k, method='direct'))
+        d = np.random.random(5000).astype(np.float32)
+        k = np.random.random(500).astype(np.float32)
+        assert_equal(np.convolve(d, k, method='auto').dtype, np.float32)
+        assert_raises(ValueError, np.convolve, d, k, method='bad')
+
+    def test_methods_exact_types(self):
+        # The transforms would round integer and object results.
+        assert_array_equal(np.convolve([1, 2, 3], [1, 1, 1], method='fft'),
+                           [1, 3, 6, 5, 3])
+        d = np.random.randint(-100, 100, 300)
+        k = np.random.randint(-100, 100, 40)
+        for method in ['fft', 'overlap-add', 'auto']:
+            for mode in ['valid', 'same', 'full']:
+                assert_array_equal(np.convolve(d, k, mode, method=method),
+                                   np.convolve(d, k, mode, method='direct'))
+                assert_array_equal(np.correlate(d, k, mode, method=method),
+                                   np.correlate(d, k, mode, method='direct'))
+            assert_array_equal(
+                np.convolve(d.astype(object), k, method=method),
+                np.convolve(d, k, method='direct'))
+            assert_array_equal(np.convolve(d > 0, k > 0, method=method),
+                               np.convolve(d > 0, k > 0, method='direct'))
+
+    def test_method_auto_nonfinite(self):
+        # nan and inf only reach the outputs that overlap them.
+        d = np.random.random(100000)
+        k = np.random.random(2000)
+        d[50000] = np.nan
+        d[70000] = np.inf
+        for mode in ['valid', 'same', 'full']:
+            assert_array_equal(np.convolve(d, k, mode, method='auto'),
+                               np.convolve(d, k, mode, method='direct'))
+            assert_array_equal(np.correlate(d, k, mode, method='auto'),
+                               np.correlate(d, k, mode, method='direct'))
+
 
 class TestArgwhere(object):
     def test_2D(self):
@@ -9,6 +9,7 @@ load_library : Load a C library.
 ndpointer : Array restype/argtype with verification.
 as_ctypes : Create a ctypes array from an ndarray.
 as_array : Create an ndarray from a ctypes array.
+from_address : Create an ndarray from a raw memory address.
 
 References
 ----------
@@ -52,7 +53,7 @@ Then, we're ready to call ``foo_func``:
 from __future__ import division, absolute_import, print_function
 
 __all__ = ['load_library', 'ndpointer', 'test', 'ctypes_load_library',
-           'c_intp', 'as_ctypes', 'as_array']
+           'c_intp', 'as_ctypes', 'as_array', 'from_address']
 
 import sys, os
 from numpy import integer, ndarray, dtype as _dtype, deprecate, array
@@ -79,6 +80,7 @@ if ctypes is None:
     load_library = _dummy
     as_ctypes = _dummy
     as_array = _dummy
+    from_address = _dummy
     from numpy import intp as c_intp
     _ndptr_base = object
 else:
@@ -210,7 +212,13 @@ class _ndptr(_ndptr_base):
                and ((obj.flags.num & cls._flags_) != cls._flags_):
             raise TypeError("array must have flags %s" %
                     _flags_fromnum(cls._flags_))
-        return obj.ctypes
+        # Passing a reference to a ctypes view of the buffer is much cheaper
+        # than building `obj.ctypes`, but is only possible for writeable,
+        # C-contiguous and non-empty arrays.
+        try:
+            return ctypes.byref(ctypes.c_char.from_buffer(obj))
+        except (TypeError, ValueError, BufferError):
+            return obj.ctypes
 
 
 # Factory for an array-checking class with from_param defined for
@@ -287,8 +295,14 @@ def ndpointer(dtype=None, ndim=None, shape=None, flags=None):
             except Exception:
                 raise TypeError("invalid flags specification")
             num = _num_fromflags(flags)
+    if shape is not None:
+        try:
+            shape = tuple(shape)
+        except TypeError:
+            shape = (shape,)
+    key = (dtype, ndim, shape, num)
     try:
-        return _pointer_type_cache[(dtype, ndim, shape, num)]
+        return _pointer_type_cache[key]
     except KeyError:
         pass
     if dtype is None:
@@ -300,13 +314,7 @@ def ndpointer(dtype=None, ndim=None, shape=None, flags=None):
     if ndim is not None:
         name += "_%dd" % ndim
     if shape is not None:
-        try:
-            strshape = [str(x) for x in shape]
-        except TypeError:
-            strshape = [str(shape)]
-            shape = (shape,)
-        shape = tuple(shape)
-        name += "_"+"x".join(strshape)
+        name += "_"+"x".join([str(x) for x in shape])
     if flags is not None:
         name += "_"+"_".join(flags)
     else:
@@ -316,7 +324,7 @@ def ndpointer(dtype=None, ndim=None, shape=None, flags=None):
                   "_shape_" : shape,
                   "_ndim_" : ndim,
                   "_flags_" : num})
-    _pointer_type_cache[(dtype, shape, ndim, num)] = klass
+    _pointer_type_cache[key] = klass
     return klass
 
 if ctypes is not None:
@@ -452,3 +460,88 @@ if ctypes is not None:
         result = tp.from_address(addr)
         result.__keep = ai
         return result
+
+    class _AddressOwner(object):
+        """Exposes external memory to numpy, and keeps its owner alive for
+        as long as an array uses it."""
+        def __init__(self, interface, owner, deleter):
+            self.__array_interface__ = interface
+            self._owner = owner
+            self._deleter = deleter
+
+        def __del__(self):
+            if self._deleter is not None:
+                self._deleter(ct.c_void_p(self.__array_interface__['data'][0]))
+
+    def from_address(address, dtype, shape, strides=None, readonly=False,
+                     owner=None, deleter=None):
+        """
+        Create an ndarray from memory at a raw address, without copying.
+
+        Parameters
+        ----------
+        address : int or ctypes pointer
+            Address of the first element of the array.
+        dtype : data-type
+            Data type of the array elements.
+        shape : int or tuple of ints
+            Shape of the array.
+        strides : tuple of ints, optional
+            Strides of the array in bytes. By default the memory is taken
+            to be C-contiguous.
+        readonly : bool, optional
+            If True, the returned array is not writeable.
+        owner : object, optional
+            An object that owns the memory. It is kept alive for as long as
+            the returned array, or any view of it, exists.
+        deleter : callable, optional
+            Called with the address as a ``ctypes.c_void_p`` once the returned
+            array and all its views are gone, for instance to free the memory.
+
+        Returns
+        -------
+        out : ndarray
+            An array sharing the memory at `address`.
+
+        Raises
+        ------
+        ValueError
+            If `address` is a null pointer, or `strides` does not match
+            `shape`.
+
+        See Also
+        --------
+        as_array : Create an ndarray from a ctypes array or pointer.
+
+        Examples
+        --------
+        >>> buf = (ctypes.c_double * 6)(*range(6))
+        >>> a = np.ctypeslib.from_address(ctypes.addressof(buf), np.double,
+        ...                               (2, 3), owner=buf)
+        >>> a
+        array([[ 0.,  1.,  2.],
+               [ 3.,  4.,  5.]])
+
+        """
+        if not isinstance(address, (int, integer)):
+            address = ct.cast(address, ct.c_void_p).value
+        if not address:
+            raise ValueError("null pointer")
+        dtype = _dtype(dtype)
+        try:
+            shape = tuple(shape)
+        except TypeError:
+            shape = (shape,)
+        if strides is not None:
+            strides = tuple(strides)
+            if len(strides) != len(shape):
+                raise ValueError("strides must have the same length as shape")
+
+        interface = {'version': 3,
+                     'typestr': dtype.str,
+                     'descr': dtype.descr,
+                     'shape': shape,
+                     'strides': strides,
+                     'data': (int(address), bool(readonly)),
+                     }
+        return array(_AddressOwner(interface, owner, deleter), copy=False)
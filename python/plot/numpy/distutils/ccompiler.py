@@ -20,6 +20,7 @@ from numpy.distutils.exec_command import exec_command
 from numpy.distutils.misc_util import cyg2win32, is_sequence, mingw32, \
                                       quote_args, get_num_build_jobs, \
                                       _commandline_dep_string
+from numpy.distutils.compile_cache import get_compile_cache
 
 # globals for parallel build management
 try:
@@ -280,6 +281,12 @@ def CCompiler_compile(self, sources, output_dir=None, macros=None,
         display += "\nextra options: '%s'" % (' '.join(extra_postargs))
     log.info(display)
 
+    # Fortran objects also depend on module files and INCLUDE lines that
+    # the preprocessor does not see, so only C/C++ objects are cached
+    cache = None
+    if not isinstance(self, FCompiler):
+        cache = get_compile_cache()
+
     def single_compile(args):
         obj, (src, ext) = args
         if not _needs_build(obj, cc_args, extra_postargs, pp_opts):
@@ -300,7 +307,12 @@ def CCompiler_compile(self, sources, output_dir=None, macros=None,
         try:
             # retrieve slot from our #job semaphore and build
             with _job_semaphore:
-                self._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+                if cache is not None:
+                    cache.compile(self, obj, src, ext, cc_args,
+                                  extra_postargs, pp_opts)
+                else:
+                    self._compile(obj, src, ext, cc_args, extra_postargs,
+                                  pp_opts)
         finally:
             # register being done processing
             with _global_lock:
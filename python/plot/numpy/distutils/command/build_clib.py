@@ -14,6 +14,7 @@ from distutils.dep_util import newer_group
 from numpy.distutils.misc_util import filter_sources, has_f_sources,\
      has_cxx_sources, all_strings, get_lib_source_files, is_sequence, \
      get_numpy_include_dirs
+from numpy.distutils.compile_cache import get_compile_cache
 
 # Fix Python distutils bug sf #1718574:
 _l = old_build_clib.user_options
@@ -115,6 +116,10 @@ class build_clib(old_build_clib):
 
         self.build_libraries(self.libraries)
 
+        compile_cache = get_compile_cache()
+        if compile_cache is not None:
+            compile_cache.report('build_clib')
+
         if self.inplace:
             for l in self.distribution.installed_libraries:
                 libname = self.compiler.library_filename(l.name)
@@ -22,6 +22,7 @@ from numpy.distutils.misc_util import filter_sources, has_f_sources, \
     get_numpy_include_dirs, is_sequence, get_build_architecture, \
     msvc_version
 from numpy.distutils.command.config_compiler import show_fortran_compilers
+from numpy.distutils.compile_cache import get_compile_cache
 
 
 
@@ -261,6 +262,10 @@ class build_ext (old_build_ext):
         # Build extensions
         self.build_extensions()
 
+        compile_cache = get_compile_cache()
+        if compile_cache is not None:
+            compile_cache.report('build_ext')
+
         # Copy over any extra DLL files
         runtime_lib_dir = os.path.join(
             self.build_lib, self.distribution.get_name(), '.libs')
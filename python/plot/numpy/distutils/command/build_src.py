@@ -7,6 +7,8 @@ import re
 import sys
 import shlex
 import copy
+import json
+import hashlib
 
 from distutils.command import build_ext
 from distutils.dep_util import newer_group, newer
@@ -19,8 +21,10 @@ from distutils.errors import DistutilsError, DistutilsSetupError
 #import numpy.f2py
 from numpy.distutils import log
 from numpy.distutils.misc_util import (
-    fortran_ext_match, appendpath, is_string, is_sequence, get_cmd
+    fortran_ext_match, appendpath, is_string, is_sequence, get_cmd,
+    get_num_build_jobs, _fork_pool
     )
+from numpy.distutils import from_template, conv_template
 from numpy.distutils.from_template import process_file as process_f_file
 from numpy.distutils.conv_template import process_file as process_c_file
 
@@ -153,19 +157,139 @@ class build_src(build_ext.build_ext):
             self.get_package_dir = \
                      self.get_finalized_command('build_py').get_package_dir
 
-        self.build_py_modules_sources()
+        self.load_digests()
+        try:
+            self.build_py_modules_sources()
+
+            # templates do not depend on each other, so all of them are
+            # generated at once before the sources are processed in order
+            self.build_templates()
 
-        for libname_info in self.libraries:
-            self.build_library_sources(*libname_info)
+            for libname_info in self.libraries:
+                self.build_library_sources(*libname_info)
 
-        if self.extensions:
-            self.check_extensions_list(self.extensions)
+            if self.extensions:
+                self.check_extensions_list(self.extensions)
 
-            for ext in self.extensions:
-                self.build_extension_sources(ext)
+                for ext in self.extensions:
+                    self.build_extension_sources(ext)
+
+            self.build_data_files_sources()
+            self.build_npy_pkg_config()
+        finally:
+            self.save_digests()
+
+    def load_digests(self):
+        """Load the digests of the inputs of the generated sources."""
+        self._digests_file = os.path.join(self.build_src,
+                                          'build_src_digests.json')
+        self._digests = {}
+        if os.path.isfile(self._digests_file):
+            try:
+                with open(self._digests_file, 'r') as f:
+                    self._digests = json.load(f)
+            except ValueError:
+                log.warn('ignoring corrupt %s' % (self._digests_file,))
+
+    def save_digests(self):
+        if self.dry_run:
+            return
+        self.mkpath(self.build_src)
+        with open(self._digests_file, 'w') as f:
+            json.dump(self._digests, f, indent=1, sort_keys=True)
 
-        self.build_data_files_sources()
-        self.build_npy_pkg_config()
+    def needs_update(self, target, files, options=()):
+        """
+        Return the digest of the inputs of `target` if it must be generated
+        again, or None if it is up to date.
+
+        `files` are the source and everything it includes or depends on, and
+        `options` those of the generator. Targets generated before their
+        digest was recorded are checked by timestamp.
+        """
+        digest = _digest_inputs(files, options)
+        if self.force or not os.path.isfile(target):
+            return digest
+        if target not in self._digests:
+            if newer_group(files, target, 'newer'):
+                return digest
+            self._digests[target] = digest
+            return None
+        if self._digests[target] != digest:
+            return digest
+        return None
+
+    def stale_templates(self, sources, depends):
+        """
+        Return (source, target, digest) of the templates in `sources` that
+        must be generated.
+        """
+        stale = []
+        for source in sources:
+            if not is_string(source):
+                continue
+            (base, ext) = os.path.splitext(source)
+            if ext != '.src':
+                continue
+            target_file = self.template_target(source)
+            if _f_pyf_ext_match(base):
+                include_re = from_template.include_src_re
+            else:
+                include_re = conv_template.include_src_re
+            files = _scan_includes(source, include_re) + list(depends)
+            digest = self.needs_update(target_file, files)
+            if digest is not None:
+                stale.append((source, target_file, digest))
+        return stale
+
+    def template_target(self, source):
+        base = os.path.splitext(source)[0]
+        if self.inplace:
+            target_dir = os.path.dirname(base)
+        else:
+            target_dir = appendpath(self.build_src, os.path.dirname(base))
+        return os.path.join(target_dir, os.path.basename(base))
+
+    def build_templates(self):
+        stale = []
+        for (lib_name, build_info) in self.libraries:
+            stale.extend(self.stale_templates(build_info.get('sources', []),
+                                              build_info.get('depends', [])))
+        for ext in self.extensions or []:
+            stale.extend(self.stale_templates(ext.sources, ext.depends))
+        # the same template may be used by several extensions
+        targets = set()
+        stale = [t for t in stale
+                 if not (t[1] in targets or targets.add(t[1]))]
+        self.generate_templates(stale)
+
+    def generate_templates(self, stale):
+        """Generate the templates returned by `stale_templates`."""
+        if not stale:
+            return
+        for source, target_file, digest in stale:
+            self.mkpath(os.path.dirname(target_file))
+        jobs = get_num_build_jobs()
+        pool = None
+        if jobs > 1 and len(stale) > 1:
+            pool = _fork_pool(min(jobs, len(stale)))
+        if pool is not None:
+            try:
+                outstrs = pool.map(_process_template,
+                                   [t[0] for t in stale])
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            outstrs = [_process_template(t[0]) for t in stale]
+        for (source, target_file, digest), outstr in zip(stale, outstrs):
+            if _f_pyf_ext_match(os.path.splitext(source)[0]):
+                log.info("from_template:> %s" % (target_file))
+            else:
+                log.info("conv_template:> %s" % (target_file))
+            with open(target_file, 'w') as fid:
+                fid.write(outstr)
+            self._digests[target_file] = digest
 
     def build_data_files_sources(self):
         if not self.data_files:
@@ -411,25 +535,13 @@ class build_src(build_ext.build_ext):
         else:
             depends = extension.depends
             include_dirs = extension.include_dirs
+        # only templates that are not in the extension sources given to
+        # setup are still stale here
+        self.generate_templates(self.stale_templates(sources, depends or []))
         for source in sources:
             (base, ext) = os.path.splitext(source)
             if ext == '.src':  # Template file
-                if self.inplace:
-                    target_dir = os.path.dirname(base)
-                else:
-                    target_dir = appendpath(self.build_src, os.path.dirname(base))
-                self.mkpath(target_dir)
-                target_file = os.path.join(target_dir, os.path.basename(base))
-                if (self.force or newer_group([source] + depends, target_file)):
-                    if _f_pyf_ext_match(base):
-                        log.info("from_template:> %s" % (target_file))
-                        outstr = process_f_file(source)
-                    else:
-                        log.info("conv_template:> %s" % (target_file))
-                        outstr = process_c_file(source)
-                    fid = open(target_file, 'w')
-                    fid.write(outstr)
-                    fid.close()
+                target_file = self.template_target(source)
                 if _header_ext_match(target_file):
                     d = os.path.dirname(target_file)
                     if d not in include_dirs:
@@ -535,13 +647,18 @@ class build_src(build_ext.build_ext):
             source = f2py_sources[0]
             target_file = f2py_targets[source]
             target_dir = os.path.dirname(target_file) or '.'
-            depends = [source] + extension.depends
-            if (self.force or newer_group(depends, target_file, 'newer')) \
-                   and not skip_f2py:
+            depends = _scan_includes(source, _fortran_include_re) \
+                      + extension.depends
+            digest = None
+            if not skip_f2py:
+                digest = self.needs_update(target_file, depends,
+                                           f2py_options)
+            if digest is not None:
                 log.info("f2py: %s" % (source))
                 import numpy.f2py
                 numpy.f2py.run_main(f2py_options
                                     + ['--build-dir', target_dir, source])
+                self._digests[target_file] = digest
             else:
                 log.debug("  skipping '%s' f2py interface (up-to-date)" % (source))
         else:
@@ -553,15 +670,25 @@ class build_src(build_ext.build_ext):
                                         +name.split('.')[:-1]))
             target_file = os.path.join(target_dir, ext_name + 'module.c')
             new_sources.append(target_file)
-            depends = f_sources + extension.depends
-            if (self.force or newer_group(depends, target_file, 'newer')) \
-                   and not skip_f2py:
+            depends = []
+            for f in f_sources:
+                depends.extend(_scan_includes(f, _fortran_include_re))
+            depends += extension.depends
+            digest = None
+            if not skip_f2py:
+                digest = self.needs_update(target_file, depends,
+                                           f2py_options + ['-m', ext_name])
+            if digest is not None:
                 log.info("f2py:> %s" % (target_file))
                 self.mkpath(target_dir)
                 import numpy.f2py
+                jobs = get_num_build_jobs()
+                if jobs > 1 and len(f_sources) > 1:
+                    f2py_options = f2py_options + ['--jobs', str(jobs)]
                 numpy.f2py.run_main(f2py_options + ['--lower',
                                                 '--build-dir', target_dir]+\
                                 ['-m', ext_name]+f_sources)
+                self._digests[target_file] = digest
             else:
                 log.debug("  skipping f2py fortran files for '%s' (up-to-date)"\
                           % (target_file))
@@ -703,12 +830,17 @@ class build_src(build_ext.build_ext):
             swig_cmd.append('-I'+d)
         for source in swig_sources:
             target = swig_targets[source]
-            depends = [source] + extension.depends
-            if self.force or newer_group(depends, target, 'newer'):
+            depends = _scan_includes(source, _swig_include_re,
+                                     extension.include_dirs) \
+                      + extension.depends
+            digest = self.needs_update(target, depends,
+                                       swig_cmd + self.swig_opts)
+            if digest is not None:
                 log.info("%s: %s" % (os.path.basename(swig) \
                                      + (is_cpp and '++' or ''), source))
                 self.spawn(swig_cmd + self.swig_opts \
                            + ["-o", target, '-outdir', py_target_dir, source])
+                self._digests[target] = digest
             else:
                 log.debug("  skipping '%s' swig interface (up-to-date)" \
                          % (source))
@@ -718,6 +850,64 @@ class build_src(build_ext.build_ext):
 _f_pyf_ext_match = re.compile(r'.*[.](f90|f95|f77|for|ftn|f|pyf)\Z', re.I).match
 _header_ext_match = re.compile(r'.*[.](inc|h|hpp)\Z', re.I).match
 
+#### Dependency tracking auxiliary functions ####
+
+_fortran_include_re = re.compile(r'\s*include\s*[\'"](?P<name>[^\'"]+)[\'"]',
+                                 re.I)
+_swig_include_re = re.compile(r'\s*%(include|import)\s*[<"]?(?P<name>[^\s">]+)')
+
+def _scan_includes(source, include_re, include_dirs=()):
+    """Return source and the files it includes, recursively.
+
+    Included files are looked up in the directory of the including file,
+    then in include_dirs. Files that are not found are ignored.
+    """
+    files = []
+    todo = [source]
+    while todo:
+        fn = todo.pop(0)
+        if fn in files:
+            continue
+        files.append(fn)
+        try:
+            f = open(fn, 'r')
+        except IOError:
+            continue
+        with f:
+            for line in f:
+                m = include_re.match(line)
+                if not m:
+                    continue
+                name = m.group('name')
+                if os.path.isabs(name):
+                    candidates = [name]
+                else:
+                    candidates = [os.path.join(d, name) for d in
+                                  [os.path.dirname(fn)] + list(include_dirs)]
+                for c in candidates:
+                    if os.path.isfile(c):
+                        todo.append(c)
+                        break
+    return files
+
+def _digest_inputs(files, options=()):
+    """Return a digest of the names and contents of files and of options."""
+    h = hashlib.sha1()
+    h.update(repr(list(options)).encode('utf-8'))
+    for fn in files:
+        h.update(repr(fn).encode('utf-8'))
+        try:
+            with open(fn, 'rb') as f:
+                h.update(f.read())
+        except IOError:
+            h.update(b'\0missing')
+    return h.hexdigest()
+
+def _process_template(source):
+    if _f_pyf_ext_match(os.path.splitext(source)[0]):
+        return process_f_file(source)
+    return process_c_file(source)
+
 #### SWIG related auxiliary functions ####
 _swig_module_name_match = re.compile(r'\s*%module\s*(.*\(\s*package\s*=\s*"(?P<package>[\w_]+)".*\)|)\s*(?P<name>[\w_]+)',
                                      re.I).match
@@ -0,0 +1,358 @@
+"""
+compile_cache - content-addressed cache of compiled object files.
+
+The cache is enabled by setting the environment variable
+NPY_COMPILE_CACHE_DIR to a directory, which may be shared by any number of
+source trees, build directories and concurrent builds.  Its size is bounded
+by NPY_COMPILE_CACHE_SIZE (in bytes, or with a K, M or G suffix; default
+2G), the least recently used objects being evicted first.
+
+An object is looked up by a hash of
+
+- the compiler executable (resolved path, size and modification time),
+- the compiler flags, including the macro definitions,
+- the preprocessed source, without line markers unless debugging
+  information is requested.
+
+Include directories only enter the key through the preprocessed source,
+so the same file compiled in different build directories hits the same
+entry.  When debugging information is requested (``-g``), the object records
+where the source lives, and the source path and working directory are hashed
+as well; such objects are only shared by builds in the same location.
+
+Only C and C++ sources compiled by gcc-like compilers (those producing
+automatic dependencies) are cached.  Fortran sources are always compiled,
+as INCLUDE lines and module files are not visible to the preprocessor.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+import os
+import re
+import shutil
+import hashlib
+import tempfile
+import subprocess
+from distutils.spawn import find_executable
+
+from numpy.distutils import log
+from numpy.distutils.misc_util import _commandline_dep_string
+
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
+
+__all__ = ['CompileCache', 'get_compile_cache']
+
+# bump when the key or the layout of the cache changes
+_CACHE_VERSION = 'numpy.distutils compile cache 1'
+
+_DEFAULT_MAX_SIZE = 2 * 1024**3
+
+# gcc style line markers: '# 12 "file.h" 2' or '#line 12 "file.h"'
+_line_marker_re = re.compile(br'^#(?:line)?[ \t]+\d+[ \t]+"((?:[^"\\]|\\.)*)".*$\n?',
+                             re.MULTILINE)
+
+_global_cache = None
+_global_cache_lock = threading.Lock()
+
+
+def _parse_size(size):
+    """
+    Parse a size given as a number of bytes with optional K, M or G suffix.
+    """
+    size = str(size).strip().upper()
+    if size.endswith('B'):
+        size = size[:-1]
+    factor = 1
+    for i, suffix in enumerate('KMG'):
+        if size.endswith(suffix):
+            factor = 1024**(i + 1)
+            size = size[:-1]
+            break
+    try:
+        return int(float(size) * factor)
+    except ValueError:
+        raise ValueError('invalid compile cache size: %r' % (size,))
+
+
+def get_compile_cache():
+    """
+    Return the compile cache configured by the environment.
+
+    Returns
+    -------
+    cache : CompileCache or None
+        The cache in NPY_COMPILE_CACHE_DIR, shared by all compilers of the
+        process, or None if NPY_COMPILE_CACHE_DIR is not set.
+
+    """
+    global _global_cache
+    cache_dir = os.environ.get('NPY_COMPILE_CACHE_DIR')
+    if not cache_dir:
+        return None
+    cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+    max_size = os.environ.get('NPY_COMPILE_CACHE_SIZE', _DEFAULT_MAX_SIZE)
+    with _global_cache_lock:
+        if _global_cache is None or _global_cache.cache_dir != cache_dir:
+            _global_cache = CompileCache(cache_dir, _parse_size(max_size))
+        return _global_cache
+
+
+class CompileCache(object):
+    """
+    Content-addressed store of object files.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory holding the cached objects. It is created if needed.
+    max_size : int, optional
+        Size in bytes above which the least recently used objects are
+        removed.
+
+    Attributes
+    ----------
+    hits, misses : int
+        Number of objects taken from the cache and number of objects
+        compiled and stored, since the last call to `report`.
+
+    Notes
+    -----
+    Entries are written to a temporary file and renamed into place, so
+    concurrent builds may share the directory.  The total size is tracked
+    by this process and is therefore only approximate when several builds
+    store objects at the same time.
+
+    """
+    def __init__(self, cache_dir, max_size=_DEFAULT_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+        self._compiler_ids = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key[2:] + '.o')
+
+    def _compiler_id(self, executable):
+        """Identify a compiler executable without running it."""
+        try:
+            return self._compiler_ids[executable]
+        except KeyError:
+            pass
+        path = find_executable(executable) or executable
+        try:
+            path = os.path.realpath(path)
+            st = os.stat(path)
+            ident = '%s %d %d' % (path, st.st_size, int(st.st_mtime))
+        except OSError:
+            ident = executable
+        self._compiler_ids[executable] = ident
+        return ident
+
+    def _preprocess(self, compiler, src, cc_args, extra_postargs):
+        """Return the preprocessed source, or None if that failed."""
+        cmd = compiler.compiler_so + cc_args + ['-E', src] + extra_postargs
+        try:
+            p = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+            out, err = p.communicate()
+        except OSError:
+            return None
+        if p.returncode:
+            return None
+        return out
+
+    def lookup(self, compiler, src, ext, cc_args, extra_postargs):
+        """
+        Compute the cache key of a compilation.
+
+        Parameters
+        ----------
+        compiler : CCompiler
+            Compiler instance used to compile `src`.
+        src, ext : str
+            Source file and its extension.
+        cc_args, extra_postargs : list of str
+            Compiler arguments, as passed to ``compiler._compile``.
+
+        Returns
+        -------
+        key : str or None
+            Hex digest identifying the object, or None if the source cannot
+            be cached.
+        depends : list of str
+            The files included by the source, itself included.
+
+        """
+        if not getattr(compiler, '_auto_depends', False):
+            return None, []
+        source = self._preprocess(compiler, src, cc_args, extra_postargs)
+        if source is None:
+            return None, []
+
+        # include directories only matter through the preprocessed source
+        flags = []
+        args = iter(compiler.compiler_so[1:] + cc_args + extra_postargs)
+        for arg in args:
+            if arg == '-I':
+                next(args, None)
+            elif not arg.startswith('-I'):
+                flags.append(arg)
+
+        h = hashlib.sha1()
+        h.update(_CACHE_VERSION.encode())
+        h.update(self._compiler_id(compiler.compiler_so[0]).encode())
+        h.update(('\0'.join([ext] + flags) + '\0').encode())
+        debug = any(f.startswith('-g') and f != '-g0' for f in flags)
+        if debug:
+            # debugging information records where the source lives
+            h.update((src + '\0' + os.getcwd()).encode())
+
+        depends = []
+        for m in _line_marker_re.finditer(source):
+            name = m.group(1).decode('utf-8', 'replace')
+            if not name.startswith('<') and name not in depends:
+                depends.append(name)
+        if debug:
+            # and the line of every statement, taken from the line markers
+            h.update(source)
+        else:
+            h.update(_line_marker_re.sub(b'', source))
+        return h.hexdigest(), depends
+
+    def fetch(self, key, obj):
+        """
+        Copy the cached object `key` to `obj`. Return False if not cached.
+        """
+        path = self._path(key)
+        try:
+            shutil.copyfile(path, obj)
+            # record the use for least recently used eviction
+            os.utime(path, None)
+        except (IOError, OSError):
+            return False
+        return True
+
+    def store(self, key, obj):
+        """
+        Add the object file `obj` to the cache under `key`.
+        """
+        path = self._path(key)
+        try:
+            d = os.path.dirname(path)
+            if not os.path.isdir(d):
+                try:
+                    os.makedirs(d)
+                except OSError:
+                    # created by a concurrent build
+                    if not os.path.isdir(d):
+                        raise
+            fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=d)
+            os.close(fd)
+            try:
+                shutil.copyfile(obj, tmp)
+                os.rename(tmp, path)
+            except (IOError, OSError):
+                os.remove(tmp)
+                raise
+            size = os.path.getsize(path)
+        except (IOError, OSError) as e:
+            log.debug('compile cache: could not store %s: %s' % (obj, e))
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += size
+        if self._current_size() > self.max_size:
+            self.evict()
+
+    def _entries(self):
+        entries = []
+        for dirpath, dirnames, filenames in os.walk(self.cache_dir):
+            for fn in filenames:
+                if not fn.endswith('.o'):
+                    continue
+                path = os.path.join(dirpath, fn)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _current_size(self):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(e[1] for e in self._entries())
+            return self._size
+
+    def evict(self):
+        """
+        Remove the least recently used objects until the cache takes at
+        most 80% of `max_size`, so that eviction does not run on every
+        stored object.
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            size = sum(e[1] for e in entries)
+            limit = int(0.8 * self.max_size)
+            for mtime, nbytes, path in entries:
+                if size <= limit:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                size -= nbytes
+            self._size = size
+
+    def compile(self, compiler, obj, src, ext, cc_args, extra_postargs,
+                pp_opts):
+        """
+        Produce `obj` from the cache, or compile and store it.
+
+        The arguments are those of ``compiler._compile``, which is called on
+        a cache miss. On a hit, the dependency file used by incremental
+        builds is written from the preprocessor line markers.
+        """
+        key, depends = self.lookup(compiler, src, ext, cc_args,
+                                   extra_postargs)
+        if key is None:
+            compiler._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+            return
+        if self.fetch(key, obj):
+            with self._lock:
+                self.hits += 1
+            log.info('%s: %s (cached)' % (
+                os.path.basename(compiler.compiler_so[0]), src))
+            with open(obj + '.d', 'w') as f:
+                f.write('%s: %s\n' % (
+                    obj.replace(' ', '\\ '),
+                    ' '.join(d.replace(' ', '\\ ') for d in depends)))
+                f.write(_commandline_dep_string(cc_args, extra_postargs,
+                                                pp_opts))
+            return
+        with self._lock:
+            self.misses += 1
+        compiler._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+        self.store(key, obj)
+
+    def report(self, title):
+        """
+        Log the hits and misses since the previous report and reset them.
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+            self.hits = self.misses = 0
+        total = hits + misses
+        if not total:
+            return
+        log.info('%s: compile cache %d hits, %d misses (%.0f%% hit rate), '
+                 '%.1f MB of %.1f MB used in %s'
+                 % (title, hits, misses, 100. * hits / total,
+                    self._current_size() / 1024.**2,
+                    self.max_size / 1024.**2, self.cache_dir))
@@ -548,6 +548,23 @@ def _commandline_dep_string(cc_args, extra_postargs, pp_opts):
     return cmdline
 
 
+def _fork_pool(processes):
+    """Return a pool of forked worker processes, or None if unavailable.
+
+    The workers start with the state of the caller, without running the
+    main script again as spawned workers would, so they are not used.
+    """
+    import multiprocessing
+    if hasattr(multiprocessing, 'get_context'):
+        try:
+            return multiprocessing.get_context('fork').Pool(processes)
+        except ValueError:
+            return None
+    if os.name == 'posix':
+        return multiprocessing.Pool(processes)
+    return None
+
+
 def get_dependencies(sources):
     #XXX scan sources for include statements
     return _get_headers(_get_directories(sources))
@@ -2071,10 +2088,11 @@ class Configuration(object):
         Return information (from system_info.get_info) for all of the names in
         the argument list in a single dictionary.
         """
-        from .system_info import get_info, dict_append
+        from .system_info import get_infos, dict_append
+        infos = get_infos(names)
         info_dict = {}
         for a in names:
-            dict_append(info_dict,**get_info(a))
+            dict_append(info_dict,**infos[a])
         return info_dict
 
 
@@ -82,6 +82,14 @@ The order of finding the locations of resources is the following:
  3. ALL section in site.cfg
 Only the first complete match is returned.
 
+Detection results are kept across runs in the file named by the environment
+variable NPY_SYSTEM_INFO_CACHE, if it is set. A result is reused as long as
+the site.cfg files, the environment variables of the *_info classes and the
+modification times of the searched directories are unchanged.  Remove the
+file, or call clear_info_cache(), to force detection again.
+
+Independent resources can be detected concurrently with get_infos().
+
 Example:
 ----------
 [ALL]
@@ -127,6 +135,8 @@ import re
 import copy
 import warnings
 import atexit
+import hashlib
+from ast import literal_eval
 from glob import glob
 from functools import reduce
 if sys.version_info[0] < 3:
@@ -149,7 +159,8 @@ from distutils.util import get_platform
 from numpy.distutils.exec_command import (
     find_executable, exec_command, get_pythonexe)
 from numpy.distutils.misc_util import (is_sequence, is_string,
-                                       get_shared_lib_extension)
+                                       get_shared_lib_extension,
+                                       get_num_build_jobs)
 from numpy.distutils.command.config import config as cmd_config
 from numpy.distutils.compat import get_exception
 from numpy.distutils import customized_ccompiler
@@ -157,6 +168,11 @@ import distutils.ccompiler
 import tempfile
 import shutil
 
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
+
 
 # Determine number of bits
 import platform
@@ -432,6 +448,203 @@ def get_info(name, notfound_action=0):
     return cl().get_info(notfound_action)
 
 
+def get_infos(names, notfound_action=0, jobs=None):
+    """
+    Return the information of several resources, detected concurrently.
+
+    Parameters
+    ----------
+    names : sequence of str
+        Resource names, as accepted by `get_info`.
+    notfound_action : {0, 1, 2}, optional
+        As for `get_info`.
+    jobs : int, optional
+        Number of resources detected at the same time. Defaults to the
+        number of parallel build jobs.
+
+    Returns
+    -------
+    infos : dict
+        The dictionary returned by `get_info` for each name.
+
+    """
+    names = list(names)
+    if jobs is None:
+        jobs = get_num_build_jobs()
+    if jobs > 1 and len(names) > 1:
+        import multiprocessing.pool
+        pool = multiprocessing.pool.ThreadPool(min(jobs, len(names)))
+        try:
+            infos = pool.map(lambda n: get_info(n, notfound_action), names)
+        finally:
+            pool.close()
+    else:
+        infos = [get_info(n, notfound_action) for n in names]
+    return dict(zip(names, infos))
+
+
+# Detection of a class is done by a single thread at a time, the others
+# wait for the result.
+_probe_locks = {}
+_probe_locks_lock = threading.Lock()
+
+
+def _get_probe_lock(name):
+    with _probe_locks_lock:
+        if name not in _probe_locks:
+            _probe_locks[name] = threading.RLock()
+        return _probe_locks[name]
+
+
+# Environment variables used during detection besides the dir_env_var of
+# the *_info classes.
+_info_cache_env_vars = ['PATH', 'LD_LIBRARY_PATH', 'LIBRARY_PATH', 'CPATH',
+                        'MKLROOT', 'ATLAS_VERSION', 'PKG_CONFIG_PATH',
+                        'CC', 'CFLAGS', 'CPPFLAGS', 'LDFLAGS', 'OPT']
+_info_cache_lock = threading.Lock()
+
+
+def _info_cache_file():
+    fn = os.environ.get('NPY_SYSTEM_INFO_CACHE')
+    if not fn:
+        return None
+    return os.path.abspath(os.path.expanduser(fn))
+
+
+def _read_info_cache(fn):
+    try:
+        with open(fn, 'r') as f:
+            cache = literal_eval(f.read())
+    except (IOError, OSError, SyntaxError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return cache
+
+
+def _info_env_vars():
+    env_vars = set(_info_cache_env_vars)
+    classes = [system_info]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        env_var = cls.dir_env_var
+        if is_string(env_var):
+            env_vars.add(env_var)
+        elif is_sequence(env_var):
+            env_vars.update(env_var)
+    return sorted(env_vars)
+
+
+def _info_cache_key(info):
+    """
+    Return a digest of everything the detection of `info` depends on.
+    """
+    h = hashlib.sha1()
+
+    def update(*items):
+        h.update(repr(items).encode('utf-8'))
+
+    cls = info.__class__
+    update(sys.version, sys.executable, get_platform(), cls.__module__,
+           cls.__name__)
+    module = sys.modules.get(cls.__module__)
+    try:
+        update(os.path.getmtime(module.__file__))
+    except (AttributeError, OSError):
+        pass
+
+    for fn in info.files:
+        try:
+            with open(fn, 'rb') as f:
+                h.update(f.read())
+        except (IOError, OSError):
+            update(fn, None)
+
+    dirs = default_lib_dirs + default_include_dirs + default_src_dirs
+    for section in info.cp.sections():
+        for key in ['library_dirs', 'include_dirs', 'src_dirs',
+                    'runtime_library_dirs']:
+            try:
+                dirs.extend(info.cp.get(section, key).split(os.pathsep))
+            except Exception:
+                pass
+    for env_var in _info_env_vars():
+        value = os.environ.get(env_var)
+        update(env_var, value)
+        if value:
+            for d in value.split(os.pathsep):
+                dirs.extend([d, os.path.join(d, 'lib'),
+                             os.path.join(d, 'include')])
+
+    # adding or removing a library changes the mtime of its directory;
+    # relative paths are skipped, as the build itself writes to the current
+    # directory
+    for d in sorted(set(dirs)):
+        if not os.path.isabs(d):
+            continue
+        try:
+            update(d, os.stat(d).st_mtime)
+        except OSError:
+            pass
+    return h.hexdigest()
+
+
+def _get_cached_info(info):
+    """
+    Return the cached result of `info` and its key.
+
+    The result is None if there is no valid entry, and an empty dict if
+    the resource was not found.
+    """
+    fn = _info_cache_file()
+    if fn is None:
+        return None, None
+    key = _info_cache_key(info)
+    entry = _read_info_cache(fn).get(info.__class__.__name__)
+    if entry is None or entry.get('key') != key:
+        return None, key
+    return entry['info'], key
+
+
+def _store_cached_info(info, key, result):
+    fn = _info_cache_file()
+    if fn is None or key is None:
+        return
+    try:
+        literal_eval(repr(result))
+    except (SyntaxError, ValueError):
+        # only plain values can be read back
+        return
+    with _info_cache_lock:
+        # merge with what other processes wrote in the meantime
+        cache = _read_info_cache(fn)
+        cache[info.__class__.__name__] = {'key': key, 'info': result}
+        try:
+            d = os.path.dirname(fn)
+            fd, tmp = tempfile.mkstemp(dir=d, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(repr(cache))
+            try:
+                os.rename(tmp, fn)
+            except OSError:
+                # Windows does not replace existing files
+                os.remove(fn)
+                os.rename(tmp, fn)
+        except (IOError, OSError) as e:
+            log.debug('could not write %s: %s', fn, e)
+
+
+def clear_info_cache():
+    """
+    Forget all detection results, in this process and in the cache file.
+    """
+    system_info.saved_results.clear()
+    fn = _info_cache_file()
+    if fn is not None and os.path.exists(fn):
+        os.remove(fn)
+
+
 class NotFoundError(DistutilsError):
     """Some third-party program or library is not found."""
 
@@ -617,25 +830,35 @@ class system_info(object):
             with numpy.distutils.setup keyword arguments.
         """
         flag = 0
-        if not self.has_info():
-            flag = 1
-            log.info(self.__class__.__name__ + ':')
-            if hasattr(self, 'calc_info'):
-                self.calc_info()
-            if notfound_action:
-                if not self.has_info():
-                    if notfound_action == 1:
-                        warnings.warn(self.notfounderror.__doc__, stacklevel=2)
-                    elif notfound_action == 2:
-                        raise self.notfounderror(self.notfounderror.__doc__)
-                    else:
-                        raise ValueError(repr(notfound_action))
-
+        with _get_probe_lock(self.__class__.__name__):
             if not self.has_info():
-                log.info('  NOT AVAILABLE')
-                self.set_info()
-            else:
-                log.info('  FOUND:')
+                flag = 1
+                log.info(self.__class__.__name__ + ':')
+                cached, key = _get_cached_info(self)
+                if cached:
+                    self.saved_results[self.__class__.__name__] = cached
+                elif cached is None and hasattr(self, 'calc_info'):
+                    self.calc_info()
+                if notfound_action:
+                    if not self.has_info():
+                        if notfound_action == 1:
+                            warnings.warn(self.notfounderror.__doc__,
+                                          stacklevel=2)
+                        elif notfound_action == 2:
+                            raise self.notfounderror(
+                                self.notfounderror.__doc__)
+                        else:
+                            raise ValueError(repr(notfound_action))
+
+                if not self.has_info():
+                    log.info('  NOT AVAILABLE')
+                    self.set_info()
+                else:
+                    log.info('  FOUND:')
+                if cached is None:
+                    _store_cached_info(
+                        self, key,
+                        self.saved_results[self.__class__.__name__])
 
         res = self.saved_results.get(self.__class__.__name__)
         if self.verbosity > 0 and flag:
@@ -1445,9 +1668,17 @@ int main(void) {
 '''
 
 _cached_atlas_version = {}
+_atlas_version_lock = threading.Lock()
 
 
 def get_atlas_version(**config):
+    # the test program is written to the current directory, so concurrent
+    # probes must take turns
+    with _atlas_version_lock:
+        return _get_atlas_version(**config)
+
+
+def _get_atlas_version(**config):
     libraries = config.get('libraries', [])
     library_dirs = config.get('library_dirs', [])
     key = (tuple(libraries), tuple(library_dirs))
@@ -0,0 +1,82 @@
+from __future__ import division, absolute_import, print_function
+
+import os
+import shutil
+from tempfile import mkdtemp
+
+from numpy.distutils.core import Distribution
+from numpy.distutils.command.build_src import (
+    build_src, _scan_includes, _swig_include_re
+    )
+from numpy.distutils.conv_template import include_src_re
+from numpy.testing import run_module_suite, assert_, assert_equal
+
+
+template_text = """
+#include "common.src"
+/**begin repeat
+ * #type = int, long#
+ */
+@type@ get_@type@(@type@ x) { return x; }
+/**end repeat**/
+"""
+
+
+class TestBuildSrc(object):
+
+    def setup(self):
+        self._dir = mkdtemp()
+        self.source = self._write('module.c.src', template_text)
+        self._write('common.src', '/* common */\n')
+
+    def teardown(self):
+        shutil.rmtree(self._dir)
+
+    def _write(self, name, text):
+        fn = os.path.join(self._dir, name)
+        with open(fn, 'w') as f:
+            f.write(text)
+        return fn
+
+    def _command(self):
+        cmd = build_src(Distribution())
+        cmd.initialize_options()
+        cmd.build_src = os.path.join(self._dir, 'build')
+        cmd.force = 0
+        cmd.inplace = 0
+        cmd.load_digests()
+        return cmd
+
+    def _stale(self):
+        cmd = self._command()
+        stale = cmd.stale_templates([self.source], [])
+        cmd.generate_templates(stale)
+        cmd.save_digests()
+        return [target for source, target, digest in stale]
+
+    def test_scan_includes(self):
+        assert_equal(_scan_includes(self.source, include_src_re),
+                     [self.source, os.path.join(self._dir, 'common.src')])
+        inc = os.path.join(self._dir, 'inc')
+        os.mkdir(inc)
+        self._write(os.path.join('inc', 'typemaps.i'), '%include "missing.i"\n')
+        swig = self._write('ext.i', '%module ext\n%include "typemaps.i"\n')
+        assert_equal(_scan_includes(swig, _swig_include_re, [inc]),
+                     [swig, os.path.join(inc, 'typemaps.i')])
+
+    def test_regenerate(self):
+        target = self._stale()
+        assert_equal(len(target), 1)
+        assert_(os.path.isfile(target[0]))
+        assert_equal(self._stale(), [])
+        # touching a file does not change the digest
+        os.utime(self.source, None)
+        assert_equal(self._stale(), [])
+        # changing an include does
+        self._write('common.src', '/* changed */\n')
+        assert_equal(self._stale(), target)
+        assert_equal(self._stale(), [])
+
+
+if __name__ == '__main__':
+    run_module_suite()
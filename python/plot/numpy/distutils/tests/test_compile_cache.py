@@ -0,0 +1,123 @@
+from __future__ import division, absolute_import, print_function
+
+import os
+import shutil
+from tempfile import mkdtemp
+
+from numpy.distutils import customized_ccompiler
+from numpy.distutils.compile_cache import CompileCache, _parse_size
+from numpy.testing import (
+    run_module_suite, assert_, assert_equal, assert_raises, dec, SkipTest
+    )
+
+from numpy.distutils.tests.test_system_info import HAVE_COMPILER
+
+
+header_text = """
+#define ANSWER 42
+"""
+
+source_text = """
+#include "answer.h"
+int answer(void) { return ANSWER; }
+"""
+
+
+def test_parse_size():
+    assert_equal(_parse_size(1000), 1000)
+    assert_equal(_parse_size('10K'), 10 * 1024)
+    assert_equal(_parse_size('1.5m'), 3 * 512 * 1024)
+    assert_equal(_parse_size('2GB'), 2 * 1024**3)
+    assert_raises(ValueError, _parse_size, 'lots')
+
+
+class TestCompileCache(object):
+
+    def setup(self):
+        self._dir = mkdtemp()
+        self.cache = CompileCache(os.path.join(self._dir, 'cache'))
+
+    def teardown(self):
+        shutil.rmtree(self._dir)
+
+    def _write(self, name, text):
+        fn = os.path.join(self._dir, name)
+        d = os.path.dirname(fn)
+        if not os.path.isdir(d):
+            os.makedirs(d)
+        with open(fn, 'w') as f:
+            f.write(text)
+        return fn
+
+    def test_store_fetch(self):
+        obj = self._write('a.o', 'object')
+        out = os.path.join(self._dir, 'b.o')
+        assert_(not self.cache.fetch('ab' * 20, out))
+        self.cache.store('ab' * 20, obj)
+        assert_(self.cache.fetch('ab' * 20, out))
+        with open(out) as f:
+            assert_equal(f.read(), 'object')
+
+    def test_evict(self):
+        self.cache.max_size = 1000
+        obj = self._write('a.o', 'x' * 300)
+        keys = ['%02d' % i * 20 for i in range(5)]
+        for i, key in enumerate(keys):
+            self.cache.store(key, obj)
+            path = self.cache._path(key)
+            os.utime(path, (i, i))
+        # the oldest entries went first and the cache fits again
+        assert_(self.cache._current_size() <= 1000)
+        out = os.path.join(self._dir, 'b.o')
+        assert_(not self.cache.fetch(keys[0], out))
+        assert_(self.cache.fetch(keys[-1], out))
+
+    @dec.skipif(not HAVE_COMPILER)
+    def test_compile(self):
+        c = customized_ccompiler()
+        if not getattr(c, '_auto_depends', False):
+            raise SkipTest('compiler does not support gcc options')
+        # debugging information would tie the objects to their location
+        c.compiler_so = [f for f in c.compiler_so if not f.startswith('-g')]
+        objects = []
+        for build in ['build1', 'build2']:
+            src = self._write(os.path.join(build, 'answer.c'), source_text)
+            inc = os.path.dirname(
+                self._write(os.path.join(build, 'inc', 'answer.h'),
+                            header_text))
+            obj = os.path.join(self._dir, build, 'answer.o')
+            self.cache.compile(c, obj, src, '.c', ['-I' + inc, '-c'],
+                               [], ['-I' + inc])
+            assert_(os.path.isfile(obj))
+            objects.append(obj)
+        # the include directory does not change the key
+        assert_equal((self.cache.hits, self.cache.misses), (1, 1))
+        with open(objects[1] + '.d') as f:
+            assert_('answer.h' in f.read())
+        # macros do
+        self.cache.compile(c, objects[0], src, '.c',
+                           ['-I' + inc, '-DANSWER2', '-c'], [], ['-I' + inc])
+        assert_equal((self.cache.hits, self.cache.misses), (1, 2))
+
+    @dec.skipif(not HAVE_COMPILER)
+    def test_debug_lines(self):
+        c = customized_ccompiler()
+        if not getattr(c, '_auto_depends', False):
+            raise SkipTest('compiler does not support gcc options')
+        c.compiler_so = [f for f in c.compiler_so if not f.startswith('-g')]
+        src = self._write('answer.c', source_text)
+        keys = []
+        for lines in [10, 20]:
+            # long enough for the preprocessor to write a line marker
+            self._write('answer.h', '/*\n' + 'comment\n' * lines + '*/' +
+                        header_text + 'int answer(void);\n')
+            keys.append([self.cache.lookup(c, src, '.c', ['-I' + self._dir] +
+                                           flags, [])[0]
+                         for flags in [[], ['-g']]])
+        # moving code only changes the object when it records line numbers
+        assert_equal(keys[0][0], keys[1][0])
+        assert_(keys[0][1] != keys[1][1])
+
+
+if __name__ == '__main__':
+    run_module_suite()
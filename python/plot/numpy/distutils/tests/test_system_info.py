@@ -10,7 +10,9 @@ from numpy.distutils import ccompiler, customized_ccompiler
 from numpy.testing import (
     run_module_suite, assert_, assert_equal, dec
     )
-from numpy.distutils.system_info import system_info, ConfigParser
+from numpy.distutils.system_info import (
+    system_info, ConfigParser, get_info, get_infos, clear_info_cache
+    )
 from numpy.distutils.system_info import default_lib_dirs, default_include_dirs
 
 
@@ -22,7 +24,8 @@ def get_class(name, notfound_action=1):
       2 - raise error
     """
     cl = {'temp1': Temp1Info,
-          'temp2': Temp2Info
+          'temp2': Temp2Info,
+          'counting': CountingInfo
           }.get(name.lower(), _system_info)
     return cl()
 
@@ -120,6 +123,15 @@ class Temp2Info(_system_info):
     section = 'temp2'
 
 
+class CountingInfo(Temp1Info):
+    """For testing purposes, counts the detections"""
+    calls = 0
+
+    def calc_info(self):
+        CountingInfo.calls += 1
+        self.set_info(libraries=['counting'])
+
+
 class TestSystemInfoReading(object):
 
     def setup(self):
@@ -159,6 +171,8 @@ class TestSystemInfoReading(object):
         self.c_default = site_and_parse(get_class('default'), self._sitecfg)
         self.c_temp1 = site_and_parse(get_class('temp1'), self._sitecfg)
         self.c_temp2 = site_and_parse(get_class('temp2'), self._sitecfg)
+        self.c_counting = site_and_parse(get_class('counting'),
+                                         self._sitecfg)
 
     def tearDown(self):
         # Do each removal separately
@@ -201,6 +215,42 @@ class TestSystemInfoReading(object):
         extra = tsi.calc_extra_info()
         assert_equal(extra['extra_link_args'], ['-Wl,-rpath=' + self._lib2])
 
+    def test_info_cache(self):
+        cache_dir = mkdtemp()
+        cache = os.path.join(cache_dir, 'info_cache')
+        old_cache = os.environ.get('NPY_SYSTEM_INFO_CACHE')
+        os.environ['NPY_SYSTEM_INFO_CACHE'] = cache
+        try:
+            CountingInfo.calls = 0
+            tsi = self.c_counting
+            info = tsi.get_info()
+            assert_equal(CountingInfo.calls, 1)
+            assert_(os.path.isfile(cache))
+            # a new process reads the result from the cache
+            system_info.saved_results.pop('CountingInfo')
+            assert_equal(tsi.get_info(), info)
+            assert_equal(CountingInfo.calls, 1)
+            # changing site.cfg invalidates it
+            with open(self._sitecfg, 'a') as fd:
+                fd.write('\n[counting]\n')
+            system_info.saved_results.pop('CountingInfo')
+            assert_equal(tsi.get_info(), info)
+            assert_equal(CountingInfo.calls, 2)
+            clear_info_cache()
+            assert_(not os.path.exists(cache))
+            assert_(not tsi.has_info())
+        finally:
+            if old_cache is None:
+                del os.environ['NPY_SYSTEM_INFO_CACHE']
+            else:
+                os.environ['NPY_SYSTEM_INFO_CACHE'] = old_cache
+            shutil.rmtree(cache_dir)
+
+    def test_get_infos(self):
+        names = ['x11', 'fftw', 'blas_src']
+        infos = get_infos(names, jobs=3)
+        assert_equal(infos, dict((n, get_info(n)) for n in names))
+
     @dec.skipif(not HAVE_COMPILER)
     def test_compile1(self):
         # Compile source and link the first source
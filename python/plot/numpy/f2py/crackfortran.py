@@ -17,6 +17,8 @@ Usage of crackfortran:
 Command line keys: -quiet,-verbose,-fix,-f77,-f90,-show,-h <pyffilename>
                    -m <module name for f77 routines>,--ignore-contains
 Functions: crackfortran, crack2fortran
+Flags: cachedir    --- directory of the cache of cracked files (off if '')
+       numjobs     --- number of worker processes cracking files
 The following Fortran statements/constructions are supported
 (or will be if needed):
    block data,byte,call,character,common,complex,contains,data,
@@ -147,6 +149,8 @@ import re
 import os
 import copy
 import platform
+import hashlib
+import pickle
 
 from . import __version__
 
@@ -170,6 +174,8 @@ skipemptyends = 0      # for old F77 programs without 'program' statement
 ignorecontains = 1
 dolowercase = 1
 debug = []
+cachedir = ''          # Directory of the cache of cracked files, off if ''
+numjobs = 1            # Number of processes cracking files in parallel
 
 # Global variables
 beginpattern = ''
@@ -183,6 +189,7 @@ groupcounter = 0
 grouplist = {groupcounter: []}
 groupname = ''
 include_paths = []
+includedfiles = []     # Files read by include statements
 neededmodule = -1
 onlyfuncs = []
 previous_context = None
@@ -199,6 +206,7 @@ def reset_global_f2py_vars():
     global onlyfuncs, include_paths, previous_context
     global strictf77, sourcecodeform, quiet, verbose, tabchar, pyffilename
     global f77modulename, skipemptyends, ignorecontains, dolowercase, debug
+    global cachedir, numjobs, includedfiles
 
     # flags
     strictf77 = 1
@@ -212,6 +220,8 @@ def reset_global_f2py_vars():
     ignorecontains = 1
     dolowercase = 1
     debug = []
+    cachedir = ''
+    numjobs = 1
     # variables
     groupcounter = 0
     grouplist = {groupcounter: []}
@@ -228,6 +238,7 @@ def reset_global_f2py_vars():
     onlyfuncs = []
     include_paths = []
     previous_context = None
+    includedfiles = []
 
 
 def outmess(line, flag=1):
@@ -340,6 +351,7 @@ def readfortrancode(ffile, dowithline=show, istop=1):
     if not istop:
         saveglobals = gotnextfile, filepositiontext, currentfilename, sourcecodeform, strictf77,\
             beginpattern, quiet, verbose, dolowercase
+        includedfiles.append(ffile)
     if ffile == []:
         return
     localdolowercase = dolowercase
@@ -3239,14 +3251,177 @@ def vars2fortran(block, vars, args, tab='', as_interface=False):
 ######
 
 
+# bump when the format of the cracked blocks changes
+_crackcacheversion = 1
+
+
+def _hashfile(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _crackcachefile(filename):
+    """Return the cache file for the blocks of filename."""
+    h = hashlib.sha1()
+    h.update(repr((_crackcacheversion, f2py_version, filename, f77modulename,
+                   dolowercase, skipemptyends, ignorecontains,
+                   include_paths)).encode('utf-8'))
+    with open(filename, 'rb') as f:
+        h.update(f.read())
+    return os.path.join(cachedir, h.hexdigest() + '.pickle')
+
+
+def _readcrackcache(cachefile):
+    try:
+        with open(cachefile, 'rb') as f:
+            cracked = pickle.load(f)
+        # the included files are not part of the key, check them now
+        for fn, digest in cracked['includes']:
+            if _hashfile(fn) != digest:
+                return None
+    except Exception:
+        return None
+    return cracked
+
+
+def _writecrackcache(cachefile, cracked):
+    try:
+        if not os.path.isdir(cachedir):
+            os.makedirs(cachedir)
+        tmp = '%s.%d.tmp' % (cachefile, os.getpid())
+        with open(tmp, 'wb') as f:
+            pickle.dump(cracked, f, 2)
+        os.rename(tmp, cachefile)
+    except (IOError, OSError) as msg:
+        outmess('crackfortran: could not write %s: %s\n' % (cachefile, msg))
+
+
+def crackfile(filename):
+    """
+    Crack a single file, independently of the files read before it.
+
+    Returns a dictionary with the cracked blocks ('blocks'), the files read
+    by include statements with the sha1 digests of their contents
+    ('includes'), and whether all the blocks opened in the file were also
+    closed in it ('closed').
+    """
+    global expectbegin, previous_context, includedfiles
+    expectbegin = 1
+    previous_context = None
+    includedfiles = []
+    closed = []
+
+    def dowithline(line, reset=0):
+        if reset > 0:
+            if f77modulename and neededmodule != -1:
+                # the python module and interface blocks stay open
+                closed.append(groupcounter == neededmodule == 2)
+            else:
+                closed.append(groupcounter == 0)
+        crackline(line, reset)
+
+    readfortrancode([filename], dowithline)
+    includes = [(fn, _hashfile(fn)) for fn in includedfiles]
+    return {'blocks': grouplist[0], 'includes': includes,
+            'closed': closed[0]}
+
+
+def _trycrackfile(filename):
+    # an end statement closing a block of a previous file raises here
+    try:
+        return crackfile(filename)
+    except Exception:
+        return None
+
+
+def _mergecracked(crackedfiles):
+    """
+    Merge the blocks of files cracked one at a time into the blocks that
+    cracking them in one go gives, or return None if they depend on each
+    other.
+    """
+    blocks = []
+    for cracked in crackedfiles:
+        if not cracked['closed']:
+            return None
+        if f77modulename and cracked['blocks']:
+            # all routines go to the interface of the same python module
+            if not blocks:
+                blocks = cracked['blocks']
+            else:
+                module, other = blocks[0], cracked['blocks'][0]
+                module['body'][0]['body'].extend(other['body'][0]['body'])
+                # the routines are wrapped only when they are listed too
+                for key in ['externals', 'interfaced']:
+                    for name in other.get(key, []):
+                        if name not in module.setdefault(key, []):
+                            module[key].append(name)
+        else:
+            blocks.extend(cracked['blocks'])
+    return blocks
+
+
+def crackfiles(files):
+    """
+    Crack files one at a time, from the cache in cachedir when possible and
+    with numjobs worker processes, and merge their blocks.
+
+    Returns None if a file leaves blocks open or cannot be cracked on its
+    own, in which case the files must be read in one go.
+    """
+    crackedfiles = [None] * len(files)
+    cachefiles = [None] * len(files)
+    todo = []
+    for i, fn in enumerate(files):
+        if cachedir:
+            cachefiles[i] = _crackcachefile(fn)
+            crackedfiles[i] = _readcrackcache(cachefiles[i])
+        if crackedfiles[i] is None:
+            todo.append(i)
+        else:
+            outmess('\tUsing cached blocks of file %s\n' % (repr(fn)))
+
+    pool = None
+    if numjobs > 1 and len(todo) > 1:
+        from numpy.distutils.misc_util import _fork_pool
+        pool = _fork_pool(min(numjobs, len(todo)))
+    if pool is not None:
+        try:
+            cracked = pool.map(_trycrackfile, [files[i] for i in todo])
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        cracked = [_trycrackfile(files[i]) for i in todo]
+
+    for i, c in zip(todo, cracked):
+        if c is None:
+            return None
+        crackedfiles[i] = c
+        if cachedir:
+            _writecrackcache(cachefiles[i], c)
+    return _mergecracked(crackedfiles)
+
+
 def crackfortran(files):
+    """
+    Crack fortran files and return their post-processed blocks.
+
+    When a cache directory or several jobs are set, the files are cracked
+    one at a time with crackfiles, unless one leaves blocks open.
+    """
     global usermodules
 
     outmess('Reading fortran codes...\n', 0)
-    readfortrancode(files, crackline)
+    blocks = None
+    if (cachedir or numjobs > 1) and isinstance(files, (list, tuple)):
+        blocks = crackfiles(files)
+    if blocks is None:
+        readfortrancode(files, crackline)
+        blocks = grouplist[0]
     outmess('Post-processing...\n', 0)
     usermodules = []
-    postlist = postcrack(grouplist[0])
+    postlist = postcrack(blocks)
     outmess('Post-processing (stage 2)...\n', 0)
     postlist = postcrack2(postlist)
     return usermodules + postlist
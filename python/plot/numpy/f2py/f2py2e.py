@@ -114,6 +114,14 @@ Options:
   --include-paths <path1>:<path2>:...   Search include files from the given
                    directories.
 
+  --cache-dir <dirname>  Keep the signatures read from each fortran file in
+                   <dirname> and reuse them while the file and its include
+                   files are unchanged. Default is the value of the
+                   NPY_F2PY_CACHE_DIR environment variable, if set.
+
+  --jobs <n>       Read <n> fortran files at the same time, in separate
+                   processes. Default is 1.
+
   --help-link [..] List system resources found by system_info.py. See also
                    --link-<resource> switch below. [..] is optional list
                    of resources names. E.g. try 'f2py --help-link lapack_opt'.
@@ -176,6 +184,7 @@ http://cens.ioc.ee/projects/f2py2e/""" % (f2py_version, numpy_version)
 def scaninputline(inputline):
     files, skipfuncs, onlyfuncs, debug = [], [], [], []
     f, f2, f3, f5, f6, f7, f8, f9 = 1, 0, 0, 0, 0, 0, 0, 0
+    f10, f11 = 0, 0
     verbose = 1
     dolc = -1
     dolatexdoc = 0
@@ -183,6 +192,8 @@ def scaninputline(inputline):
     wrapfuncs = 1
     buildpath = '.'
     include_paths = []
+    cachedir = os.environ.get('NPY_F2PY_CACHE_DIR', '')
+    jobs = 1
     signsfile, modulename = None, None
     options = {'buildpath': buildpath,
                'coutput': None,
@@ -202,6 +213,10 @@ def scaninputline(inputline):
             dolc = 1
         elif l == '--build-dir':
             f6 = 1
+        elif l == '--cache-dir':
+            f10 = 1
+        elif l == '--jobs':
+            f11 = 1
         elif l == '--no-lower':
             dolc = 0
         elif l == '--quiet':
@@ -267,6 +282,16 @@ def scaninputline(inputline):
         elif f9:
             f9 = 0
             options["f2py_wrapper_output"] = l
+        elif f10:
+            f10 = 0
+            cachedir = l
+        elif f11:
+            f11 = 0
+            try:
+                jobs = int(l)
+            except ValueError:
+                errmess('Invalid number of jobs %s\n' % repr(l))
+                sys.exit()
         elif f == 1:
             try:
                 open(l).close()
@@ -311,6 +336,8 @@ def scaninputline(inputline):
     options['wrapfuncs'] = wrapfuncs
     options['buildpath'] = buildpath
     options['include_paths'] = include_paths
+    options['cachedir'] = cachedir
+    options['jobs'] = jobs
     return files, options
 
 
@@ -326,6 +353,8 @@ def callcrackfortran(files, options):
         crackfortran.onlyfuncs = options['onlyfuncs']
     crackfortran.include_paths[:] = options['include_paths']
     crackfortran.dolowercase = options['do-lower']
+    crackfortran.cachedir = options.get('cachedir', '')
+    crackfortran.numjobs = options.get('jobs', 1)
     postlist = crackfortran.crackfortran(files)
     if 'signsfile' in options:
         outmess('Saving signatures to file "%s"\n' % (options['signsfile']))
@@ -0,0 +1,95 @@
+from __future__ import division, absolute_import, print_function
+
+import os
+import shutil
+import tempfile
+
+from numpy.f2py import crackfortran, f2py2e
+from numpy.testing import run_module_suite, assert_, assert_equal
+
+
+def _path(*a):
+    return os.path.join(*((os.path.dirname(__file__),) + a))
+
+
+class TestCrackFiles(object):
+    sources = [_path('src', 'mixed', 'foo.f'),
+               _path('src', 'mixed', 'foo_fixed.f90'),
+               _path('src', 'mixed', 'foo_free.f90'),
+               _path('src', 'common', 'block.f')]
+
+    def setup(self):
+        self.cachedir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.cachedir)
+        crackfortran.reset_global_f2py_vars()
+
+    def crack(self, modulename, cachedir='', numjobs=1):
+        crackfortran.reset_global_f2py_vars()
+        crackfortran.verbose = 0
+        crackfortran.f77modulename = modulename
+        crackfortran.cachedir = cachedir
+        crackfortran.numjobs = numjobs
+        return crackfortran.crack2fortran(
+            crackfortran.crackfortran(self.sources))
+
+    def test_same_signatures(self):
+        for modulename in ['', 'mixed']:
+            expected = self.crack(modulename)
+            # the second run reads the cache
+            for i in range(2):
+                assert_equal(self.crack(modulename, self.cachedir), expected)
+            assert_equal(self.crack(modulename, numjobs=2), expected)
+
+    def build(self, *options):
+        # the C module of all the sources, without the generation date
+        crackfortran.verbose = 0
+        builddir = tempfile.mkdtemp(dir=self.cachedir)
+        f2py2e.run_main(['-m', 'mixed', '--lower', '--quiet',
+                         '--build-dir', builddir] + list(options) +
+                        self.sources)
+        with open(os.path.join(builddir, 'mixedmodule.c')) as f:
+            return [line for line in f if 'Generation date' not in line]
+
+    def test_same_module(self):
+        expected = self.build()
+        for name in ['bar11', 'initcb']:
+            assert_(any('f2py_rout_mixed_' + name in line
+                        for line in expected))
+        cachedir = os.path.join(self.cachedir, 'cache')
+        for i in range(2):
+            assert_equal(self.build('--cache-dir', cachedir), expected)
+        assert_equal(self.build('--jobs', '2'), expected)
+
+    def test_cache_invalidation(self):
+        src = os.path.join(self.cachedir, 'foo.f')
+        shutil.copy(self.sources[0], src)
+        self.sources = [src]
+        first = self.crack('', self.cachedir)
+        with open(src, 'a') as f:
+            f.write('      subroutine newsub(a)\n'
+                    '      integer a\n'
+                    '      end\n')
+        second = self.crack('', self.cachedir)
+        assert_('newsub' not in first)
+        assert_('newsub' in second)
+
+    def test_open_blocks(self):
+        # a block left open continues in the next file, which can then not
+        # be read on its own
+        src1 = os.path.join(self.cachedir, 'open.f90')
+        src2 = os.path.join(self.cachedir, 'close.f90')
+        with open(src1, 'w') as f:
+            f.write('module m\n')
+        with open(src2, 'w') as f:
+            f.write('integer :: i\nend module m\n')
+        self.sources = [src1, src2]
+        crackfortran.verbose = 0
+        crackfortran.cachedir = self.cachedir
+        assert_(crackfortran.crackfiles(self.sources) is None)
+        assert_equal(self.crack('', self.cachedir), self.crack(''))
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -5,6 +5,7 @@ from .info import __doc__
 
 from .fftpack import *
 from .helper import *
+from .convolution import *
 
 from numpy.testing import _numpy_tester
 test = _numpy_tester().test
@@ -0,0 +1,435 @@
+"""
+FFT based convolution - convolution.py
+
+Routines in this module:
+
+fftconvolve(a, v, mode='full')
+oaconvolve(a, v, mode='full', block_size=None, threads=1)
+choose_conv_method(a, v, mode='full')
+StreamingConvolver(v, block_size=None, threads=1)
+
+These are the backends of ``np.convolve(..., method=...)`` and
+``np.correlate(..., method=...)``.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+__all__ = ['fftconvolve', 'oaconvolve', 'choose_conv_method',
+           'StreamingConvolver']
+
+import math
+import operator
+
+from numpy.core import array, asarray, zeros, result_type, conjugate
+from .fftpack import fft, ifft, rfft, irfft, FFTPlan
+
+# Relative cost of one FFT butterfly compared to one multiply-add of the
+# direct method, for complex transforms.  Real transforms cost half of it.
+_FFT_COST_FACTOR = 12.0
+
+_METHODS = ('direct', 'fft', 'overlap-add')
+
+
+def _next_regular(n):
+    # Smallest 5-smooth number (2**i * 3**j * 5**k) that is >= n.  These are
+    # the lengths FFTPACK handles efficiently.
+    n = int(n)
+    if n <= 6:
+        return n
+    best = 2 ** (n - 1).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # Smallest power of two that brings p35 up to n.
+            p2 = 2 ** (-(-n // p35) - 1).bit_length()
+            candidate = p2 * p35
+            if candidate == n:
+                return n
+            best = min(best, candidate)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _fft_cost(n, real):
+    cost = _FFT_COST_FACTOR * n * max(math.log(n, 2), 1)
+    return cost / 2 if real else cost
+
+
+def _oa_block_size(n, m, real=True):
+    # FFT length for overlap-add that minimizes the cost per output sample.
+    # Every block yields nfft - m + 1 new samples, so the FFT must be
+    # comfortably longer than the filter; but there is no point in using a
+    # block longer than the whole result.
+    limit = _next_regular(n + m - 1)
+    best, best_cost = limit, None
+    nfft = _next_regular(2 * m)
+    while nfft < limit:
+        nblocks = -(-n // (nfft - m + 1))
+        cost = (2 * nblocks + 1) * _fft_cost(nfft, real)
+        if best_cost is None or cost < best_cost:
+            best, best_cost = nfft, cost
+        nfft = _next_regular(2 * nfft)
+    return best
+
+
+def _is_real(a, v):
+    return a.dtype.kind != 'c' and v.dtype.kind != 'c'
+
+
+def _costs(n, m, mode, real):
+    # Estimated costs of the three methods for a signal of length n >= m.
+    if mode == 'valid':
+        direct = (n - m + 1) * m
+    else:
+        direct = n * m
+    fft_cost = 3 * _fft_cost(_next_regular(n + m - 1), real)
+    nfft = _oa_block_size(n, m, real)
+    oa_cost = (2 * -(-n // (nfft - m + 1)) + 1) * _fft_cost(nfft, real)
+    return {'direct': direct, 'fft': fft_cost, 'overlap-add': oa_cost}
+
+
+def choose_conv_method(a, v, mode='full'):
+    """
+    Pick the fastest method for ``np.convolve(a, v, mode)``.
+
+    The choice is made from a cost model that compares the number of
+    multiply-adds of the direct method with the estimated work of a single
+    large FFT and of overlap-add with blocks of optimal length.
+
+    Parameters
+    ----------
+    a, v : array_like
+        One-dimensional input sequences.
+    mode : {'full', 'valid', 'same'}, optional
+        Refer to the `numpy.convolve` docstring.
+
+    Returns
+    -------
+    method : str
+        One of ``'direct'``, ``'fft'`` or ``'overlap-add'``.  Inputs that
+        are not floating point or complex always use ``'direct'`` so that
+        integer and object results stay exact.
+
+    See Also
+    --------
+    numpy.convolve, fftconvolve, oaconvolve
+
+    Examples
+    --------
+    >>> np.fft.choose_conv_method(np.ones(10), np.ones(3))
+    'direct'
+    >>> np.fft.choose_conv_method(np.ones(10**6), np.ones(5 * 10**4))
+    'overlap-add'
+
+    """
+    a, v = asarray(a), asarray(v)
+    if result_type(a, v).kind not in 'fc':
+        return 'direct'
+    n, m = max(a.size, v.size), min(a.size, v.size)
+    if m == 0:
+        return 'direct'
+    costs = _costs(n, m, _mode_name(mode), _is_real(a, v))
+    return min(_METHODS, key=costs.__getitem__)
+
+
+def _mode_name(mode):
+    # Accept the same spellings as numpy.convolve (names or 0, 1, 2).
+    try:
+        mode = operator.index(mode)
+    except TypeError:
+        try:
+            mode = mode.lower()[0]
+        except (AttributeError, IndexError):
+            pass
+    try:
+        return {0: 'valid', 1: 'same', 2: 'full',
+                'v': 'valid', 's': 'same', 'f': 'full'}[mode]
+    except (KeyError, TypeError):
+        raise ValueError("mode must be one of 'valid', 'same' or 'full'")
+
+
+def _check_inputs(a, v):
+    a, v = array(a, copy=False, ndmin=1), array(v, copy=False, ndmin=1)
+    if a.ndim != 1 or v.ndim != 1:
+        raise ValueError("object too deep for desired array")
+    if len(v) > len(a):
+        a, v = v, a
+    if len(a) == 0:
+        raise ValueError('a cannot be empty')
+    if len(v) == 0:
+        raise ValueError('v cannot be empty')
+    return a, v
+
+
+def _crop(full, n, m, mode, start=None):
+    # Slice the full convolution of lengths n >= m down to `mode`.
+    if mode == 'full':
+        return full
+    if mode == 'same':
+        if start is None:
+            start = (m - 1) // 2
+        return full[start:start + n]
+    return full[m - 1:n]
+
+
+def _full_fftconvolve(a, v):
+    real = _is_real(a, v)
+    size = len(a) + len(v) - 1
+    nfft = _next_regular(size)
+    if real:
+        return irfft(rfft(a, nfft) * rfft(v, nfft), nfft)[:size]
+    return ifft(fft(a, nfft) * fft(v, nfft))[:size]
+
+
+def _full_oaconvolve(a, v, nfft, spectrum, plans):
+    # Overlap-add: cut `a` into blocks of nfft - m + 1 samples, convolve
+    # each block with `v` by multiplying with its spectrum, and add the
+    # m - 1 sample tails onto the start of the following block.
+    n, m = len(a), len(v)
+    step = nfft - m + 1
+    nblocks = -(-n // step)
+    forward, inverse = plans
+    blocks = zeros((nblocks, step), dtype=a.dtype)
+    blocks.ravel()[:n] = a
+    y = inverse(forward(blocks) * spectrum)
+    out = zeros((nblocks + 1) * step, dtype=y.dtype)
+    out[:nblocks * step] = y[:, :step].ravel()
+    tails = zeros((nblocks, step), dtype=y.dtype)
+    tails[:, :m - 1] = y[:, step:nfft]
+    out[step:] += tails.ravel()
+    return out[:n + m - 1]
+
+
+def _oa_setup(v, nfft, real, threads):
+    dtype = float if real else complex
+    forward = FFTPlan(nfft, dtype=dtype, threads=threads)
+    inverse = FFTPlan(nfft, dtype=dtype, inverse=True, threads=threads)
+    return forward(v), (forward, inverse)
+
+
+def fftconvolve(a, v, mode='full'):
+    """
+    Convolve two one-dimensional sequences using a single FFT.
+
+    The result equals ``np.convolve(a, v, mode)`` up to floating point
+    round-off, but takes O((N+M) log(N+M)) instead of O(N*M) operations.
+
+    Parameters
+    ----------
+    a : (N,) array_like
+        First one-dimensional input array.
+    v : (M,) array_like
+        Second one-dimensional input array.
+    mode : {'full', 'valid', 'same'}, optional
+        Refer to the `numpy.convolve` docstring.
+
+    Returns
+    -------
+    out : ndarray
+        Discrete, linear convolution of `a` and `v`.  The result is real if
+        both inputs are real.
+
+    See Also
+    --------
+    numpy.convolve, oaconvolve
+
+    Examples
+    --------
+    >>> np.fft.fftconvolve([1, 2, 3], [0, 1, 0.5])
+    array([ 0. ,  1. ,  2.5,  4. ,  1.5])
+
+    """
+    a, v = _check_inputs(a, v)
+    full = _full_fftconvolve(a, v)
+    return _crop(full, len(a), len(v), _mode_name(mode))
+
+
+def oaconvolve(a, v, mode='full', block_size=None, threads=1):
+    """
+    Convolve two one-dimensional sequences using overlap-add.
+
+    The longer sequence is cut into blocks that are each convolved with the
+    shorter one through FFTs of length `block_size`.  This is much cheaper
+    than `fftconvolve` when one sequence is far longer than the other.
+
+    Parameters
+    ----------
+    a : (N,) array_like
+        First one-dimensional input array.
+    v : (M,) array_like
+        Second one-dimensional input array.
+    mode : {'full', 'valid', 'same'}, optional
+        Refer to the `numpy.convolve` docstring.
+    block_size : int, optional
+        FFT length used per block.  Must be at least ``2 * min(N, M) - 1``.
+        By default the length with the lowest estimated cost is used.
+    threads : int, optional
+        Number of threads the block transforms are distributed over.
+        Default is 1.
+
+    Returns
+    -------
+    out : ndarray
+        Discrete, linear convolution of `a` and `v`.  The result is real if
+        both inputs are real.
+
+    See Also
+    --------
+    numpy.convolve, fftconvolve, StreamingConvolver
+
+    Examples
+    --------
+    >>> np.fft.oaconvolve([1, 2, 3, 4, 5, 6], [1, 1], block_size=4)
+    array([  1.,   3.,   5.,   7.,   9.,  11.,   6.])
+
+    """
+    a, v = _check_inputs(a, v)
+    n, m = len(a), len(v)
+    real = _is_real(a, v)
+    if block_size is None:
+        block_size = _oa_block_size(n, m, real)
+    else:
+        block_size = operator.index(block_size)
+        if block_size < 2 * m - 1:
+            raise ValueError("block_size must be at least %d, got %d"
+                             % (2 * m - 1, block_size))
+    if not real:
+        a = a.astype(complex)
+    spectrum, plans = _oa_setup(v, block_size, real, threads)
+    full = _full_oaconvolve(a, v, block_size, spectrum, plans)
+    return _crop(full, n, m, _mode_name(mode))
+
+
+def _convolve(a, v, mode, method, conj_reverse=False):
+    # Backend of np.convolve and np.correlate for the FFT based methods.
+    # With conj_reverse the second sequence is conjugated and reversed,
+    # which turns the convolution into a correlation.
+    a, v = array(a, copy=False, ndmin=1), array(v, copy=False, ndmin=1)
+    swapped = len(v) > len(a)
+    if conj_reverse:
+        v = conjugate(v[::-1])
+    n, m = max(len(a), len(v)), min(len(a), len(v))
+    mode = _mode_name(mode)
+    start = None
+    if conj_reverse and swapped:
+        start = m // 2
+    dtype = result_type(a, v)
+    if method == 'fft':
+        full = fftconvolve(a, v)
+    else:
+        full = oaconvolve(a, v)
+    return _crop(full, n, m, mode, start).astype(dtype, copy=False)
+
+
+class StreamingConvolver(object):
+    """
+    Convolve a signal that arrives in chunks with a fixed filter.
+
+    Every call to `process` returns as many output samples as it was
+    given, and `flush` returns the remaining ``len(v) - 1`` samples, so
+    that concatenating all outputs gives ``np.convolve(signal, v)``.
+    Internally the chunks are convolved by overlap-add, reusing the
+    spectrum of `v`.
+
+    Parameters
+    ----------
+    v : (M,) array_like
+        The filter.
+    block_size : int, optional
+        FFT length used per block.  Must be at least ``2 * M - 1``.  By
+        default a length suited to the filter is chosen.
+    threads : int, optional
+        Number of threads the block transforms are distributed over.
+        Default is 1.
+
+    Examples
+    --------
+    >>> conv = np.fft.StreamingConvolver([1, 1])
+    >>> conv.process([1, 2, 3])
+    array([ 1.,  3.,  5.])
+    >>> conv.process([4])
+    array([ 7.])
+    >>> conv.flush()
+    array([ 4.])
+
+    """
+
+    def __init__(self, v, block_size=None, threads=1):
+        v = array(v, copy=True, ndmin=1)
+        if v.ndim != 1:
+            raise ValueError("object too deep for desired array")
+        if len(v) == 0:
+            raise ValueError('v cannot be empty')
+        m = len(v)
+        if block_size is None:
+            block_size = _oa_block_size(8 * m, m, v.dtype.kind != 'c')
+        block_size = operator.index(block_size)
+        if block_size < 2 * m - 1:
+            raise ValueError("block_size must be at least %d, got %d"
+                             % (2 * m - 1, block_size))
+        self.v = v
+        self.block_size = block_size
+        self.threads = threads
+        self._setups = {}
+        self._carry = None
+
+    def _setup(self, real):
+        # The spectrum of v for real and complex chunks, computed once.
+        try:
+            return self._setups[real]
+        except KeyError:
+            setup = _oa_setup(self.v, self.block_size, real, self.threads)
+            self._setups[real] = setup
+            return setup
+
+    def process(self, chunk):
+        """
+        Feed the next chunk of the signal.
+
+        Parameters
+        ----------
+        chunk : array_like
+            One-dimensional chunk of the signal; it may be empty.
+
+        Returns
+        -------
+        out : ndarray
+            The next ``len(chunk)`` samples of the full convolution.
+        """
+        chunk = array(chunk, copy=False, ndmin=1)
+        if chunk.ndim != 1:
+            raise ValueError("object too deep for desired array")
+        m = len(self.v)
+        real = _is_real(chunk, self.v)
+        if not real:
+            chunk = chunk.astype(complex)
+        if len(chunk):
+            spectrum, plans = self._setup(real)
+            y = _full_oaconvolve(chunk, self.v, self.block_size,
+                                 spectrum, plans)
+        else:
+            y = zeros(m - 1, dtype=float if real else complex)
+        if self._carry is not None:
+            y = y.astype(result_type(y, self._carry), copy=False)
+            y[:m - 1] += self._carry
+        self._carry = y[len(chunk):].copy()
+        return y[:len(chunk)]
+
+    def flush(self):
+        """
+        Return the last ``len(v) - 1`` output samples and reset the state.
+
+        Returns
+        -------
+        out : ndarray
+            The tail of the full convolution.
+        """
+        if self._carry is None:
+            carry = zeros(len(self.v) - 1,
+                          dtype=float if self.v.dtype.kind != 'c' else complex)
+        else:
+            carry = self._carry
+        self._carry = None
+        return carry
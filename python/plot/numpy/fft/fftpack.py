@@ -17,6 +17,8 @@ fft2(a, s=None, axes=(-2,-1))
 ifft2(a, s=None, axes=(-2, -1))
 rfft2(a, s=None, axes=(-2,-1))
 irfft2(a, s=None, axes=(-2, -1))
+FFTPlan(shape, axes=None, dtype=complex, inverse=False, norm=None, threads=1)
+cache_info()
 
 i = inverse transform
 r = transform of purely real data
@@ -33,10 +35,17 @@ version of the FFTPACK routines.
 from __future__ import division, absolute_import, print_function
 
 __all__ = ['fft', 'ifft', 'rfft', 'irfft', 'hfft', 'ihfft', 'rfftn',
-           'irfftn', 'rfft2', 'irfft2', 'fft2', 'ifft2', 'fftn', 'ifftn']
+           'irfftn', 'rfft2', 'irfft2', 'fft2', 'ifft2', 'fftn', 'ifftn',
+           'FFTPlan', 'cache_info']
 
-from numpy.core import (array, asarray, zeros, swapaxes, shape, conjugate,
-                        take, sqrt)
+import operator
+import sys
+import threading
+
+from numpy.core import (array, asarray, zeros, empty, swapaxes, shape,
+                        conjugate, take, sqrt)
+from numpy.core.multiarray import normalize_axis_index
+from numpy.core.numerictypes import issubdtype, complexfloating
 from . import fftpack_lite as fftpack
 from .helper import _FFTCache
 
@@ -64,6 +73,24 @@ def _raw_fft(a, n=None, axis=-1, init_function=fftpack.cffti,
     if wsave is None:
         wsave = init_function(n)
 
+    a = _crop_or_pad(a, n, axis)
+
+    if axis != -1:
+        a = swapaxes(a, axis, -1)
+    r = work_function(a, wsave)
+    if axis != -1:
+        r = swapaxes(r, axis, -1)
+
+    # As soon as we put wsave back into the cache, another thread could pick it
+    # up and start using it, so we must not do this until after we're
+    # completely done using it ourselves.
+    fft_cache.put_twiddle_factors(n, wsave)
+
+    return r
+
+
+def _crop_or_pad(a, n, axis):
+    # Crop or zero-pad `a` along `axis` so that it has length `n`.
     if a.shape[axis] != n:
         s = list(a.shape)
         if s[axis] > n:
@@ -77,19 +104,74 @@ def _raw_fft(a, n=None, axis=-1, init_function=fftpack.cffti,
             z = zeros(s, a.dtype.char)
             z[index] = a
             a = z
+    return a
 
-    if axis != -1:
-        a = swapaxes(a, axis, -1)
-    r = work_function(a, wsave)
-    if axis != -1:
-        r = swapaxes(r, axis, -1)
-
-    # As soon as we put wsave back into the cache, another thread could pick it
-    # up and start using it, so we must not do this until after we're
-    # completely done using it ourselves.
-    fft_cache.put_twiddle_factors(n, wsave)
 
-    return r
+def _fit_to_shape(a, s, axes, dtype, copy=True):
+    # Return an array of `dtype` holding `a` cropped or zero-padded to
+    # length s[i] along each axis in `axes`.  This is the only full-size
+    # allocation the N-dimensional transforms need.  With copy=False `a`
+    # itself is returned if it already fits.
+    shape = list(a.shape)
+    index = [slice(None)]*a.ndim
+    pad = False
+    for n, axis in zip(s, axes):
+        shape[axis] = n
+        index[axis] = slice(0, min(n, a.shape[axis]))
+        pad = pad or n > a.shape[axis]
+    if not copy and a.dtype == dtype and list(a.shape) == shape:
+        return a
+    index = tuple(index)
+    out = (zeros if pad else empty)(shape, dtype)
+    out[index] = a[index]
+    return out
+
+
+def _fft_lanes(a, out, axis, init_function, work_function, fft_cache,
+               threads=1):
+    # Transform every 1-D lane of `a` along `axis` and store the result in
+    # `out`, which may be `a` itself.  The lanes are split along the first
+    # remaining dimension into at most `threads` chunks, each transformed in
+    # its own thread with its own twiddle factors (the C code does not hold
+    # the GIL while transforming).  Only chunk-sized temporaries are made.
+    src = swapaxes(a, axis, -1)
+    dst = swapaxes(out, axis, -1)
+    n = src.shape[-1]
+
+    def transform(lo, hi):
+        wsave = fft_cache.pop_twiddle_factors(n)
+        if wsave is None:
+            wsave = init_function(n)
+        dst[lo:hi] = work_function(src[lo:hi], wsave)
+        fft_cache.put_twiddle_factors(n, wsave)
+
+    if src.ndim == 1 or threads <= 1 or src.shape[0] < 2:
+        wsave = fft_cache.pop_twiddle_factors(n)
+        if wsave is None:
+            wsave = init_function(n)
+        dst[...] = work_function(src, wsave)
+        fft_cache.put_twiddle_factors(n, wsave)
+        return out
+
+    nchunks = min(threads, src.shape[0])
+    edges = [src.shape[0] * i // nchunks for i in range(nchunks + 1)]
+    errors = []
+
+    def worker(lo, hi):
+        try:
+            transform(lo, hi)
+        except BaseException:
+            errors.append(sys.exc_info()[1])
+
+    workers = [threading.Thread(target=worker, args=(lo, hi))
+               for lo, hi in zip(edges[:-1], edges[1:])]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    if errors:
+        raise errors[0]
+    return out
 
 
 def _unitary(norm):
@@ -632,6 +714,11 @@ def _cook_nd_args(a, s=None, axes=None, invreal=0):
 def _raw_fftnd(a, s=None, axes=None, function=fft, norm=None):
     a = asarray(a)
     s, axes = _cook_nd_args(a, s, axes)
+    axes = [normalize_axis_index(axis, a.ndim) for axis in axes]
+    if axes and len(set(axes)) == len(axes):
+        # Transform all axes in place on a single output array.
+        plan = FFTPlan(s, axes, complex, inverse=function is ifft, norm=norm)
+        return plan(a)
     itl = list(range(len(axes)))
     itl.reverse()
     for ii in itl:
@@ -1268,3 +1355,197 @@ def irfft2(a, s=None, axes=(-2, -1), norm=None):
     """
 
     return irfftn(a, s, axes, norm)
+
+
+class FFTPlan(object):
+    """
+    Reusable plan for repeated N-dimensional discrete Fourier transforms.
+
+    A plan fixes the transform lengths, axes, kind of transform and
+    normalization once, so that it can be applied to many arrays of the
+    same layout.  All dimensions that are not transformed are treated as a
+    batch of independent transforms which can be distributed over several
+    threads.  The axes are transformed one after the other in place on a
+    single output array, so no full-size temporaries are created between
+    axes.
+
+    Parameters
+    ----------
+    shape : int or sequence of ints
+        Length of the transform along each axis in `axes`.  This is the
+        length of the signal in the time domain, like the `n` argument of
+        `rfft` and `irfft`.  Inputs are cropped or zero-padded to it.
+    axes : int or sequence of ints, optional
+        Axes over which to compute the transform.  Defaults to the last
+        ``len(shape)`` axes.  Repeated axes are not allowed.
+    dtype : {complex, float}, optional
+        Type of the time domain data.  A complex type plans the `fftn` /
+        `ifftn` pair, a real type the `rfftn` / `irfftn` pair.  Default is
+        complex.
+    inverse : bool, optional
+        Plan the inverse transform instead of the forward one.  Default is
+        False.
+    norm : {None, "ortho"}, optional
+        Normalization mode (see `numpy.fft`). Default is None.
+    threads : int, optional
+        Maximum number of threads the batch of transforms is distributed
+        over.  Default is 1.
+
+    See Also
+    --------
+    fftn, ifftn, rfftn, irfftn, cache_info
+
+    Notes
+    -----
+    The twiddle factors are shared with the module functions through the
+    same caches, one set per thread, so creating a plan is cheap and the
+    first execution already reuses factors computed by earlier calls.
+    A plan holds no mutable state and may be executed from several threads
+    at once.
+
+    Examples
+    --------
+    >>> x = np.random.random((1000, 256))
+    >>> plan = np.fft.FFTPlan(256, dtype=float, threads=4)
+    >>> np.allclose(plan(x), np.fft.rfft(x))
+    True
+    >>> inv = np.fft.FFTPlan(256, dtype=float, inverse=True, threads=4)
+    >>> np.allclose(inv(plan(x)), x)
+    True
+
+    """
+
+    def __init__(self, shape, axes=None, dtype=complex, inverse=False,
+                 norm=None, threads=1):
+        try:
+            shape = [operator.index(shape)]
+        except TypeError:
+            shape = [operator.index(n) for n in shape]
+        for n in shape:
+            if n < 1:
+                raise ValueError(
+                    "Invalid number of FFT data points (%d) specified." % n)
+        if axes is None:
+            axes = list(range(-len(shape), 0))
+        else:
+            try:
+                axes = [operator.index(axes)]
+            except TypeError:
+                axes = [operator.index(axis) for axis in axes]
+        if len(shape) != len(axes):
+            raise ValueError("Shape and axes have different lengths.")
+        threads = operator.index(threads)
+        if threads < 1:
+            raise ValueError("threads must be at least 1, got %d" % threads)
+
+        self.shape = tuple(shape)
+        self.axes = tuple(axes)
+        self.real = not issubdtype(dtype, complexfloating)
+        self.inverse = bool(inverse)
+        self.norm = norm
+        self.threads = threads
+        self._unitary = _unitary(norm)
+
+        size = 1
+        for n in self.shape:
+            size *= n
+        self._scale = None
+        if self._unitary:
+            self._scale = 1 / sqrt(size)
+        elif self.inverse:
+            self._scale = 1 / size
+
+    def __repr__(self):
+        return ("FFTPlan(shape=%r, axes=%r, dtype=%s, inverse=%r, norm=%r, "
+                "threads=%d)" % (self.shape, self.axes,
+                                 'float' if self.real else 'complex',
+                                 self.inverse, self.norm, self.threads))
+
+    def _normalized_axes(self, ndim):
+        axes = [normalize_axis_index(axis, ndim) for axis in self.axes]
+        if len(set(axes)) != len(axes):
+            raise ValueError("FFTPlan axes must not be repeated.")
+        return axes
+
+    def _complex_lanes(self, a, axes):
+        # In place complex transform along all given axes.
+        work = fftpack.cfftb if self.inverse else fftpack.cfftf
+        for axis in reversed(axes):
+            _fft_lanes(a, a, axis, fftpack.cffti, work, _fft_cache,
+                       self.threads)
+        return a
+
+    def __call__(self, a):
+        """
+        Execute the plan on `a`.
+
+        Parameters
+        ----------
+        a : array_like
+            Input array.  It is cropped or zero-padded to the planned shape
+            along the planned axes and is never modified.
+
+        Returns
+        -------
+        out : ndarray
+            The transformed array.  It is complex except for the inverse of
+            a real plan.
+        """
+        a = asarray(a)
+        axes = self._normalized_axes(a.ndim)
+        s = list(self.shape)
+
+        if not self.real:
+            out = self._complex_lanes(_fit_to_shape(a, s, axes, complex),
+                                      axes)
+        elif not self.inverse:
+            last, n = axes[-1], s[-1]
+            x = _fit_to_shape(a, s, axes, float, copy=False)
+            shp = list(x.shape)
+            shp[last] = n//2 + 1
+            out = empty(shp, complex)
+            _fft_lanes(x, out, last, fftpack.rffti, fftpack.rfftf,
+                       _real_fft_cache, self.threads)
+            self._complex_lanes(out, axes[:-1])
+        else:
+            last, n = axes[-1], s[-1]
+            # Only the first n//2 + 1 frequencies enter the real inverse.
+            m = min(n//2 + 1, a.shape[last])
+            x = _fit_to_shape(a, s[:-1] + [m], axes, complex)
+            self._complex_lanes(x, axes[:-1])
+            x = _crop_or_pad(x, n, last)
+            out = empty(x.shape, float)
+            _fft_lanes(x, out, last, fftpack.rffti, fftpack.rfftb,
+                       _real_fft_cache, self.threads)
+
+        if self._scale is not None:
+            out *= self._scale
+        return out
+
+    execute = __call__
+
+
+def cache_info():
+    """
+    Return usage statistics of the twiddle factor caches.
+
+    All transforms in `numpy.fft`, including `FFTPlan` executions, look up
+    their twiddle factors in one cache for complex and one for real
+    transforms.
+
+    Returns
+    -------
+    info : dict
+        ``{'complex': stats, 'real': stats}`` where each ``stats`` is a
+        dictionary with the keys ``hits``, ``misses``, ``hit_rate``,
+        ``item_count``, ``array_count`` and ``nbytes``.
+
+    Examples
+    --------
+    >>> info = np.fft.cache_info()
+    >>> sorted(info['complex'])
+    ['array_count', 'hit_rate', 'hits', 'item_count', 'misses', 'nbytes']
+
+    """
+    return {'complex': _fft_cache.cache_info(),
+            'real': _real_fft_cache.cache_info()}
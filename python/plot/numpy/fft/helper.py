@@ -247,12 +247,16 @@ class _FFTCache(object):
     never be completely cleared - at least one item will remain and a single
     large item can cause the cache to retain several smaller items even if the
     given maximum cache size has been exceeded.
+
+    Every lookup is counted as either a hit or a miss; see `cache_info`.
     """
     def __init__(self, max_size_in_mb, max_item_count):
         self._max_size_in_bytes = max_size_in_mb * 1024 ** 2
         self._max_item_count = max_item_count
         self._dict = collections.OrderedDict()
         self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
 
     def put_twiddle_factors(self, n, factors):
         """
@@ -299,7 +303,9 @@ class _FFTCache(object):
         """
         with self._lock:
             if n not in self._dict or not self._dict[n]:
+                self._misses += 1
                 return None
+            self._hits += 1
             # Pop + later add to move it to the end for LRU behavior.
             all_values = self._dict.pop(n)
             value = all_values.pop()
@@ -308,6 +314,31 @@ class _FFTCache(object):
                 self._dict[n] = all_values
             return value
 
+    def cache_info(self):
+        """
+        Return usage statistics of the cache.
+
+        Returns
+        -------
+        info : dict
+            Dictionary with the number of ``hits`` and ``misses`` of
+            `pop_twiddle_factors`, the resulting ``hit_rate`` (0.0 if the
+            cache has never been queried), the number of cached lengths
+            ``item_count``, the total number of cached arrays ``array_count``
+            and the memory they occupy in ``nbytes``.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'item_count': len(self._dict),
+                'array_count': sum(len(_i) for _i in self._dict.values()),
+                'nbytes': sum(_j.nbytes for _i in self._dict.values()
+                              for _j in _i),
+                }
+
     def _prune_cache(self):
         # Always keep at least one item.
         while len(self._dict) > 1 and (
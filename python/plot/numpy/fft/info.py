@@ -39,6 +39,26 @@ Hermitian FFTs
    hfft      Hermitian discrete Fourier transform.
    ihfft     Inverse Hermitian discrete Fourier transform.
 
+Plans
+-----
+
+.. autosummary::
+   :toctree: generated/
+
+   FFTPlan    Reusable, multi-threaded plan for batches of transforms.
+   cache_info Usage statistics of the twiddle factor caches.
+
+Convolution
+-----------
+
+.. autosummary::
+   :toctree: generated/
+
+   fftconvolve        Convolution through a single FFT.
+   oaconvolve         Convolution through overlap-add of FFT blocks.
+   choose_conv_method Fastest method for `numpy.convolve`.
+   StreamingConvolver Overlap-add convolution of chunked input.
+
 Helper routines
 ---------------
 
@@ -0,0 +1,112 @@
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+from numpy.random import random
+from numpy.testing import (
+        run_module_suite, assert_array_almost_equal, assert_equal,
+        assert_raises,
+        )
+from numpy.fft.convolution import _next_regular
+
+
+class TestNextRegular(object):
+
+    def test_values(self):
+        assert_equal([_next_regular(n) for n in range(1, 18)],
+                     [1, 2, 3, 4, 5, 6, 8, 8, 9, 10, 12, 12, 15, 15, 15, 16,
+                      18])
+        assert_equal(_next_regular(1001), 1024)
+        assert_equal(_next_regular(2 ** 20 + 1), 1049760)
+
+
+class TestFFTConvolve(object):
+
+    def test_modes(self):
+        a = random(100)
+        v = random(13) + 1j*random(13)
+        for mode in ['full', 'same', 'valid']:
+            assert_array_almost_equal(np.fft.fftconvolve(a, v, mode),
+                                      np.convolve(a, v, mode, 'direct'))
+            assert_array_almost_equal(np.fft.fftconvolve(v, a, mode),
+                                      np.convolve(v, a, mode, 'direct'))
+
+    def test_real(self):
+        assert_equal(np.fft.fftconvolve([1, 2, 3], [0, 1, 0.5]).dtype,
+                     np.float64)
+
+    def test_empty(self):
+        assert_raises(ValueError, np.fft.fftconvolve, [], [1])
+
+
+class TestOAConvolve(object):
+
+    def test_modes(self):
+        a = random(1000)
+        v = random(50)
+        for mode in ['full', 'same', 'valid']:
+            for block_size in [None, 99, 128, 1500]:
+                assert_array_almost_equal(
+                    np.fft.oaconvolve(a, v, mode, block_size, threads=2),
+                    np.convolve(a, v, mode, 'direct'))
+
+    def test_complex(self):
+        a = random(300) + 1j*random(300)
+        v = random(20)
+        assert_array_almost_equal(np.fft.oaconvolve(v, a),
+                                  np.convolve(a, v, method='direct'))
+
+    def test_block_size(self):
+        assert_raises(ValueError, np.fft.oaconvolve, random(100), random(10),
+                      block_size=18)
+
+
+class TestChooseConvMethod(object):
+
+    def test_choice(self):
+        assert_equal(np.fft.choose_conv_method(random(10), random(3)),
+                     'direct')
+        assert_equal(np.fft.choose_conv_method(np.arange(10 ** 5),
+                                               np.arange(10 ** 3)), 'direct')
+        assert_equal(np.fft.choose_conv_method(random(10 ** 5),
+                                               random(10 ** 3)),
+                     'overlap-add')
+        assert_equal(np.fft.choose_conv_method(random(3000), random(3000)),
+                     'fft')
+
+
+class TestStreamingConvolver(object):
+
+    def test_chunks(self):
+        a = random(1000)
+        v = random(37)
+        conv = np.fft.StreamingConvolver(v)
+        edges = [0, 1, 10, 10, 400, 401, 1000]
+        out = [conv.process(a[lo:hi]) for lo, hi in zip(edges[:-1], edges[1:])]
+        for chunk, lo, hi in zip(out, edges[:-1], edges[1:]):
+            assert_equal(len(chunk), hi - lo)
+        out.append(conv.flush())
+        assert_array_almost_equal(np.concatenate(out), np.convolve(a, v))
+
+        # The state is reset by flush.
+        out = [conv.process(a[:500]), conv.process(a[500:]), conv.flush()]
+        assert_array_almost_equal(np.concatenate(out), np.convolve(a, v))
+
+    def test_complex(self):
+        # Real and complex chunks can be mixed.
+        a = random(100) + 1j*random(100)
+        a[3:50] = a[3:50].real
+        v = random(5)
+        conv = np.fft.StreamingConvolver(v, block_size=16)
+        out = [conv.process(a[:3]), conv.process(a[3:50].real),
+               conv.process(a[50:]), conv.flush()]
+        assert_array_almost_equal(np.concatenate(out),
+                                  np.convolve(a, v, method='direct'))
+
+    def test_invalid(self):
+        assert_raises(ValueError, np.fft.StreamingConvolver, [])
+        assert_raises(ValueError, np.fft.StreamingConvolver, [1, 2, 3],
+                      block_size=4)
+
+
+if __name__ == "__main__":
+    run_module_suite()
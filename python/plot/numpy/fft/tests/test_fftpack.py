@@ -4,7 +4,7 @@ import numpy as np
 from numpy.random import random
 from numpy.testing import (
         run_module_suite, assert_array_almost_equal, assert_array_equal,
-        assert_raises,
+        assert_raises, assert_,
         )
 import threading
 import sys
@@ -147,6 +147,78 @@ class TestFFT1D(object):
                     assert_array_almost_equal(x_norm,
                                               np.linalg.norm(tmp))
 
+class TestFFTPlan(object):
+
+    def test_complex_1d(self):
+        x = random((20, 30)) + 1j*random((20, 30))
+        for norm in [None, 'ortho']:
+            for threads in [1, 3]:
+                plan = np.fft.FFTPlan(30, norm=norm, threads=threads)
+                assert_array_almost_equal(plan(x), np.fft.fft(x, norm=norm))
+                iplan = np.fft.FFTPlan(30, inverse=True, norm=norm,
+                                       threads=threads)
+                assert_array_almost_equal(iplan(plan(x)), x)
+
+    def test_axis_and_length(self):
+        x = random((20, 30)) + 1j*random((20, 30))
+        for n in [10, 30, 45]:
+            plan = np.fft.FFTPlan(n, axes=0, threads=4)
+            assert_array_almost_equal(plan(x), np.fft.fft(x, n, axis=0))
+
+    def test_complex_nd(self):
+        x = random((10, 20, 6)) + 1j*random((10, 20, 6))
+        plan = np.fft.FFTPlan((12, 4), axes=(0, 2), threads=3)
+        assert_array_almost_equal(plan(x),
+                                  np.fft.fftn(x, (12, 4), axes=(0, 2)))
+        plan = np.fft.FFTPlan((10, 20, 6), inverse=True, norm='ortho')
+        assert_array_almost_equal(plan(x), np.fft.ifftn(x, norm='ortho'))
+
+    def test_real(self):
+        x = random((16, 30))
+        for norm in [None, 'ortho']:
+            for n in [30, 31]:
+                plan = np.fft.FFTPlan(n, dtype=float, norm=norm, threads=4)
+                assert_array_almost_equal(plan(x), np.fft.rfft(x, n,
+                                                               norm=norm))
+                iplan = np.fft.FFTPlan(n, dtype=float, inverse=True,
+                                       norm=norm, threads=4)
+                y = np.fft.rfft(x, n, norm=norm)
+                assert_array_almost_equal(iplan(y),
+                                          np.fft.irfft(y, n, norm=norm))
+
+    def test_real_nd(self):
+        x = random((8, 10, 12))
+        plan = np.fft.FFTPlan(x.shape, dtype=float, threads=2)
+        assert_array_almost_equal(plan(x), np.fft.rfftn(x))
+        iplan = np.fft.FFTPlan(x.shape, dtype=float, inverse=True, threads=2)
+        assert_array_almost_equal(iplan(plan(x)), x)
+
+    def test_input_unchanged(self):
+        x = random((4, 8)) + 1j*random((4, 8))
+        x_copy = x.copy()
+        np.fft.FFTPlan(x.shape, threads=2)(x)
+        assert_array_equal(x, x_copy)
+
+    def test_invalid(self):
+        assert_raises(ValueError, np.fft.FFTPlan, 0)
+        assert_raises(ValueError, np.fft.FFTPlan, (4, 4), axes=0)
+        assert_raises(ValueError, np.fft.FFTPlan, 4, norm='bad')
+        assert_raises(ValueError, np.fft.FFTPlan, 4, threads=0)
+        plan = np.fft.FFTPlan((4, 4), axes=(0, -2))
+        assert_raises(ValueError, plan, np.ones((4, 4)))
+        plan = np.fft.FFTPlan(4, axes=2)
+        assert_raises(np.AxisError, plan, np.ones((4, 4)))
+
+    def test_cache_info(self):
+        np.fft.fft(np.ones(17))
+        before = np.fft.cache_info()['complex']
+        np.fft.fft(np.ones(17))
+        after = np.fft.cache_info()['complex']
+        assert_(after['hits'] == before['hits'] + 1)
+        assert_(after['nbytes'] > 0)
+        assert_(0 < after['hit_rate'] <= 1)
+
+
 class TestFFTThreadSafe(object):
     threads = 16
     input_shape = (800, 200)
@@ -185,6 +257,10 @@ class TestFFTThreadSafe(object):
         a = np.ones(self.input_shape) * 1+0j
         self._test_mtsame(np.fft.irfft, a)
 
+    def test_plan(self):
+        a = np.ones(self.input_shape) * 1+0j
+        self._test_mtsame(np.fft.FFTPlan(self.input_shape[1], threads=4), a)
+
 
 if __name__ == "__main__":
     run_module_suite()
@@ -7,7 +7,7 @@ from __future__ import division, absolute_import, print_function
 
 import numpy as np
 from numpy.testing import (
-        run_module_suite, assert_array_almost_equal, assert_equal,
+        run_module_suite, assert_array_almost_equal, assert_equal, assert_,
         )
 from numpy import fft
 from numpy import pi
@@ -105,6 +105,24 @@ class TestFFTCache(object):
                                   np.zeros(2, dtype=np.float32))
         assert_equal(len(c._dict), 2)
 
+    def test_cache_info(self):
+        c = _FFTCache(max_size_in_mb=1, max_item_count=4)
+        info = c.cache_info()
+        assert_equal(info['hit_rate'], 0.0)
+        assert_equal(info['nbytes'], 0)
+
+        assert_(c.pop_twiddle_factors(1) is None)
+        c.put_twiddle_factors(1, np.ones(2, dtype=np.float32))
+        c.put_twiddle_factors(1, np.ones(2, dtype=np.float32))
+        c.pop_twiddle_factors(1)
+        info = c.cache_info()
+        assert_equal(info['hits'], 1)
+        assert_equal(info['misses'], 1)
+        assert_equal(info['hit_rate'], 0.5)
+        assert_equal(info['item_count'], 1)
+        assert_equal(info['array_count'], 1)
+        assert_equal(info['nbytes'], 8)
+
     def test_automatic_pruning(self):
         # That's around 2600 single precision samples.
         c = _FFTCache(max_size_in_mb=0.01, max_item_count=4)
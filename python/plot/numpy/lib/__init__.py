@@ -20,6 +20,8 @@ from .polynomial import *
 #import convertcode
 from .utils import *
 from .arraysetops import *
+from .grouping import *
+from .rolling import *
 from .npyio import *
 from .financial import *
 from .arrayterator import Arrayterator
@@ -40,6 +42,8 @@ __all__ += arraypad.__all__
 __all__ += polynomial.__all__
 __all__ += utils.__all__
 __all__ += arraysetops.__all__
+__all__ += grouping.__all__
+__all__ += rolling.__all__
 __all__ += npyio.__all__
 __all__ += financial.__all__
 __all__ += nanfunctions.__all__
@@ -6,14 +6,28 @@ without having to read it into memory. The `Arrayterator` class wraps
 an array object, and when iterated it will return sub-arrays with at most
 a user-specified number of elements.
 
+The blocks can follow the storage order of the array, be read ahead by a
+background thread and be processed by a pool of worker threads, so that
+the reads of a file-based array overlap with the computations.
+
 """
 from __future__ import division, absolute_import, print_function
 
+import mmap
+import sys
+import threading
+from collections import deque
 from operator import mul
 from functools import reduce
 
+import numpy as np
 from numpy.compat import long
 
+if sys.version_info[0] >= 3:
+    import queue
+else:
+    import Queue as queue
+
 __all__ = ['Arrayterator']
 
 
@@ -39,11 +53,29 @@ class Arrayterator(object):
         data that will be read into memory is `buf_size` elements.
         Default is None, which will read as many element as possible
         into memory.
+    order : {'C', 'F', 'K'}, optional
+        Order in which the blocks are taken.  'C' (default) moves fastest
+        along the last axis, 'F' along the first one, and 'K' follows the
+        order of the strides of `var` if it has any, so that every block
+        is a contiguous range of a contiguous file-based array.
+
+        .. versionadded:: 1.15.0
+    prefetch : int, optional
+        Number of blocks read ahead by a background thread.  Default is 0,
+        which reads every block when it is requested.  With prefetching,
+        the blocks are in-memory copies rather than views of `var`, and
+        the pages of the next block of a `memmap` are requested from the
+        operating system in advance where ``mmap.madvise`` is available.
+        Up to ``prefetch + 1`` blocks are held in memory at a time.
+
+        .. versionadded:: 1.15.0
 
     Attributes
     ----------
     var
     buf_size
+    order
+    prefetch
     start
     stop
     step
@@ -84,11 +116,24 @@ class Arrayterator(object):
     ...
     [[[[0 1]]]] (1, 1, 1, 2)
 
+    Sum a large ``.npy`` file in blocks of 2**20 elements that follow its
+    layout, reading two blocks ahead and summing them in four threads:
+
+    >>> a = np.load('big.npy', mmap_mode='r')  # doctest: +SKIP
+    >>> it = np.lib.Arrayterator(a, 2**20, order='K', prefetch=2)
+    >>> total = sum(it.map(np.sum, workers=4))  # doctest: +SKIP
+
     """
 
-    def __init__(self, var, buf_size=None):
+    def __init__(self, var, buf_size=None, order='C', prefetch=0):
+        if order not in ('C', 'F', 'K'):
+            raise ValueError("order must be one of 'C', 'F' or 'K'")
+        if prefetch < 0:
+            raise ValueError("prefetch must be non-negative")
         self.var = var
         self.buf_size = buf_size
+        self.order = order
+        self.prefetch = prefetch
 
         self.start = [0 for dim in var.shape]
         self.stop = [dim for dim in var.shape]
@@ -120,7 +165,8 @@ class Arrayterator(object):
             index += (slice(None),) * (dims-len(index))
 
         # Return a new arrayterator object.
-        out = self.__class__(self.var, self.buf_size)
+        out = self.__class__(self.var, self.buf_size, self.order,
+                             self.prefetch)
         for i, (start, stop, step, slice_) in enumerate(
                 zip(self.start, self.stop, self.step, index)):
             out.start[i] = start + (slice_.start or 0)
@@ -178,18 +224,40 @@ class Arrayterator(object):
         return tuple(((stop-start-1)//step+1) for start, stop, step in
                 zip(self.start, self.stop, self.step))
 
-    def __iter__(self):
+    def _axes(self):
+        # Axes from the slowest to the fastest varying one
+        axes = list(range(self.var.ndim))
+        order = self.order
+        if order == 'K':
+            strides = getattr(self.var, 'strides', None)
+            order = 'C'
+            if strides and abs(strides[0]) < abs(strides[-1]):
+                order = 'F'
+        if order == 'F':
+            axes.reverse()
+        return axes
+
+    def _slices(self):
+        """
+        Indices of the blocks of at most `buf_size` elements, in order.
+
+        """
         # Skip arrays with degenerate dimensions
         if [dim for dim in self.shape if dim <= 0]:
             return
 
-        start = self.start[:]
-        stop = self.stop[:]
-        step = self.step[:]
-        ndims = self.var.ndim
+        # Work on the axes sorted from the slowest to the fastest varying.
+        axes = self._axes()
+        shape = [self.shape[i] for i in axes]
+        first = [self.start[i] for i in axes]
+        last = [self.stop[i] for i in axes]
+        step = [self.step[i] for i in axes]
+        start = first[:]
+        stop = last[:]
+        ndims = len(axes)
 
         while True:
-            count = self.buf_size or reduce(mul, self.shape)
+            count = self.buf_size or reduce(mul, shape)
 
             # iterate over each dimension, looking for the
             # running dimension (ie, the dimension along which
@@ -200,26 +268,157 @@ class Arrayterator(object):
                 # along higher dimensions, so we read only a single position
                 if count == 0:
                     stop[i] = start[i]+1
-                elif count <= self.shape[i]:
+                elif count <= shape[i]:
                     # limit along this dimension
                     stop[i] = start[i] + count*step[i]
                     rundim = i
                 else:
                     # read everything along this dimension
-                    stop[i] = self.stop[i]
-                stop[i] = min(self.stop[i], stop[i])
-                count = count//self.shape[i]
+                    stop[i] = last[i]
+                stop[i] = min(last[i], stop[i])
+                count = count//shape[i]
 
-            # yield a block
-            slice_ = tuple(slice(*t) for t in zip(start, stop, step))
-            yield self.var[slice_]
+            # yield the index of a block
+            slice_ = [None] * ndims
+            for i, axis in enumerate(axes):
+                slice_[axis] = slice(start[i], stop[i], step[i])
+            yield tuple(slice_)
 
             # Update start position, taking care of overflow to
             # other dimensions
             start[rundim] = stop[rundim]  # start where we stopped
             for i in range(ndims-1, 0, -1):
-                if start[i] >= self.stop[i]:
-                    start[i] = self.start[i]
-                    start[i-1] += self.step[i-1]
-            if start[0] >= self.stop[0]:
+                if start[i] >= last[i]:
+                    start[i] = first[i]
+                    start[i-1] += step[i-1]
+            if start[0] >= last[0]:
                 return
+
+    def __iter__(self):
+        if self.prefetch > 0:
+            return self._prefetched()
+        return (self.var[slice_] for slice_ in self._slices())
+
+    def _prefetched(self):
+        # Blocks read by a background thread into a bounded queue
+        blocks = queue.Queue(self.prefetch)
+        stopped = threading.Event()
+
+        def put(item):
+            # Wait for room in the queue unless the consumer has gone away
+            while not stopped.is_set():
+                try:
+                    blocks.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def reader():
+            try:
+                slices = self._slices()
+                current = next(slices, None)
+                while current is not None:
+                    following = next(slices, None)
+                    if following is not None and isinstance(self.var,
+                                                             np.memmap):
+                        _will_need(self.var[following])
+                    if not put((True, np.array(self.var[current]))):
+                        return
+                    current = following
+                put((False, None))
+            except BaseException:
+                put((None, sys.exc_info()[1]))
+
+        thread = threading.Thread(target=reader)
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                status, block = blocks.get()
+                if status is None:
+                    raise block
+                if not status:
+                    return
+                yield block
+        finally:
+            stopped.set()
+            thread.join()
+
+    def map(self, func, workers=1):
+        """
+        Apply a function to every block, in a pool of threads.
+
+        The results are returned in the order of the blocks.  At most
+        ``2 * workers`` blocks are processed or waiting at a time, in
+        addition to the ones read ahead if `prefetch` is set.
+
+        .. versionadded:: 1.15.0
+
+        Parameters
+        ----------
+        func : callable
+            Function called with each block.  It should release the GIL,
+            as most NumPy functions on large blocks do, for the threads to
+            run concurrently.
+        workers : int, optional
+            Number of threads.  Default is 1.
+
+        Returns
+        -------
+        results : iterator
+            The values returned by `func`, one per block.
+
+        Examples
+        --------
+        >>> a = np.arange(10)
+        >>> list(np.lib.Arrayterator(a, 4).map(np.sum, workers=2))
+        [6, 22, 17]
+
+        """
+        if not callable(func):
+            raise TypeError("func must be callable")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        return self._mapped(func, workers)
+
+    def _mapped(self, func, workers):
+        # The generator of map, started on the first result
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(workers)
+        pending = deque()
+        blocks = iter(self)
+        try:
+            for block in blocks:
+                pending.append(pool.apply_async(func, (block,)))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+        finally:
+            if hasattr(blocks, 'close'):
+                blocks.close()
+            pool.terminate()
+            pool.join()
+
+
+def _will_need(block):
+    """
+    Ask the operating system to read the pages of a `memmap` block ahead.
+
+    This is only a hint, done where ``mmap.madvise`` exists.
+    """
+    mm = getattr(block, '_mmap', None)
+    if (mm is None or not hasattr(mm, 'madvise') or
+            not hasattr(mmap, 'MADV_WILLNEED') or block.size == 0):
+        return
+    try:
+        base = np.frombuffer(mm, dtype=np.uint8, count=1)
+        address = base.__array_interface__['data'][0]
+        del base
+        low, high = np.byte_bounds(block)
+        start = low - address
+        start -= start % mmap.PAGESIZE
+        mm.madvise(mmap.MADV_WILLNEED, start, high - address - start)
+    except (ValueError, OSError):
+        pass
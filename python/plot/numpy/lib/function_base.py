@@ -3,6 +3,7 @@ from __future__ import division, absolute_import, print_function
 import collections
 import re
 import sys
+import threading
 import warnings
 import operator
 
@@ -45,9 +46,10 @@ __all__ = [
     'diff', 'gradient', 'angle', 'unwrap', 'sort_complex', 'disp', 'flip',
     'rot90', 'extract', 'place', 'vectorize', 'asarray_chkfinite', 'average',
     'histogram', 'histogramdd', 'bincount', 'digitize', 'cov', 'corrcoef',
-    'msort', 'median', 'sinc', 'hamming', 'hanning', 'bartlett',
-    'blackman', 'kaiser', 'trapz', 'i0', 'add_newdoc', 'add_docstring',
-    'meshgrid', 'delete', 'insert', 'append', 'interp', 'add_newdoc_ufunc'
+    'CovAccumulator', 'msort', 'median', 'sinc', 'hamming', 'hanning',
+    'bartlett', 'blackman', 'kaiser', 'trapz', 'i0', 'add_newdoc',
+    'add_docstring', 'meshgrid', 'delete', 'insert', 'append', 'interp',
+    'Interpolator', 'add_newdoc_ufunc'
     ]
 
 
@@ -1993,6 +1995,10 @@ def interp(x, xp, fp, left=None, right=None, period=None):
         If `xp` or `fp` are not 1-D sequences
         If `period == 0`
 
+    See Also
+    --------
+    Interpolator : Interpolation with the same data points for many calls.
+
     Notes
     -----
     Does not check that the x-coordinate sequence `xp` is increasing.
@@ -2092,6 +2098,274 @@ def interp(x, xp, fp, left=None, right=None, period=None):
             return interp_func(x, xp, fp, left, right).item()
 
 
+class Interpolator(object):
+    """
+    Interpolator(xp, fp, left=None, right=None, period=None, threads=1)
+
+    One-dimensional linear interpolation on fixed data points.
+
+    Calling the interpolator gives the same values as ``np.interp(x, xp, fp,
+    left, right, period)``, but everything that only depends on the data
+    points is done once: their conversion and checks, the sorting and
+    padding of periodic data points, the slopes of the segments and a table
+    locating the segment of any x-coordinate.  Large query arrays are
+    evaluated in chunks, which bounds the temporary memory and lets several
+    threads share the work.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    xp, fp, left, right, period
+        The data points and options, see `interp`.
+    threads : int, optional
+        Maximum number of threads evaluating chunks of the queries.
+        Default is 1.
+
+    Raises
+    ------
+    ValueError
+        If `xp` and `fp` have different length
+        If `xp` or `fp` are not 1-D sequences, or are empty
+        If `period == 0`
+
+    See Also
+    --------
+    interp
+
+    Notes
+    -----
+    Chunks of queries that are sorted, in increasing or decreasing order,
+    are passed to the compiled routine of `interp`, which walks through
+    the segments from one query to the next.  Other chunks are located in
+    a table of buckets of equal width over the range of `xp`, each of which
+    holds at most a few data points, instead of by a binary search.  When
+    the data points are too irregular for such a table, a binary search is
+    used.
+
+    As with `interp`, `xp` must be increasing unless `period` is given.
+
+    Examples
+    --------
+    >>> xp = np.linspace(0, 10, 10000)
+    >>> f = np.Interpolator(xp, np.sin(xp))
+    >>> x = np.random.uniform(0, 10, 100000)
+    >>> np.array_equal(f(x), np.interp(x, xp, np.sin(xp)))
+    True
+
+    """
+
+    # number of queries evaluated at once
+    chunksize = 2**18
+
+    def __init__(self, xp, fp, left=None, right=None, period=None,
+                 threads=1):
+        fp = np.asarray(fp)
+        if np.iscomplexobj(fp):
+            self._interp_func = compiled_interp_complex
+            dtype = np.complex128
+        else:
+            self._interp_func = compiled_interp
+            dtype = np.float64
+        xp = np.asarray(xp, dtype=np.float64)
+        fp = np.asarray(fp, dtype=dtype)
+        if xp.ndim != 1 or fp.ndim != 1:
+            raise ValueError("Data points must be 1-D sequences")
+        if xp.shape[0] != fp.shape[0]:
+            raise ValueError("fp and xp are not of the same length")
+        if xp.shape[0] == 0:
+            raise ValueError("array of sample points is empty")
+        threads = operator.index(threads)
+        if threads < 1:
+            raise ValueError("threads must be at least 1, got %d" % threads)
+
+        if period is not None:
+            if period == 0:
+                raise ValueError("period must be a non-zero value")
+            period = abs(period)
+            left = None
+            right = None
+            # normalizing periodic boundaries
+            xp = xp % period
+            asort_xp = np.argsort(xp)
+            xp = xp[asort_xp]
+            fp = fp[asort_xp]
+            xp = np.concatenate((xp[-1:]-period, xp, xp[0:1]+period))
+            fp = np.concatenate((fp[-1:], fp, fp[0:1]))
+
+        self.xp = xp
+        self.fp = fp
+        self.left = left
+        self.right = right
+        self.period = period
+        self.threads = threads
+        self._left = fp[0] if left is None else left
+        self._right = fp[-1] if right is None else right
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if dtype is np.complex128:
+                # as the compiled routine, each part times 1/dx
+                self._inv_dx = 1.0 / np.diff(xp)
+                self._dfp = np.diff(fp)
+                self._slopes = np.empty(len(self._dfp), dtype=dtype)
+                self._slopes.real = self._dfp.real * self._inv_dx
+                self._slopes.imag = self._dfp.imag * self._inv_dx
+            else:
+                self._slopes = np.diff(fp) / np.diff(xp)
+        self._table = self._lookup_table()
+
+    def _lookup_table(self):
+        # Table of the first segment of 2*len(xp) buckets of equal width
+        # over [xp[0], xp[-1]], or None if the data points are too irregular
+        # for a table to beat a binary search.
+        xp = self.xp
+        n = len(xp)
+        width = xp[-1] - xp[0]
+        if n < 3 or not np.isfinite(width) or not width > 0:
+            return None
+        # a larger table makes fewer steps from the bucket to the segment
+        nbuckets = max(2 * n, min(8 * n, 2**20))
+        edges = xp[0] + width / nbuckets * np.arange(nbuckets + 1)
+        table = np.searchsorted(xp, edges, side='right') - 1
+        np.clip(table, 0, n - 2, out=table)
+        # a query is looked up from the segment of the previous bucket, in
+        # case rounding puts it in the next one
+        table = np.concatenate((table[:1], table[:-1]))
+        if (table[2:] - table[:-2]).max() > 8:
+            return None
+        self._scale = nbuckets / width
+        # the next data point of every segment, nan (never <= x) after the
+        # last one
+        self._next_xp = np.concatenate((xp[1:], [np.nan]))
+        return table
+
+    def _segments(self, x):
+        # Index j of the segment xp[j] <= x < xp[j + 1], clipped to the
+        # valid segments.
+        xp = self.xp
+        last = len(xp) - 2
+        if self._table is None:
+            j = np.searchsorted(xp, x, side='right') - 1
+            np.clip(j, 0, max(last, 0), out=j)
+            return j
+        b = (x - xp[0]) * self._scale
+        # fmin and fmax map nan to the valid range
+        np.fmax(b, 0, out=b)
+        np.fmin(b, len(self._table) - 1, out=b)
+        j = self._table[b.astype(np.intp)]
+        # nan, in the sentinel or in x, compares false without a warning
+        with np.errstate(invalid='ignore'):
+            while True:
+                step = self._next_xp[j] <= x
+                if not step.any():
+                    break
+                j += step
+        np.minimum(j, last, out=j)
+        return j
+
+    def _evaluate(self, x, out, few):
+        # `few` tells that the whole query has fewer points than xp, in
+        # which case the compiled complex routine does without the slopes
+        if self.period is not None:
+            x = x % self.period
+        if len(x) > 1:
+            with np.errstate(invalid='ignore'):
+                d = x[1:] >= x[:-1]
+            if d.all():
+                out[...] = self._interp_func(x, self.xp, self.fp, self.left,
+                                             self.right)
+                return
+            with np.errstate(invalid='ignore'):
+                d = x[1:] <= x[:-1]
+            if d.all():
+                out[::-1] = self._interp_func(x[::-1], self.xp, self.fp,
+                                              self.left, self.right)
+                return
+        if len(self.xp) == 1:
+            out[...] = self._interp_func(x, self.xp, self.fp, self.left,
+                                         self.right)
+            return
+        j = self._segments(x)
+        # same operations as the compiled routine, for identical results
+        with np.errstate(invalid='ignore'):
+            if self.fp.dtype == np.complex128:
+                dx = x - self.xp[j]
+                if few:
+                    dfp, inv_dx = self._dfp[j], self._inv_dx[j]
+                    out.real = dfp.real * dx * inv_dx
+                    out.imag = dfp.imag * dx * inv_dx
+                else:
+                    slopes = self._slopes[j]
+                    out.real = slopes.real * dx
+                    out.imag = slopes.imag * dx
+            else:
+                np.subtract(x, self.xp[j], out=out)
+                out *= self._slopes[j]
+            out += self.fp[j]
+            out[x < self.xp[0]] = self._left
+            out[x > self.xp[-1]] = self._right
+            out[x == self.xp[-1]] = self.fp[-1]
+        nan = np.isnan(x)
+        out[nan] = x[nan]
+
+    def __call__(self, x):
+        """
+        Return the interpolated values at `x`.
+
+        Parameters
+        ----------
+        x : array_like
+            The x-coordinates of the interpolated values.
+
+        Returns
+        -------
+        y : float or complex (corresponding to fp) or ndarray
+            The interpolated values, same shape as `x`.
+        """
+        if isinstance(x, (float, int, number)):
+            return self(np.array([x])).item()
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 0:
+            return self(x[None]).item()
+        out = np.empty(x.shape, dtype=self.fp.dtype)
+        flat_x = x.ravel()
+        flat_out = out.reshape(-1)
+        n = len(flat_x)
+        few = n < len(self.xp)
+        chunks = [(lo, min(lo + self.chunksize, n))
+                  for lo in range(0, n, self.chunksize)]
+        if self.threads == 1 or len(chunks) < 2:
+            for lo, hi in chunks:
+                self._evaluate(flat_x[lo:hi], flat_out[lo:hi], few)
+            return out
+
+        # the threads take the chunks in turn
+        chunks = iter(chunks)
+        lock = threading.Lock()
+        errors = []
+
+        def worker():
+            while not errors:
+                with lock:
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                lo, hi = chunk
+                try:
+                    self._evaluate(flat_x[lo:hi], flat_out[lo:hi], few)
+                except BaseException:
+                    errors.append(sys.exc_info()[1])
+
+        workers = [threading.Thread(target=worker)
+                   for i in range(min(self.threads, n // self.chunksize + 1))]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        if errors:
+            raise errors[0]
+        return out
+
+
 def angle(z, deg=0):
     """
     Return the angle of the complex argument.
@@ -2901,6 +3175,45 @@ class vectorize(object):
         return outputs[0] if nout == 1 else outputs
 
 
+def _cov_weights(nobs, fweights, aweights):
+    """
+    Check the weights of `nobs` observations given to `cov`, and return
+    their product and the array of aweights.
+    """
+    w = None
+    if fweights is not None:
+        fweights = np.asarray(fweights, dtype=float)
+        if not np.all(fweights == np.around(fweights)):
+            raise TypeError(
+                "fweights must be integer")
+        if fweights.ndim > 1:
+            raise RuntimeError(
+                "cannot handle multidimensional fweights")
+        if fweights.shape[0] != nobs:
+            raise RuntimeError(
+                "incompatible numbers of samples and fweights")
+        if any(fweights < 0):
+            raise ValueError(
+                "fweights cannot be negative")
+        w = fweights
+    if aweights is not None:
+        aweights = np.asarray(aweights, dtype=float)
+        if aweights.ndim > 1:
+            raise RuntimeError(
+                "cannot handle multidimensional aweights")
+        if aweights.shape[0] != nobs:
+            raise RuntimeError(
+                "incompatible numbers of samples and aweights")
+        if any(aweights < 0):
+            raise ValueError(
+                "aweights cannot be negative")
+        if w is None:
+            w = aweights
+        else:
+            w *= aweights
+    return w, aweights
+
+
 def cov(m, y=None, rowvar=True, bias=False, ddof=None, fweights=None,
         aweights=None):
     """
@@ -3050,37 +3363,7 @@ def cov(m, y=None, rowvar=True, bias=False, ddof=None, fweights=None,
             ddof = 0
 
     # Get the product of frequencies and weights
-    w = None
-    if fweights is not None:
-        fweights = np.asarray(fweights, dtype=float)
-        if not np.all(fweights == np.around(fweights)):
-            raise TypeError(
-                "fweights must be integer")
-        if fweights.ndim > 1:
-            raise RuntimeError(
-                "cannot handle multidimensional fweights")
-        if fweights.shape[0] != X.shape[1]:
-            raise RuntimeError(
-                "incompatible numbers of samples and fweights")
-        if any(fweights < 0):
-            raise ValueError(
-                "fweights cannot be negative")
-        w = fweights
-    if aweights is not None:
-        aweights = np.asarray(aweights, dtype=float)
-        if aweights.ndim > 1:
-            raise RuntimeError(
-                "cannot handle multidimensional aweights")
-        if aweights.shape[0] != X.shape[1]:
-            raise RuntimeError(
-                "incompatible numbers of samples and aweights")
-        if any(aweights < 0):
-            raise ValueError(
-                "aweights cannot be negative")
-        if w is None:
-            w = aweights
-        else:
-            w *= aweights
+    w, aweights = _cov_weights(X.shape[1], fweights, aweights)
 
     avg, w_sum = average(X, axis=1, weights=w, returned=True)
     w_sum = w_sum[0]
@@ -3172,7 +3455,11 @@ def corrcoef(x, y=None, rowvar=True, bias=np._NoValue, ddof=np._NoValue):
         # 2015-03-15, 1.10
         warnings.warn('bias and ddof have no effect and are deprecated',
                       DeprecationWarning, stacklevel=2)
-    c = cov(x, y, rowvar)
+    return _cov_to_corrcoef(cov(x, y, rowvar))
+
+
+def _cov_to_corrcoef(c):
+    """Normalize the covariance matrix `c` in place, see `corrcoef`."""
     try:
         d = diag(c)
     except ValueError:
@@ -3193,6 +3480,213 @@ def corrcoef(x, y=None, rowvar=True, bias=np._NoValue, ddof=np._NoValue):
     return c
 
 
+class CovAccumulator(object):
+    """
+    CovAccumulator(rowvar=True, blocksize=None)
+
+    Covariance and correlation of data given in chunks.
+
+    The accumulator keeps the sum of the weights, the weighted mean and the
+    matrix of co-moments (weighted sums of products of deviations from the
+    mean) of the observations seen so far.  Chunks of observations are
+    added with `add`, accumulators filled by different workers are combined
+    with `merge`, and `cov` and `corrcoef` return the same as the functions
+    of the same name on all the data, up to rounding.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    rowvar : bool, optional
+        If `rowvar` is True (default), then each row of the chunks
+        represents a variable, with observations in the columns. Otherwise,
+        each column represents a variable, while the rows contain
+        observations.  1-D chunks are observations of a single variable.
+    blocksize : int, optional
+        Number of observations whose deviations from the mean are formed at
+        once.  Longer chunks are processed block by block, so the memory
+        used does not depend on the length of the chunks.  The default
+        uses blocks of about 2**21 elements.
+
+    Attributes
+    ----------
+    count : int
+        Number of observations added, ignoring weights.
+    mean : ndarray or None
+        Weighted mean of every variable, None before any data was added.
+
+    See Also
+    --------
+    cov, corrcoef
+
+    Notes
+    -----
+    The statistics of every block are merged with those accumulated so far
+    with the pairwise update of Chan et al.: for sums of weights
+    :math:`W_a, W_b`, means :math:`m_a, m_b` and co-moments
+    :math:`C_a, C_b`, with :math:`d = m_b - m_a`,
+
+    .. math:: C = C_a + C_b + d d^H W_a W_b / (W_a + W_b)
+
+    Unlike the naive sums of products, this does not lose precision when
+    the means are large compared to the spread of the data.
+
+    Examples
+    --------
+    >>> x = np.array([[0., 1., 2., 3.], [3., 2., 0., 1.]])
+    >>> acc = np.CovAccumulator()
+    >>> acc.add(x[:, :3])
+    >>> other = np.CovAccumulator()
+    >>> other.add(x[:, 3:])
+    >>> acc.merge(other)
+    >>> np.allclose(acc.cov(), np.cov(x))
+    True
+
+    """
+
+    def __init__(self, rowvar=True, blocksize=None):
+        self.rowvar = rowvar
+        self.blocksize = blocksize
+        self.count = 0
+        self.mean = None
+        self._wsum = 0.
+        self._w2sum = 0.
+        self._comoment = None
+
+    def add(self, m, y=None, fweights=None, aweights=None):
+        """
+        Add a chunk of observations.
+
+        Parameters
+        ----------
+        m : array_like
+            A 1-D or 2-D array of observations of the variables, see
+            `rowvar`.  All chunks must have the same number of variables.
+        y : array_like, optional
+            Observations of additional variables, as for `cov`.
+        fweights, aweights : array_like, optional
+            Frequency and observation weights of the observations of the
+            chunk, see `cov`.
+        """
+        X = self._as_variables(m)
+        if y is not None:
+            y = self._as_variables(y)
+            if X.shape[1] != y.shape[1]:
+                raise ValueError("m and y have different numbers of "
+                                 "observations")
+            X = np.concatenate((X, y), axis=0)
+        nvars, nobs = X.shape
+        if self.mean is not None and nvars != len(self.mean):
+            raise ValueError("chunk has %d variables, expected %d"
+                             % (nvars, len(self.mean)))
+        w, aweights = _cov_weights(nobs, fweights, aweights)
+
+        blocksize = self.blocksize
+        if blocksize is None:
+            blocksize = max(1, 2**21 // max(nvars, 1))
+        for start in range(0, nobs, blocksize):
+            block = slice(start, start + blocksize)
+            self._add_block(X[:, block],
+                            None if w is None else w[block],
+                            None if aweights is None else aweights[block])
+        self.count += nobs
+
+    def _as_variables(self, m):
+        m = np.asarray(m)
+        if m.ndim > 2:
+            raise ValueError("m has more than 2 dimensions")
+        if m.ndim < 2:
+            return m.reshape(1, -1)
+        return m if self.rowvar else m.T
+
+    def _add_block(self, X, w, aweights):
+        dtype = np.result_type(X, np.float64)
+        if w is None:
+            wsum = float(X.shape[1])
+            mean = X.mean(axis=1, dtype=dtype)
+        else:
+            wsum = float(w.sum())
+            if wsum == 0:
+                return
+            mean = dot(X, w) / wsum
+        w2sum = wsum if aweights is None else float(dot(w, aweights))
+        D = X - mean[:, None]
+        comoment = dot(D if w is None else D * w, D.T.conj())
+        self._update(wsum, w2sum, mean, comoment)
+
+    def _update(self, wsum, w2sum, mean, comoment):
+        if self.mean is None:
+            (self._wsum, self._w2sum) = (wsum, w2sum)
+            (self.mean, self._comoment) = (mean, comoment)
+            return
+        total = self._wsum + wsum
+        delta = mean - self.mean
+        dtype = np.result_type(self._comoment, comoment)
+        new_comoment = self._comoment.astype(dtype)
+        new_comoment += comoment
+        new_comoment += (np.outer(delta, delta.conj())
+                         * (self._wsum * wsum / total))
+        self.mean = self.mean + delta * (wsum / total)
+        self._comoment = new_comoment
+        self._wsum = total
+        self._w2sum += w2sum
+
+    def merge(self, other):
+        """
+        Add the observations accumulated by `other`.
+        """
+        if other.mean is None:
+            return
+        if self.mean is not None and len(other.mean) != len(self.mean):
+            raise ValueError("cannot merge accumulators of %d and %d "
+                             "variables" % (len(self.mean), len(other.mean)))
+        self._update(other._wsum, other._w2sum, other.mean, other._comoment)
+        self.count += other.count
+
+    def cov(self, bias=False, ddof=None):
+        """
+        Return the covariance matrix of the observations added.
+
+        Parameters
+        ----------
+        bias, ddof : optional
+            Normalization, see `cov`.
+
+        Returns
+        -------
+        out : ndarray
+            The covariance matrix of the variables.
+        """
+        if ddof is not None and ddof != int(ddof):
+            raise ValueError(
+                "ddof must be integer")
+        if self.mean is None:
+            raise ValueError("no data was added")
+        if ddof is None:
+            ddof = 0 if bias else 1
+
+        # without aweights, w2sum equals wsum and this is wsum - ddof
+        fact = self._wsum - ddof * self._w2sum / self._wsum
+        if fact <= 0:
+            warnings.warn("Degrees of freedom <= 0 for slice",
+                          RuntimeWarning, stacklevel=2)
+            fact = 0.0
+        c = self._comoment * (1. / np.float64(fact))
+        return c.squeeze()
+
+    def corrcoef(self):
+        """
+        Return the correlation coefficients of the observations added.
+
+        Returns
+        -------
+        R : ndarray
+            The correlation coefficient matrix of the variables, see
+            `corrcoef`.
+        """
+        return _cov_to_corrcoef(self.cov())
+
+
 def blackman(M):
     """
     Return the Blackman window.
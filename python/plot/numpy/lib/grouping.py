@@ -0,0 +1,481 @@
+"""
+Grouped reductions of arrays.
+
+:Contains:
+  group_reduce,
+  GroupAccumulator
+
+:Notes:
+
+The rows of the values are assigned to groups by their keys, and every
+requested reduction is computed per group.  Keys are either factorized by
+sorting, as `unique` does, or, for integer keys spanning a limited range,
+mapped directly to group numbers ("hash" method).  The values are then
+reordered once by group and reduced segment by segment.
+
+`GroupAccumulator` keeps the partial results of each group, so that data
+can be processed in chunks, or by several workers whose accumulators are
+merged at the end.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+from numpy.compat import basestring
+
+
+__all__ = ['group_reduce', 'GroupAccumulator']
+
+
+# Partial results needed by every reduction.  They are all mergeable.
+_PARTS = {
+    'count': ('count',),
+    'sum': ('sum',),
+    'mean': ('count', 'sum'),
+    'var': ('count', 'mean', 'm2'),
+    'std': ('count', 'mean', 'm2'),
+    'min': ('min',),
+    'max': ('max',),
+    'first': ('first',),
+    'last': ('last',),
+    }
+
+
+def _check_funcs(funcs):
+    single = isinstance(funcs, basestring)
+    if single:
+        funcs = (funcs,)
+    funcs = tuple(funcs)
+    for func in funcs:
+        if func not in _PARTS:
+            raise ValueError("unknown reduction %r, expected one of %s"
+                             % (func, ', '.join(sorted(_PARTS))))
+    return funcs, single
+
+
+def _as_keys(keys):
+    """
+    Keys as a 1-D array.  A sequence of 1-D arrays becomes a structured
+    array with one field per array.
+    """
+    if (isinstance(keys, (list, tuple)) and len(keys) and
+            all(np.ndim(k) == 1 for k in keys)):
+        cols = [np.asarray(k) for k in keys]
+        if any(len(c) != len(cols[0]) for c in cols):
+            raise ValueError("key columns must have the same length")
+        out = np.empty(len(cols[0]), dtype=[('f%d' % i, c.dtype)
+                                            for i, c in enumerate(cols)])
+        for name, c in zip(out.dtype.names, cols):
+            out[name] = c
+        return out
+    keys = np.asarray(keys)
+    if keys.ndim != 1:
+        raise ValueError("keys must be 1-D")
+    return keys
+
+
+def _dense_codes(keys):
+    """
+    Group numbers of integer keys without sorting them.
+
+    Every key, of one or several integer fields, is mapped to a mixed-radix
+    code that directly indexes a table of the possible keys.  Returns the
+    unique keys and the group number of every key, or None if a field is
+    not an integer or the table would be much larger than `keys`.
+    """
+    names = keys.dtype.names or (None,)
+    fields = []
+    size = 1
+    for name in names:
+        col = keys if name is None else keys[name]
+        if col.dtype.kind not in 'biu' or col.ndim != 1:
+            return None
+        if col.dtype.kind == 'b':
+            col = col.view(np.uint8)
+        (lo, hi) = (int(col.min()), int(col.max())) if len(col) else (0, 0)
+        fields.append((col, lo, hi - lo + 1))
+        size *= hi - lo + 1
+        if size > 4 * len(keys) + 1024:
+            return None
+    # The first field is the most significant, so that the codes sort
+    # like the keys
+    stride = size
+    code = np.zeros(len(keys), dtype=np.intp)
+    for i, (col, lo, span) in enumerate(fields):
+        stride //= span
+        fields[i] += (stride,)
+        if col.dtype.kind == 'u':
+            code += (col - col.dtype.type(lo)).astype(np.intp) * stride
+        else:
+            code += (col.astype(np.intp) - lo) * stride
+    present = np.bincount(code, minlength=size).astype(bool)
+    groups = np.cumsum(present) - 1
+    codes = np.flatnonzero(present)
+    uniq = np.empty(len(codes), dtype=keys.dtype)
+    for name, (col, lo, span, stride) in zip(names, fields):
+        field = uniq if name is None else uniq[name]
+        field[...] = (codes // stride) % span + lo
+    return uniq, groups[code]
+
+
+def _factorize(keys, method):
+    """Sorted unique keys and the group number of every key."""
+    if method not in ('auto', 'hash', 'sort'):
+        raise ValueError("The 'method' argument should be in 'auto', "
+                         "'hash' or 'sort' (got '%s' instead)" % method)
+    if method != 'sort':
+        res = _dense_codes(keys)
+        if res is not None:
+            return res
+        if method == 'hash':
+            raise ValueError("the hash method needs integer keys spanning a "
+                             "range not much larger than the number of keys")
+    return np.unique(keys, return_inverse=True)
+
+
+def _mean_type(dtype):
+    # Type of the means of values of type `dtype`, as for `mean`
+    if issubclass(dtype.type, np.inexact):
+        return dtype
+    return np.dtype(np.float64)
+
+
+def _partials(groups, ngroups, values, parts):
+    """
+    Partial results `parts` of every group.
+
+    The values are sorted by group once; every partial result is then a
+    reduction over the segments of the sorted values.
+    """
+    count = np.bincount(groups, minlength=ngroups)
+    out = {'count': count}
+    if set(parts) <= {'count'}:
+        return out
+    sum_type = np.add.reduce(values[:0], axis=0).dtype
+    mean_type = _mean_type(values.dtype)
+    if not ngroups:
+        shape = (0,) + values.shape[1:]
+        empty = {'sum': np.zeros(shape, sum_type),
+                 'mean': np.zeros(shape, mean_type),
+                 'm2': np.zeros(shape, mean_type.type(0).real.dtype)}
+        for part in parts:
+            out[part] = empty.get(part, values[:0])
+        out['count'] = count
+        return out
+    if (values.ndim == 1 and values.dtype.kind == 'f' and
+            set(parts) <= {'count', 'sum', 'mean', 'm2'}):
+        # Sums of real values can be accumulated without sorting
+        if 'sum' in parts:
+            out['sum'] = np.bincount(groups, values, ngroups).astype(sum_type)
+        if 'mean' in parts:
+            mean = np.bincount(groups, values, ngroups) / count
+            dev = values - mean[groups]
+            out['mean'] = mean.astype(mean_type)
+            out['m2'] = np.bincount(groups, dev * dev, ngroups).astype(
+                mean_type)
+        return out
+    starts = np.cumsum(count) - count
+    order = np.argsort(groups, kind='mergesort')
+    sorted_values = values[order]
+    del order
+    if 'sum' in parts:
+        out['sum'] = np.add.reduceat(sorted_values.astype(sum_type,
+                                                          copy=False),
+                                     starts, axis=0)
+    if 'mean' in parts:
+        x = sorted_values.astype(mean_type)
+        mean = np.add.reduceat(x, starts, axis=0)
+        mean /= count.reshape((-1,) + (1,) * (x.ndim - 1))
+        x -= np.repeat(mean, count, axis=0)
+        if issubclass(x.dtype.type, np.complexfloating):
+            x = np.multiply(x, x.conj(), out=x).real
+        else:
+            np.multiply(x, x, out=x)
+        (out['mean'], out['m2']) = (mean, np.add.reduceat(x, starts, axis=0))
+    for part, ufunc in (('min', np.minimum), ('max', np.maximum)):
+        if part in parts:
+            out[part] = ufunc.reduceat(sorted_values, starts, axis=0)
+    if 'first' in parts:
+        out['first'] = sorted_values[starts]
+    if 'last' in parts:
+        out['last'] = sorted_values[starts + count - 1]
+    return out
+
+
+def _merge_partials(keys_a, parts_a, keys_b, parts_b):
+    """
+    Combine the partial results of two sets of groups.  Where a group is
+    present in both, `a` is taken to come first.
+    """
+    if not len(keys_a):
+        return keys_b, parts_b
+    if not len(keys_b):
+        return keys_a, parts_a
+    keys, groups = np.unique(np.concatenate((keys_a, keys_b)),
+                             return_inverse=True)
+    (ga, gb) = (groups[:len(keys_a)], groups[len(keys_a):])
+    ngroups = len(keys)
+    in_a = np.zeros(ngroups, dtype=bool)
+    in_a[ga] = True
+    both = in_a[gb]
+
+    def combine(part, how):
+        (a, b) = (parts_a[part], parts_b[part])
+        out = np.zeros((ngroups,) + a.shape[1:], dtype=np.result_type(a, b))
+        out[ga] = a
+        if how is None:
+            out[gb[~both]] = b[~both]
+        else:
+            out[gb] = np.where(both.reshape((-1,) + (1,) * (b.ndim - 1)),
+                               how(out[gb], b), b)
+        return out
+
+    count_a = np.zeros(ngroups, dtype=np.intp)
+    count_a[ga] = parts_a['count']
+    count_b = np.zeros(ngroups, dtype=np.intp)
+    count_b[gb] = parts_b['count']
+    out = {'count': count_a + count_b}
+    for part in parts_a:
+        if part in ('count', 'mean', 'm2'):
+            continue
+        how = {'sum': np.add, 'min': np.minimum, 'max': np.maximum,
+               'first': None, 'last': lambda x, y: y}[part]
+        out[part] = combine(part, how)
+    if 'mean' in parts_a:
+        # Pairwise update of the mean and of the sum of squared deviations
+        mean = combine('mean', lambda x, y: x)
+        m2 = combine('m2', np.add)
+        (na, nb) = (count_a[gb][both], count_b[gb][both])
+        (n, rows) = (na + nb, gb[both])
+        shape = (-1,) + (1,) * (mean.ndim - 1)
+        delta = parts_b['mean'][both] - mean[rows]
+        mean[rows] += delta * (nb / n).reshape(shape)
+        if issubclass(delta.dtype.type, np.complexfloating):
+            delta = (delta * delta.conj()).real
+        else:
+            delta = delta * delta
+        m2[rows] += delta * (na * nb / n).reshape(shape)
+        (out['mean'], out['m2']) = (mean, m2)
+    return keys, out
+
+
+def _finalize(parts, funcs, ddof):
+    res = {}
+    count = parts['count']
+    for func in funcs:
+        if func == 'count':
+            res[func] = count
+        elif func == 'mean':
+            total = parts['sum']
+            shape = (-1,) + (1,) * (total.ndim - 1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                res[func] = np.true_divide(total, count.reshape(shape),
+                                           dtype=_mean_type(total.dtype))
+        elif func in ('var', 'std'):
+            m2 = parts['m2']
+            shape = (-1,) + (1,) * (m2.ndim - 1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                var = np.true_divide(m2, np.maximum(count - ddof, 0).reshape(
+                    shape), dtype=m2.dtype)
+            res[func] = np.sqrt(var) if func == 'std' else var
+        else:
+            res[func] = parts[func]
+    return res
+
+
+def group_reduce(keys, values=None, funcs='sum', method='auto', ddof=0):
+    """
+    Reduce values group by group.
+
+    The rows of `values` are grouped by the corresponding `keys`, and each
+    of the reductions `funcs` is computed for every group.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    keys : array_like or sequence of array_like
+        1-D array of keys, which may be structured, or a list or tuple of
+        1-D arrays of the same length, each holding one column of the keys.
+    values : array_like, optional
+        Values to reduce, with as many rows (along the first axis) as there
+        are keys.  Only needed if some reduction other than 'count' is
+        requested.
+    funcs : str or sequence of str, optional
+        Reduction or reductions to compute: 'count', 'sum', 'mean', 'var',
+        'std', 'min', 'max', 'first' and 'last'.  'first' and 'last' are
+        the first and last rows of each group, in the order of `values`.
+        Default is 'sum'.
+    method : {'auto', 'hash', 'sort'}, optional
+        How the keys are assigned to groups.  'sort' sorts the keys, like
+        `unique`.  'hash' maps the keys directly to group numbers; it
+        requires integer keys spanning a range not much larger than the
+        number of keys.  'auto', the default, uses 'hash' when possible.
+    ddof : int, optional
+        Delta degrees of freedom of 'var' and 'std'.  Default is 0.
+
+    Returns
+    -------
+    unique_keys : ndarray
+        The sorted unique keys.  Keys given as a sequence of columns are
+        returned as a structured array with fields 'f0', 'f1', ...
+    result : ndarray or dict of ndarrays
+        The reduction of every group, or a dictionary mapping every
+        reduction to its result if `funcs` is a sequence.
+
+    See Also
+    --------
+    unique, GroupAccumulator
+
+    Notes
+    -----
+    Sums are computed in the type `sum` would use, and 'mean', 'var' and
+    'std' in the type `mean` would use.  The values are reordered by group
+    once, so that each reduction is a single pass over them.
+
+    Examples
+    --------
+    >>> keys = np.array([2, 1, 2, 3, 1])
+    >>> values = np.array([1., 2., 3., 4., 5.])
+    >>> np.group_reduce(keys, values)
+    (array([1, 2, 3]), array([ 7.,  4.,  4.]))
+    >>> k, res = np.group_reduce(keys, values, funcs=('count', 'max'))
+    >>> res['count'], res['max']
+    (array([2, 2, 1]), array([ 5.,  3.,  4.]))
+
+    Keys made of several columns:
+
+    >>> k, res = np.group_reduce([[0, 0, 1], ['a', 'b', 'a']], [1, 2, 3])
+    >>> k
+    array([(0, 'a'), (0, 'b'), (1, 'a')],
+          dtype=[('f0', '<i8'), ('f1', 'S1')])
+
+    """
+    funcs, single = _check_funcs(funcs)
+    keys = _as_keys(keys)
+    uniq, groups = _factorize(keys, method)
+    parts = set(p for func in funcs for p in _PARTS[func])
+    if values is None:
+        if parts != {'count'}:
+            raise ValueError("values are needed for %s" % ', '.join(
+                f for f in funcs if f != 'count'))
+        values = np.empty(len(keys))
+    values = np.asanyarray(values)
+    if values.ndim == 0 or len(values) != len(keys):
+        raise ValueError("values must have one row per key")
+    res = _finalize(_partials(groups, len(uniq), values, parts), funcs, ddof)
+    return uniq, res[funcs[0]] if single else res
+
+
+class GroupAccumulator(object):
+    """
+    GroupAccumulator(funcs='sum', method='auto')
+
+    Grouped reductions over data given in chunks.
+
+    The accumulator keeps the partial results of every group seen so far:
+    counts, sums, means and sums of squared deviations, extrema and the
+    first and last rows.  Chunks are added with `add`, accumulators filled
+    by different workers are combined with `merge`, and `result` returns
+    the same as `group_reduce` on all the data.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    funcs : str or sequence of str, optional
+        Reductions to compute, see `group_reduce`.  Default is 'sum'.
+    method : {'auto', 'hash', 'sort'}, optional
+        How the keys of every chunk are assigned to groups, see
+        `group_reduce`.
+
+    See Also
+    --------
+    group_reduce
+
+    Notes
+    -----
+    'first' and 'last' refer to the order in which the chunks were added,
+    and, for merged accumulators, to the order of the merges: the rows of
+    an accumulator come before those merged into it.
+
+    Examples
+    --------
+    >>> acc = np.GroupAccumulator(('count', 'mean'))
+    >>> acc.add([1, 2, 1], [1., 2., 3.])
+    >>> other = np.GroupAccumulator(('count', 'mean'))
+    >>> other.add([2, 3], [4., 5.])
+    >>> acc.merge(other)
+    >>> keys, res = acc.result()
+    >>> keys, res['count'], res['mean']
+    (array([1, 2, 3]), array([2, 2, 1]), array([ 2.,  3.,  5.]))
+
+    """
+
+    def __init__(self, funcs='sum', method='auto'):
+        self.funcs, self._single = _check_funcs(funcs)
+        self.method = method
+        self._parts = set(p for func in self.funcs for p in _PARTS[func])
+        self._keys = None
+        self._partials = None
+
+    def add(self, keys, values=None):
+        """
+        Add a chunk of data.
+
+        Parameters
+        ----------
+        keys : array_like or sequence of array_like
+            Keys of the chunk, see `group_reduce`.  All chunks must have
+            keys of the same type.
+        values : array_like, optional
+            Values of the chunk.
+        """
+        keys = _as_keys(keys)
+        uniq, groups = _factorize(keys, self.method)
+        if values is None:
+            if self._parts != {'count'}:
+                raise ValueError("values are needed for %s" % ', '.join(
+                    f for f in self.funcs if f != 'count'))
+            values = np.empty(len(keys))
+        values = np.asanyarray(values)
+        if values.ndim == 0 or len(values) != len(keys):
+            raise ValueError("values must have one row per key")
+        self._update(uniq, _partials(groups, len(uniq), values, self._parts))
+
+    def merge(self, other):
+        """
+        Add the groups accumulated by `other`, which must compute the same
+        reductions.
+        """
+        if other._parts != self._parts:
+            raise ValueError("cannot merge accumulators of different "
+                             "reductions")
+        if other._keys is not None:
+            self._update(other._keys, other._partials)
+
+    def _update(self, keys, partials):
+        if self._keys is None:
+            (self._keys, self._partials) = (keys, partials)
+        else:
+            (self._keys, self._partials) = _merge_partials(
+                self._keys, self._partials, keys, partials)
+
+    def result(self, ddof=0):
+        """
+        Return the unique keys and the reductions of every group.
+
+        Parameters
+        ----------
+        ddof : int, optional
+            Delta degrees of freedom of 'var' and 'std'.  Default is 0.
+
+        Returns
+        -------
+        unique_keys, result
+            As returned by `group_reduce`.
+        """
+        if self._keys is None:
+            raise ValueError("no data was added")
+        res = _finalize(self._partials, self.funcs, ddof)
+        return self._keys, res[self.funcs[0]] if self._single else res
@@ -57,6 +57,10 @@ angle            Returns angle of complex argument
 unwrap           Unwrap phase along given axis (1-d algorithm)
 sort_complex     Sort a complex-array (based on real, then imaginary)
 trim_zeros       Trim the leading and trailing zeros from 1D array.
+group_reduce     Sums, means, extrema, ... of values grouped by key
+GroupAccumulator Grouped reductions over chunks of data
+CovAccumulator   Covariance and correlation of data given in chunks
+rolling_reduce   Sums, means, extrema, ... of sliding windows
 vectorize        A class that wraps a Python function taking scalar
                  arguments into a generalized function which can handle
                  arrays of arguments using the broadcast rules of
@@ -21,8 +21,10 @@ Functions
 """
 from __future__ import division, absolute_import, print_function
 
+import operator
 import warnings
 import numpy as np
+from numpy.core.multiarray import normalize_axis_index
 from numpy.lib.function_base import _ureduce as _ureduce
 
 
@@ -61,6 +63,10 @@ def _replace_nan(a, val):
         NaNs, otherwise return None.
 
     """
+    a = np.asanyarray(a)
+    if not (a.dtype == np.object_ or issubclass(a.dtype.type, np.inexact)):
+        # Nothing to replace, so there is no need for a copy either.
+        return a, None
     a = np.array(a, subok=True, copy=True)
 
     if a.dtype == np.object_:
@@ -187,6 +193,170 @@ def _divide_by_count(a, b, out=None):
                 return np.divide(a, b, out=out, casting='unsafe')
 
 
+# Number of elements per tile of the blocked reductions: 2**16 doubles, or
+# 512 kB, so that a tile and its temporaries stay in a typical L2 cache.
+_NAN_BLOCK = 2 ** 16
+
+
+def _use_blocked(a, axis):
+    """
+    Whether the sum/mean/var of `a` should use the blocked reduction.
+
+    Only plain (or memory mapped) floating point arrays larger than one
+    tile and reductions over all axes or a single axis qualify, everything
+    else goes through `_replace_nan`.
+    """
+    if type(a) not in (np.ndarray, np.memmap) or a.size <= _NAN_BLOCK:
+        return False
+    if not issubclass(a.dtype.type, np.inexact):
+        return False
+    if axis is None:
+        return True
+    try:
+        operator.index(axis)
+    except TypeError:
+        return False
+    return True
+
+
+def _nan_blocks(a, block, index=()):
+    # Yield (index, tile) pairs for a reduction over the last axis of `a`.
+    # The tiles are views of about `block` elements; `index` selects the
+    # part of the output the tile reduces into.
+    if a.ndim == 1:
+        for lo in range(0, max(a.shape[0], 1), block):
+            yield index, a[lo:lo + block]
+        return
+    inner = a.size // a.shape[0] if a.shape[0] else 0
+    if inner <= block:
+        rows = max(1, block // max(inner, 1))
+        for lo in range(0, max(a.shape[0], 1), rows):
+            yield index + (slice(lo, lo + rows),), a[lo:lo + rows]
+    else:
+        for i in range(a.shape[0]):
+            for item in _nan_blocks(a[i], block, index + (i,)):
+                yield item
+
+
+def _nan_tile_moments(tile, dtype, second):
+    # Count, sum and, if `second`, the sum of squared deviations from the
+    # tile mean of the non-NaN values of `tile` along its last axis.  All
+    # temporaries are of the size of the tile.
+    mask = np.isnan(tile)
+    x = np.where(mask, 0, tile)
+    cnt = tile.shape[-1] - np.sum(mask, axis=-1, dtype=np.intp)
+    tot = np.sum(x, axis=-1, dtype=dtype)
+    if not second:
+        return cnt, tot, None
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg = tot / cnt
+    np.subtract(x, avg[..., np.newaxis], out=x, casting='unsafe')
+    np.copyto(x, 0, where=mask)
+    if issubclass(x.dtype.type, np.complexfloating):
+        sqr = np.multiply(x, x.conj(), out=x).real
+    else:
+        sqr = np.multiply(x, x, out=x)
+    return cnt, avg, np.sum(sqr, axis=-1, dtype=dtype)
+
+
+def _nanreduce_blocked(a, axis, dtype, out, keepdims, op, ddof=0):
+    """
+    Sum, mean or variance of the non-NaN values of `a`, tile by tile.
+
+    Instead of copying `a` and building a mask of its size, the reduction
+    walks over cache sized tiles and combines their partial counts, sums
+    and squared deviations, using the pairwise update of Chan et al. for
+    the variance.  Apart from the output, no temporaries larger than a
+    tile are made, which matters for large memory mapped inputs.
+    """
+    second = op == 'var'
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+    if op != 'sum':
+        if dtype is not None and not issubclass(dtype.type, np.inexact):
+            raise TypeError("If a is inexact, then dtype must be inexact")
+        if out is not None and not issubclass(out.dtype.type, np.inexact):
+            raise TypeError("If a is inexact, then out must be inexact")
+
+    if axis is None:
+        out_shape = ()
+        tiles = ((None, t) for t in _nan_flat_tiles(a))
+    else:
+        axis = normalize_axis_index(axis, a.ndim)
+        out_shape = a.shape[:axis] + a.shape[axis + 1:]
+        tiles = _nan_blocks(np.moveaxis(a, axis, -1), _NAN_BLOCK)
+
+    acc_t = np.sum(a.ravel()[:1], dtype=dtype).dtype
+    cnt = np.zeros(out_shape, dtype=np.intp)
+    tot = np.zeros(out_shape, dtype=acc_t)
+    m2 = np.zeros(out_shape, dtype=tot.real.dtype) if second else None
+
+    for index, tile in tiles:
+        if index is None:
+            index = ()
+            tile = tile.reshape(1, -1)  # copies at most one tile
+            c, t, m = _nan_tile_moments(tile, dtype, second)
+            c, t = c[0], t[0]
+            m = m[0] if second else None
+        else:
+            c, t, m = _nan_tile_moments(tile, dtype, second)
+        if not second:
+            cnt[index] += c
+            tot[index] += t
+            continue
+        # Merge mean and squared deviations (tot holds the running mean).
+        n_a = cnt[index]
+        n = n_a + c
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = t - tot[index]
+            frac = np.where(n > 0, c / np.maximum(n, 1), 0)
+            tot[index] = np.where(c > 0, tot[index] + delta * frac,
+                                  tot[index])
+            if issubclass(delta.dtype.type, np.complexfloating):
+                delta2 = (delta * delta.conj()).real
+            else:
+                delta2 = delta * delta
+            m2[index] = m2[index] + np.where(c > 0, m, 0) + np.where(
+                c > 0, delta2 * n_a * frac, 0)
+        cnt[index] = n
+
+    if op == 'sum':
+        res = tot
+    elif op == 'mean':
+        res = _divide_by_count(tot, cnt)
+        if (cnt == 0).any():
+            warnings.warn("Mean of empty slice", RuntimeWarning, stacklevel=3)
+    else:
+        dof = cnt - ddof
+        res = _divide_by_count(m2, dof)
+        isbad = (dof <= 0)
+        if isbad.any():
+            warnings.warn("Degrees of freedom <= 0 for slice.",
+                          RuntimeWarning, stacklevel=3)
+            res = _copyto(res, np.nan, isbad)
+
+    if keepdims is not np._NoValue and keepdims:
+        if axis is None:
+            res = res.reshape((1,) * a.ndim)
+        else:
+            res = np.expand_dims(res, axis)
+    if out is not None:
+        np.copyto(out, res, casting='unsafe')
+        return out
+    return res[()] if res.ndim == 0 else res
+
+
+def _nan_flat_tiles(a):
+    # Tiles covering all of `a`, for reductions over all axes.
+    if a.flags.c_contiguous:
+        flat = a.reshape(-1)
+        for lo in range(0, max(flat.size, 1), _NAN_BLOCK):
+            yield flat[lo:lo + _NAN_BLOCK]
+    else:
+        for index, tile in _nan_blocks(a, _NAN_BLOCK):
+            yield tile
+
+
 def nanmin(a, axis=None, out=None, keepdims=np._NoValue):
     """
     Return minimum of an array or minimum along an axis, ignoring any NaNs.
@@ -578,6 +748,8 @@ def nansum(a, axis=None, dtype=None, out=None, keepdims=np._NoValue):
     nan
 
     """
+    if _use_blocked(a, axis):
+        return _nanreduce_blocked(a, axis, dtype, out, keepdims, 'sum')
     a, mask = _replace_nan(a, 0)
     return np.sum(a, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
 
@@ -848,6 +1020,8 @@ def nanmean(a, axis=None, dtype=None, out=None, keepdims=np._NoValue):
     array([ 1.,  3.5])
 
     """
+    if _use_blocked(a, axis):
+        return _nanreduce_blocked(a, axis, dtype, out, keepdims, 'mean')
     arr, mask = _replace_nan(a, 0)
     if mask is None:
         return np.mean(arr, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
@@ -1285,6 +1459,8 @@ def nanvar(a, axis=None, dtype=None, out=None, ddof=0, keepdims=np._NoValue):
     array([ 0.,  0.25])
 
     """
+    if _use_blocked(a, axis):
+        return _nanreduce_blocked(a, axis, dtype, out, keepdims, 'var', ddof)
     arr, mask = _replace_nan(a, 0)
     if mask is None:
         return np.var(arr, axis=axis, dtype=dtype, out=out, ddof=ddof,
@@ -17,7 +17,6 @@ from numpy.core import (isscalar, abs, finfo, atleast_1d, hstack, dot, array,
 from numpy.lib.twodim_base import diag, vander
 from numpy.lib.function_base import trim_zeros
 from numpy.lib.type_check import iscomplex, real, imag, mintypecode
-from numpy.linalg import eigvals, lstsq, inv
 
 class RankWarning(UserWarning):
     """
@@ -121,6 +120,9 @@ def poly(seq_of_zeros):
     Note how in all cases the leading coefficient is always 1.
 
     """
+    # numpy.linalg is imported here so that it can be loaded lazily.
+    from numpy.linalg import eigvals
+
     seq_of_zeros = atleast_1d(seq_of_zeros)
     sh = seq_of_zeros.shape
 
@@ -199,6 +201,8 @@ def roots(p):
     array([-0.3125+0.46351241j, -0.3125-0.46351241j])
 
     """
+    from numpy.linalg import eigvals
+
     # If input is scalar, this makes it an array
     p = atleast_1d(p)
     if p.ndim != 1:
@@ -542,6 +546,8 @@ def polyfit(x, y, deg, rcond=None, full=False, w=None, cov=False):
     >>> plt.show()
 
     """
+    from numpy.linalg import lstsq, inv
+
     order = int(deg) + 1
     x = NX.asarray(x) + 0.0
     y = NX.asarray(y) + 0.0
@@ -9,12 +9,15 @@ from __future__ import division, absolute_import, print_function
 
 import sys
 import itertools
+from collections import OrderedDict
+
 import numpy as np
 import numpy.ma as ma
 from numpy import ndarray, recarray
 from numpy.ma import MaskedArray
 from numpy.ma.mrecords import MaskedRecords
 from numpy.lib._iotools import _is_string_like
+from numpy.lib.stride_tricks import as_strided
 from numpy.compat import basestring
 
 if sys.version_info[0] < 3:
@@ -24,10 +27,11 @@ _check_fill_value = np.ma.core._check_fill_value
 
 
 __all__ = [
-    'append_fields', 'drop_fields', 'find_duplicates',
+    'append_fields', 'drop_fields', 'find_duplicates', 'from_columns',
     'get_fieldstructure', 'join_by', 'merge_arrays',
     'rec_append_fields', 'rec_drop_fields', 'rec_join',
     'recursive_fill_fields', 'rename_fields', 'stack_arrays',
+    'structured_to_unstructured', 'to_columns', 'unstructured_to_structured',
     ]
 
 
@@ -357,6 +361,49 @@ def _fix_defaults(output, defaults=None):
     return output
 
 
+def _leaf_fields(a):
+    """
+    Private function: list the views of the fields of `a` that are not
+    themselves structured, in the order of `flatten_descr`.
+    """
+    if a.dtype.names is None:
+        return [a]
+    leaves = []
+    for name in a.dtype.names:
+        if a.dtype.fields[name][0].names:
+            leaves.extend(_leaf_fields(a[name]))
+        else:
+            leaves.append(a[name])
+    return leaves
+
+
+def _merge_plain(seqarrays, flatten=False):
+    """
+    Private function: merge arrays that need no padding nor mask into a new
+    ndarray, copying every field once.  Return None if there is a shorter
+    array or a masked one.
+    """
+    if any(isinstance(a, MaskedArray) for a in seqarrays):
+        return None
+    seqarrays = [a.ravel() for a in seqarrays]
+    if len(set(a.size for a in seqarrays)) != 1:
+        return None
+    newdtype = zip_dtype(seqarrays, flatten=flatten)
+    output = np.empty(seqarrays[0].size, dtype=newdtype)
+    if flatten:
+        sources = [f for a in seqarrays for f in _leaf_fields(a)]
+        for (target, source) in zip(_leaf_fields(output), sources):
+            target[...] = source
+    else:
+        names = iter(newdtype.names)
+        for a in seqarrays:
+            if a.dtype.names is None or len(a.dtype.names) > 1:
+                output[next(names)] = a
+            elif a.dtype.names:
+                output[next(names)] = a[a.dtype.names[0]]
+    return output
+
+
 def merge_arrays(seqarrays, fill_value=-1, flatten=False,
                  usemask=False, asrecarray=False):
     """
@@ -404,6 +451,8 @@ def merge_arrays(seqarrays, fill_value=-1, flatten=False,
             '-1'    for strings
             True    for boolean values
     * XXX: I just obtained these values empirically
+    * Arrays of the same size without masked values are merged by copying
+      each of their fields once.
     """
     # Only one item in the input sequence ?
     if (len(seqarrays) == 1):
@@ -433,6 +482,12 @@ def merge_arrays(seqarrays, fill_value=-1, flatten=False,
     else:
         # Make sure we have arrays in the input sequence
         seqarrays = [np.asanyarray(_m) for _m in seqarrays]
+    # Nothing to pad: fill the output field by field
+    output = _merge_plain(seqarrays, flatten=flatten)
+    if output is not None:
+        if usemask:
+            output = ma.array(output, mask=False)
+        return _fix_output(output, usemask=usemask, asrecarray=asrecarray)
     # Find the sizes of the inputs and their maximum
     sizes = tuple(a.size for a in seqarrays)
     maxlength = max(sizes)
@@ -682,6 +737,25 @@ def append_fields(base, names, data, dtypes=None,
         data = [np.array(a, copy=False, subok=True, dtype=d).view([(n, d)])
                 for (a, n, d) in zip(data, names, dtypes)]
     #
+    if (not isinstance(base, MaskedArray) and
+            not any(isinstance(a, MaskedArray) or a.ndim != 1
+                    for a in data) and
+            len(set([np.size(base)] + [a.size for a in data])) == 1):
+        # Nothing to pad nor mask: copy every field once into the output
+        base = merge_arrays(base, usemask=False)
+        if len(data) > 1:
+            data = _merge_plain(data, flatten=True)
+        else:
+            data = data.pop()
+        output = np.empty(
+            len(base),
+            dtype=get_fieldspec(base.dtype) + get_fieldspec(data.dtype))
+        output = recursive_fill_fields(base, output)
+        output = recursive_fill_fields(data, output)
+        if usemask:
+            output = ma.array(output, mask=False)
+        return _fix_output(output, usemask=usemask, asrecarray=asrecarray)
+    #
     base = merge_arrays(base, usemask=usemask, fill_value=fill_value)
     if len(data) > 1:
         data = merge_arrays(data, flatten=True, usemask=usemask,
@@ -808,6 +882,345 @@ def repack_fields(a, align=False, recurse=False):
     dt = np.dtype(fieldinfo, align=align)
     return np.dtype((a.type, dt))
 
+
+def _get_fields_and_offsets(dt, offset=0):
+    """
+    Private function: list the ``(dtype, count, offset)`` of the scalar
+    fields of the structured dtype `dt`, in the order of its fields.
+
+    A subarray field of ``count`` values of type ``dtype`` is a single entry,
+    except for a subarray of structures which is expanded element by element.
+    """
+    fields = []
+    for name in dt.names:
+        field = dt.fields[name]
+        base, shape = field[0], ()
+        if field[0].subdtype is not None:
+            base, shape = field[0].subdtype
+        count = int(np.prod(shape, dtype=np.intp))
+        if base.names:
+            for i in range(count):
+                fields.extend(_get_fields_and_offsets(
+                    base, offset + field[1] + i * base.itemsize))
+        elif count:
+            fields.append((base, count, offset + field[1]))
+    return fields
+
+
+def _uniform_step(fields, dtype):
+    """
+    Private function: the distance in bytes between the successive values of
+    `fields` if they all have type `dtype` and are evenly spaced, else None.
+    """
+    offsets = []
+    for (base, count, offset) in fields:
+        if base != dtype:
+            return None
+        offsets.extend(range(offset, offset + count * base.itemsize,
+                             base.itemsize))
+    if len(offsets) == 1:
+        return dtype.itemsize
+    step = offsets[1] - offsets[0]
+    if step <= 0 or offsets != list(range(offsets[0], offsets[-1] + 1, step)):
+        return None
+    return step
+
+
+def structured_to_unstructured(arr, dtype=None, copy=False, casting='unsafe'):
+    """
+    Convert a structured array to an array with one more dimension over its
+    fields.
+
+    The new last axis has one entry for every scalar field of `arr`, with
+    nested fields flattened and subarray fields expanded in C order.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    arr : ndarray
+        Structured array or ndarray to convert.
+    dtype : dtype, optional
+        The dtype of the output.  Defaults to the common type of the fields.
+    copy : bool, optional
+        If False (the default), a view of `arr` is returned when all the
+        fields have type `dtype` and are evenly spaced in the records.
+        Otherwise a new array is always returned.
+    casting : {'no', 'equiv', 'safe', 'same_kind', 'unsafe'}, optional
+        How the field values may be cast to `dtype`, see `astype`.
+
+    Returns
+    -------
+    unstructured : ndarray
+        Array of shape ``arr.shape + (nfields,)``.
+
+    See Also
+    --------
+    unstructured_to_structured, to_columns
+
+    Notes
+    -----
+    A copy fills every column of the output from the corresponding field in
+    a single strided copy.
+
+    Examples
+    --------
+    >>> from numpy.lib import recfunctions as rfn
+    >>> a = np.zeros(2, dtype=[('x', 'i4'), ('y', 'f4', 2), ('z', 'f8')])
+    >>> a['x'] = [1, 2]
+    >>> rfn.structured_to_unstructured(a)
+    array([[1., 0., 0., 0.],
+           [2., 0., 0., 0.]])
+    >>> b = np.array([(1., 2.), (3., 4.)], dtype=[('x', 'f8'), ('y', 'f8')])
+    >>> v = rfn.structured_to_unstructured(b)
+    >>> v[:, 0] *= 10
+    >>> b
+    array([(10.,  2.), (30.,  4.)],
+          dtype=[('x', '<f8'), ('y', '<f8')])
+
+    """
+    arr = np.asarray(arr)
+    if arr.dtype.names is None:
+        raise ValueError("arr must be a structured array")
+    fields = _get_fields_and_offsets(arr.dtype)
+    if not fields:
+        raise ValueError("arr has no fields")
+    if dtype is None:
+        dtype = np.result_type(*[base for (base, _, _) in fields])
+    dtype = np.dtype(dtype)
+    nfields = sum(count for (_, count, _) in fields)
+
+    step = None if copy else _uniform_step(fields, dtype)
+    if step is not None:
+        first = arr.getfield(dtype, fields[0][2])
+        return as_strided(first, shape=arr.shape + (nfields,),
+                          strides=first.strides + (step,),
+                          writeable=arr.flags.writeable)
+
+    out = np.empty(arr.shape + (nfields,), dtype=dtype)
+    i = 0
+    for (base, count, offset) in fields:
+        column = arr.getfield(np.dtype((base, (count,))), offset)
+        np.copyto(out[..., i:i + count], column, casting=casting)
+        i += count
+    return out
+
+
+def unstructured_to_structured(arr, dtype=None, names=None, align=False,
+                               copy=False, casting='unsafe'):
+    """
+    Convert an array to a structured array over its last axis.
+
+    This is the inverse of `structured_to_unstructured`: the values along
+    the last axis of `arr` fill the scalar fields of the records in order,
+    with nested fields flattened and subarray fields expanded in C order.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    arr : ndarray
+        Array of at least one dimension.
+    dtype : dtype, optional
+        The structured dtype of the output.  It must have as many scalar
+        fields as the length of the last axis of `arr`.
+    names : list of str, optional
+        If `dtype` is not given, the names of the fields of the output, which
+        all have the type of `arr`.  Defaults to ``'f0', 'f1', ...``.
+    align : bool, optional
+        If `dtype` is not given, whether to make an aligned dtype.
+    copy : bool, optional
+        If False (the default), a view of `arr` is returned when its last
+        axis is contiguous and has the layout of `dtype`.  Otherwise a new
+        array is always returned.
+    casting : {'no', 'equiv', 'safe', 'same_kind', 'unsafe'}, optional
+        How the values may be cast to the types of the fields.
+
+    Returns
+    -------
+    structured : ndarray
+        Structured array of shape ``arr.shape[:-1]``.
+
+    See Also
+    --------
+    structured_to_unstructured, from_columns
+
+    Examples
+    --------
+    >>> from numpy.lib import recfunctions as rfn
+    >>> dt = np.dtype([('a', 'i4'), ('b', 'f4', (2,)), ('c', 'u1')])
+    >>> a = np.arange(8).reshape(2, 4)
+    >>> rfn.unstructured_to_structured(a, dt)
+    array([(0, [1., 2.], 3), (4, [5., 6.], 7)],
+          dtype=[('a', '<i4'), ('b', '<f4', (2,)), ('c', 'u1')])
+
+    """
+    arr = np.asarray(arr)
+    if arr.ndim == 0:
+        raise ValueError("arr must have at least one dimension")
+    nfields = arr.shape[-1]
+    if dtype is None:
+        if names is None:
+            names = ['f%d' % i for i in range(nfields)]
+        elif len(names) != nfields:
+            raise ValueError("The number of names does not match the length "
+                             "of the last axis")
+        dtype = np.dtype([(name, arr.dtype) for name in names], align=align)
+    else:
+        if names is not None:
+            raise ValueError("don't supply both dtype and names")
+        dtype = np.dtype(dtype)
+    if dtype.names is None:
+        raise ValueError("dtype must be a structured dtype")
+    fields = _get_fields_and_offsets(dtype)
+    if sum(count for (_, count, _) in fields) != nfields:
+        raise ValueError("The length of the last axis does not match the "
+                         "number of fields")
+
+    if (not copy and arr.strides[-1] == arr.itemsize and
+            dtype.itemsize == nfields * arr.itemsize and
+            _uniform_step(fields, arr.dtype) == arr.itemsize and
+            fields[0][2] == 0):
+        try:
+            return arr.view(dtype)[..., 0]
+        except ValueError:
+            # the other axes prevent changing the itemsize in a view
+            pass
+
+    out = np.empty(arr.shape[:-1], dtype=dtype)
+    i = 0
+    for (base, count, offset) in fields:
+        column = out.getfield(np.dtype((base, (count,))), offset)
+        np.copyto(column, arr[..., i:i + count], casting=casting)
+        i += count
+    return out
+
+
+def to_columns(arr, copy=True):
+    """
+    Split a structured array into a dictionary of its fields.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    arr : ndarray
+        Structured array.
+    copy : bool, optional
+        If True (the default), every column is a new C-contiguous array,
+        filled in a single strided copy.  If False, the columns are views of
+        the fields of `arr`.
+
+    Returns
+    -------
+    columns : OrderedDict
+        Mapping of the top-level field names of `arr` to their values, in
+        the order of the fields.  Nested fields remain structured columns,
+        and subarray fields add their dimensions after the ones of `arr`.
+
+    See Also
+    --------
+    from_columns, structured_to_unstructured
+
+    Examples
+    --------
+    >>> from numpy.lib import recfunctions as rfn
+    >>> a = np.array([(1, 2.), (3, 4.)], dtype=[('x', 'i4'), ('y', 'f8')])
+    >>> cols = rfn.to_columns(a)
+    >>> cols['y']
+    array([2., 4.])
+    >>> cols['y'].flags.c_contiguous
+    True
+
+    """
+    arr = np.asarray(arr)
+    if arr.dtype.names is None:
+        raise ValueError("arr must be a structured array")
+    columns = OrderedDict()
+    for name in arr.dtype.names:
+        columns[name] = arr[name].copy() if copy else arr[name]
+    return columns
+
+
+def from_columns(columns, names=None, dtype=None, align=False):
+    """
+    Build a structured array from a dictionary of columns.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    columns : mapping
+        Mapping of field names to array_like values.
+    names : sequence of str, optional
+        The fields of the output, in order.  Defaults to the names of
+        `dtype` if given, else to the keys of `columns` (so that the order
+        of an `OrderedDict` is kept).
+    dtype : dtype, optional
+        The structured dtype of the output.  By default every field has the
+        type of its column.
+    align : bool, optional
+        If `dtype` is not given, whether to make an aligned dtype.
+
+    Returns
+    -------
+    structured : ndarray
+        Structured array whose fields are copied from the columns, each in a
+        single strided copy.
+
+    Raises
+    ------
+    ValueError
+        If the columns do not share the shape of the records.
+
+    See Also
+    --------
+    to_columns, unstructured_to_structured
+
+    Notes
+    -----
+    If `dtype` is not given, the shape of the records is the one of the
+    column with the fewest dimensions, and the trailing dimensions of the
+    other columns make subarray fields.  Otherwise the trailing dimensions of
+    every column are the ones of its field in `dtype`.
+
+    Examples
+    --------
+    >>> from numpy.lib import recfunctions as rfn
+    >>> from collections import OrderedDict
+    >>> cols = OrderedDict([('x', [1, 2]), ('pos', [[0., 1.], [2., 3.]])])
+    >>> rfn.from_columns(cols)
+    array([(1, [0., 1.]), (2, [2., 3.])],
+          dtype=[('x', '<i8'), ('pos', '<f8', (2,))])
+
+    """
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+    if names is None:
+        names = dtype.names if dtype is not None else list(columns.keys())
+    names = list(names)
+    values = [np.asarray(columns[name]) for name in names]
+    if not values:
+        raise ValueError("at least one column is required")
+    if dtype is None:
+        ndim = min(v.ndim for v in values)
+        shape = values[0].shape[:ndim]
+        dtype = np.dtype([(name, v.dtype, v.shape[ndim:])
+                          for (name, v) in zip(names, values)], align=align)
+    else:
+        v, field = values[0], dtype[names[0]]
+        shape = v.shape[:v.ndim - len(field.shape)]
+    out = np.empty(shape, dtype=dtype)
+    for (name, v) in zip(names, values):
+        field = out[name]
+        if v.shape != field.shape:
+            raise ValueError("column %r of shape %s does not match the "
+                             "shape %s of its field"
+                             % (name, v.shape, field.shape))
+        field[...] = v
+    return out
+
+
 def stack_arrays(arrays, defaults=None, usemask=True, asrecarray=False,
                  autoconvert=False):
     """
@@ -948,17 +1361,151 @@ def find_duplicates(a, key=None, ignoremask=True, return_index=False):
         return duplicates
 
 
+# Number of probe records matched, and of output records filled, at a time
+# by the join engine.  Bounds the size of the temporaries.
+_JOIN_CHUNK = 2 ** 18
+
+
+def _join_keys(r1, r2, names):
+    """
+    Private function: the key columns of `r1` and `r2`, cast to common
+    dtypes.  A single scalar key is returned as a plain array, several keys
+    as structured arrays with fields `names`.
+    """
+    dtypes = []
+    for name in names:
+        (dt1, dt2) = (r1.dtype[name], r2.dtype[name])
+        dtypes.append(dt1 if dt1 == dt2 else np.promote_types(dt1, dt2))
+    if len(names) == 1 and dtypes[0].names is None and not dtypes[0].shape:
+        return (r1[names[0]].astype(dtypes[0], copy=False),
+                r2[names[0]].astype(dtypes[0], copy=False))
+    kdtype = np.dtype(list(zip(names, dtypes)))
+    keys = []
+    for r in (r1, r2):
+        k = np.empty(len(r), dtype=kdtype)
+        for name in names:
+            k[name] = r[name]
+        keys.append(k)
+    return tuple(keys)
+
+
+def _join_codes(k1, k2):
+    """
+    Private function: map integer keys to dense integer codes.
+
+    Returns the codes of `k1` and `k2` and the number of possible codes,
+    or None if some key is not an integer or if the keys span a range too
+    large for a direct-address table.
+    """
+    names = k1.dtype.names or (None,)
+    fields = []
+    size = 1
+    for name in names:
+        (c1, c2) = (k1, k2) if name is None else (k1[name], k2[name])
+        if any(c.dtype.kind not in 'biu' or c.ndim != 1 for c in (c1, c2)):
+            return None
+        (lo, hi) = (0, 0)
+        if len(c1) or len(c2):
+            lo = min(int(c.min()) for c in (c1, c2) if len(c))
+            hi = max(int(c.max()) for c in (c1, c2) if len(c))
+        fields.append((c1, c2, lo, size))
+        size *= hi - lo + 1
+        if size > 4 * min(len(k1), len(k2)) + 1024:
+            return None
+    codes = []
+    for side in (0, 1):
+        code = np.zeros(len((k1, k2)[side]), dtype=np.intp)
+        for field in fields:
+            (c, lo) = (field[side], field[2])
+            if c.dtype.kind == 'u' and lo >= 0:
+                # Large unsigned keys only fit in intp once shifted.
+                code += (c - c.dtype.type(lo)).astype(np.intp) * field[3]
+            else:
+                # Narrow signed keys would overflow when shifted in place.
+                code += (c.astype(np.intp) - lo) * field[3]
+        codes.append(code)
+    return codes[0], codes[1], size
+
+
+def _join_indices(k1, k2, method='auto'):
+    """
+    Private function: match the keys `k1` against the keys `k2`.
+
+    The smaller side is the build side: it is sorted, or bucketed in a
+    direct-address table for dense integer keys, and kept in memory, while
+    the other side is probed in chunks of `_JOIN_CHUNK` records.
+
+    Returns
+    -------
+    i1, i2 : ndarrays of intp
+        Indices of the matching pairs of records, in increasing order of
+        `i1` and then `i2`.  A key present n1 times in `k1` and n2 times in
+        `k2` gives n1 * n2 pairs.
+    only1, only2 : ndarrays of intp
+        Indices of the records of `k1` and `k2` without a match.
+    """
+    if method not in ('auto', 'hash', 'sort'):
+        raise ValueError("The 'method' argument should be in 'auto', "
+                         "'hash' or 'sort' (got '%s' instead)" % method)
+    codes = None if method == 'sort' else _join_codes(k1, k2)
+    if codes is None and method == 'hash':
+        raise ValueError("a hash join needs integer keys spanning a range "
+                         "not much larger than the number of records")
+
+    swapped = len(k1) < len(k2)
+    if codes is not None:
+        (probe, build, size) = (codes[0], codes[1], codes[2])
+    else:
+        (probe, build) = (k1, k2)
+    if swapped:
+        (probe, build) = (build, probe)
+
+    order = np.argsort(build, kind='mergesort')
+    if codes is not None:
+        counts = np.bincount(build, minlength=size)
+        starts = np.cumsum(counts) - counts
+    else:
+        build = build[order]
+    hit = np.zeros(len(build), dtype=bool)
+
+    (pairs_probe, pairs_build, lonely) = ([], [], [])
+    for lo in range(0, len(probe), _JOIN_CHUNK):
+        chunk = probe[lo:lo + _JOIN_CHUNK]
+        if codes is not None:
+            (first, cnt) = (starts[chunk], counts[chunk])
+        else:
+            first = build.searchsorted(chunk, 'left')
+            cnt = build.searchsorted(chunk, 'right') - first
+        rows = np.arange(lo, lo + len(chunk))
+        lonely.append(rows[cnt == 0])
+        total = cnt.sum()
+        # Expand every probe record into one pair per matching build record
+        offset = np.arange(total) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+        matched = order[np.repeat(first, cnt) + offset]
+        hit[matched] = True
+        pairs_probe.append(np.repeat(rows, cnt))
+        pairs_build.append(matched)
+
+    empty = np.empty(0, dtype=np.intp)
+    (ip, ib) = (np.concatenate(pairs_probe or [empty]),
+                np.concatenate(pairs_build or [empty]))
+    only_probe = np.concatenate(lonely or [empty])
+    only_build = np.flatnonzero(~hit)
+    if not swapped:
+        return ip, ib, only_probe, only_build
+    idx = np.argsort(ib, kind='mergesort')
+    return ib[idx], ip[idx], only_build, only_probe
+
+
 def join_by(key, r1, r2, jointype='inner', r1postfix='1', r2postfix='2',
-                defaults=None, usemask=True, asrecarray=False):
+            defaults=None, usemask=True, asrecarray=False, method='auto'):
     """
     Join arrays `r1` and `r2` on key `key`.
 
     The key should be either a string or a sequence of string corresponding
     to the fields used to join the array.  An exception is raised if the
-    `key` field cannot be found in the two input arrays.  Neither `r1` nor
-    `r2` should have any duplicates along `key`: the presence of duplicates
-    will make the output quite unreliable. Note that duplicates are not
-    looked for by the algorithm.
+    `key` field cannot be found in the two input arrays.  A key present
+    ``n1`` times in `r1` and ``n2`` times in `r2` gives ``n1 * n2`` records.
 
     Parameters
     ----------
@@ -987,15 +1534,22 @@ def join_by(key, r1, r2, jointype='inner', r1postfix='1', r2postfix='2',
     asrecarray : {False, True}, optional
         Whether to return a recarray (or MaskedRecords if `usemask==True`)
         or just a flexible-type ndarray.
+    method : {'auto', 'hash', 'sort'}, optional
+        How the keys are matched.  'hash' looks the keys up in a table
+        indexed by the key values and requires integer keys spanning a
+        range not much larger than the smaller input.  'sort' sorts the
+        keys of the smaller input and searches it for the keys of the other
+        one.  'auto', the default, uses 'hash' when possible.
+
+        .. versionadded:: 1.15.0
 
     Notes
     -----
-    * The output is sorted along the key.
-    * A temporary array is formed by dropping the fields not in the key for
-      the two arrays and concatenating the result. This array is then
-      sorted, and the common entries selected. The output is constructed by
-      filling the fields with the selected entries. Matching is not
-      preserved if there are some duplicates...
+    * The output is sorted along the key.  Records with equal keys are in
+      the order of `r1`, then of `r2`.
+    * Only the keys of the smaller input are sorted or hashed and kept in
+      memory; the other input is matched in chunks.  The output is then
+      filled field by field, without concatenating the inputs.
 
     """
     # Check jointype
@@ -1021,9 +1575,6 @@ def join_by(key, r1, r2, jointype='inner', r1postfix='1', r2postfix='2',
     # Make sure we work with ravelled arrays
     r1 = r1.ravel()
     r2 = r2.ravel()
-    # Fixme: nb2 below is never used. Commenting out for pyflakes.
-    # (nb1, nb2) = (len(r1), len(r2))
-    nb1 = len(r1)
     (r1names, r2names) = (r1.dtype.names, r2.dtype.names)
 
     # Check the names for collision
@@ -1033,41 +1584,31 @@ def join_by(key, r1, r2, jointype='inner', r1postfix='1', r2postfix='2',
         msg += "can't both be empty"
         raise ValueError(msg)
 
-    # Make temporary arrays of just the keys
+    # Match the keys
     #  (use order of keys in `r1` for back-compatibility)
     key1 = [ n for n in r1names if n in key ]
-    r1k = _keep_fields(r1, key1)
-    r2k = _keep_fields(r2, key1)
-
-    # Concatenate the two arrays for comparison
-    aux = ma.concatenate((r1k, r2k))
-    idx_sort = aux.argsort(order=key)
-    aux = aux[idx_sort]
-    #
-    # Get the common keys
-    flag_in = ma.concatenate(([False], aux[1:] == aux[:-1]))
-    flag_in[:-1] = flag_in[1:] + flag_in[:-1]
-    idx_in = idx_sort[flag_in]
-    idx_1 = idx_in[(idx_in < nb1)]
-    idx_2 = idx_in[(idx_in >= nb1)] - nb1
-    (r1cmn, r2cmn) = (len(idx_1), len(idx_2))
+    (k1, k2) = _join_keys(r1, r2, key1)
+    (idx_1, idx_2, only_1, only_2) = _join_indices(k1, k2, method)
     if jointype == 'inner':
-        (r1spc, r2spc) = (0, 0)
-    elif jointype == 'outer':
-        idx_out = idx_sort[~flag_in]
-        idx_1 = np.concatenate((idx_1, idx_out[(idx_out < nb1)]))
-        idx_2 = np.concatenate((idx_2, idx_out[(idx_out >= nb1)] - nb1))
-        (r1spc, r2spc) = (len(idx_1) - r1cmn, len(idx_2) - r2cmn)
+        (only_1, only_2) = (only_1[:0], only_2[:0])
     elif jointype == 'leftouter':
-        idx_out = idx_sort[~flag_in]
-        idx_1 = np.concatenate((idx_1, idx_out[(idx_out < nb1)]))
-        (r1spc, r2spc) = (len(idx_1) - r1cmn, 0)
-    # Select the entries from each input
-    (s1, s2) = (r1[idx_1], r2[idx_2])
+        only_2 = only_2[:0]
+    # Sort the records along the key, -1 marking a missing side
+    outkeys = np.concatenate((k1[idx_1], k1[only_1], k2[only_2]))
+    if outkeys.dtype.names is None:
+        idx_sort = np.argsort(outkeys, kind='mergesort')
+    else:
+        idx_sort = np.argsort(outkeys, kind='mergesort', order=list(key))
+    del outkeys
+    missing = np.full(len(only_2), -1, dtype=np.intp)
+    idx_1 = np.concatenate((idx_1, only_1, missing))[idx_sort]
+    missing = np.full(len(only_1), -1, dtype=np.intp)
+    idx_2 = np.concatenate((idx_2, missing, only_2))[idx_sort]
+    del idx_sort
     #
     # Build the new description of the output array .......
     # Start with the key fields
-    ndtype = get_fieldspec(r1k.dtype)
+    ndtype = [(n, r1.dtype[n]) for n in key1]
 
     # Add the fields from r1
     for fname, fdtype in get_fieldspec(r1.dtype):
@@ -1099,32 +1640,51 @@ def join_by(key, r1, r2, jointype='inner', r1postfix='1', r2postfix='2',
                 ]
     # Rebuild a dtype from the new fields
     ndtype = np.dtype(ndtype)
-    # Find the largest nb of common fields :
-    # r1cmn and r2cmn should be equal, but...
-    cmn = max(r1cmn, r2cmn)
-    # Construct an empty array
-    output = ma.masked_all((cmn + r1spc + r2spc,), dtype=ndtype)
-    names = output.dtype.names
-    for f in r1names:
-        selected = s1[f]
-        if f not in names or (f in r2names and not r2postfix and f not in key):
-            f += r1postfix
-        current = output[f]
-        current[:r1cmn] = selected[:r1cmn]
-        if jointype in ('outer', 'leftouter'):
-            current[cmn:cmn + r1spc] = selected[r1cmn:]
-    for f in r2names:
-        selected = s2[f]
-        if f not in names or (f in r1names and not r1postfix and f not in key):
-            f += r2postfix
-        current = output[f]
-        current[:r2cmn] = selected[:r2cmn]
-        if (jointype == 'outer') and r2spc:
-            current[-r2spc:] = selected[r2cmn:]
-    # Sort and finalize the output
-    output.sort(order=key)
+    names = ndtype.names
+    #
+    # Fill the output field by field, in chunks.  The missing entries get
+    # the fill value, which is the default if one is given.
+    fill_value = _check_fill_value(None, ndtype)
+    for (k, v) in (defaults or {}).items():
+        if k in names:
+            fill_value[k] = v
+    output = np.empty(len(idx_1), dtype=ndtype)
+    mask = None
+    if usemask:
+        mask = np.zeros(len(idx_1), dtype=ma.make_mask_descr(ndtype))
+    for (r, idx, other, postfix, otherpostfix) in (
+            (r1, idx_1, r2names, r1postfix, r2postfix),
+            (r2, idx_2, r1names, r2postfix, r1postfix)):
+        for f in r.dtype.names:
+            selected = r[f]
+            if f not in names or (f in other and not otherpostfix and
+                                  f not in key):
+                f += postfix
+            for lo in range(0, len(idx), _JOIN_CHUNK):
+                rows = idx[lo:lo + _JOIN_CHUNK]
+                current = output[f][lo:lo + _JOIN_CHUNK]
+                if f in key:
+                    # The keys come from r1, or from r2 where r1 is missing
+                    if r is r1:
+                        keep = rows >= 0
+                    else:
+                        keep = idx_1[lo:lo + _JOIN_CHUNK] < 0
+                    current[keep] = selected[rows[keep]]
+                    continue
+                absent = rows < 0
+                if len(selected):
+                    current[...] = selected[rows]
+                if absent.any():
+                    current[absent] = fill_value[f]
+                    if mask is not None:
+                        m = mask[f][lo:lo + _JOIN_CHUNK]
+                        m[...] = absent.reshape((-1,) + (1,) * (m.ndim - 1))
+    # Finalize the output
+    if usemask:
+        output = ma.array(output, mask=mask, fill_value=fill_value,
+                          copy=False)
     kwargs = dict(usemask=usemask, asrecarray=asrecarray)
-    return _fix_output(_fix_defaults(output, defaults), **kwargs)
+    return _fix_output(output, **kwargs)
 
 
 def rec_join(key, r1, r2, jointype='inner', r1postfix='1', r2postfix='2',
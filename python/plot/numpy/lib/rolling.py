@@ -0,0 +1,241 @@
+"""
+Reductions over sliding windows.
+
+:Contains:
+  rolling_reduce
+
+:Notes:
+
+Sums, means, variances and extrema of all the windows of length ``w`` along
+an axis are computed in O(n) operations instead of the O(n*w) of reducing
+every window of `sliding_window_view`.  The axis is cut into blocks of
+``w`` values and the running reductions from both ends of every block are
+computed with ``ufunc.accumulate``.  A window then spans the tail of one
+block and the head of the next, and is the combination of two of these
+running values (van Herk and Gil-Werman).  As the running values never
+extend beyond one block, there is no growing round-off error as with
+differences of cumulative sums, and a NaN only affects the windows that
+contain it.
+
+Medians are computed on the windows themselves, a bounded number of
+windows at a time.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+from numpy.core.numeric import normalize_axis_index
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+__all__ = ['rolling_reduce']
+
+
+_FUNCS = ('sum', 'mean', 'var', 'std', 'min', 'max', 'median')
+
+# Number of window elements handled at a time by the median.
+_MEDIAN_BLOCK = 2 ** 20
+
+
+def _mean_type(dtype):
+    # Type of the means of values of type `dtype`, as for `mean`
+    if issubclass(dtype.type, np.inexact):
+        return dtype
+    return np.dtype(np.float64)
+
+
+def _abs2(z):
+    if issubclass(z.dtype.type, np.complexfloating):
+        return z.real ** 2 + z.imag ** 2
+    return z * z
+
+
+def _blocks(a, window, dtype):
+    """
+    Copy of `a` cut in blocks of `window` values along the last axis, of
+    shape ``a.shape[:-1] + (nblocks, window)``.
+
+    The last block is partial or, if the length is a multiple of `window`,
+    an extra one.  Its padding values are never used by any window.
+    """
+    n = a.shape[-1]
+    nblocks = n // window + 1
+    out = np.empty(a.shape[:-1] + (nblocks * window,), dtype=dtype)
+    out[..., :n] = a
+    out[..., n:] = 0
+    return out.reshape(a.shape[:-1] + (nblocks, window))
+
+
+def _scan(blocks, op, exclusive=False):
+    """
+    Running reductions of every block from its start and from its end,
+    flattened back to the last axis of the input.
+
+    With `exclusive`, the running reduction from the start of the block
+    does not include the current value, and is 0 at the start of a block.
+    """
+    shape = blocks.shape[:-2] + (-1,)
+    prefix = np.empty_like(blocks)
+    if exclusive:
+        prefix[..., 0] = 0
+        op.accumulate(blocks[..., :-1], axis=-1, out=prefix[..., 1:])
+    else:
+        op.accumulate(blocks, axis=-1, out=prefix)
+    suffix = np.empty_like(blocks)
+    op.accumulate(blocks[..., ::-1], axis=-1, out=suffix[..., ::-1])
+    return prefix.reshape(shape), suffix.reshape(shape)
+
+
+def _rolling_sum(a, window, dtype):
+    n = a.shape[-1]
+    prefix, suffix = _scan(_blocks(a, window, dtype), np.add, exclusive=True)
+    return suffix[..., :n - window + 1] + prefix[..., window:n + 1]
+
+
+def _rolling_extremum(a, window, op):
+    n = a.shape[-1]
+    prefix, suffix = _scan(_blocks(a, window, a.dtype), op)
+    return op(suffix[..., :n - window + 1], prefix[..., window - 1:n])
+
+
+def _rolling_var(a, window, ddof):
+    n = a.shape[-1]
+    nout = n - window + 1
+    blocks = _blocks(a, window, _mean_type(a.dtype))
+
+    # Shift every block by its first value, so that the sums of squares
+    # are of the deviations within the block and do not lose precision.
+    ref = blocks[..., 0].copy()
+    ref[~np.isfinite(ref)] = 0
+    blocks -= ref[..., None]
+    sum_pre, sum_suf = _scan(blocks, np.add, exclusive=True)
+    sq_pre, sq_suf = _scan(_abs2(blocks), np.add, exclusive=True)
+
+    # Statistics of the tail of the block the window starts in and of the
+    # head of the next block, merged as in Chan et al.
+    start = np.arange(nout)
+    count_b = (start % window).astype(sq_pre.dtype)
+    count_a = window - count_b
+    sum_a = sum_suf[..., :nout]
+    sum_b = sum_pre[..., window:n + 1]
+    mean_a = sum_a / count_a
+    mean_b = sum_b / np.maximum(count_b, 1)
+    m2 = sq_suf[..., :nout] - _abs2(sum_a) / count_a
+    m2 += sq_pre[..., window:n + 1] - _abs2(sum_b) / np.maximum(count_b, 1)
+    delta = (ref[..., start // window + 1] + mean_b -
+             (ref[..., start // window] + mean_a))
+    m2 += _abs2(delta) * (count_a * count_b / window)
+    np.maximum(m2, 0, out=m2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.true_divide(m2, max(window - ddof, 0), dtype=m2.dtype)
+
+
+def _rolling_median(a, window):
+    view = sliding_window_view(a, window, axis=-1)
+    out = np.empty(view.shape[:-1], dtype=_mean_type(a.dtype))
+    step = max(1, _MEDIAN_BLOCK // max(1, view[..., 0, :].size))
+    for start in range(0, out.shape[-1], step):
+        np.median(view[..., start:start + step, :], axis=-1,
+                  out=out[..., start:start + step])
+    return out
+
+
+def rolling_reduce(a, window, func='mean', axis=-1, ddof=0):
+    """
+    Reduce every sliding window along an axis.
+
+    The reduction `func` is computed for each window of `window`
+    consecutive values along `axis`, i.e. for the windows of
+    ``sliding_window_view(a, window, axis)``, but in a time that does not
+    grow with the window length except for the median.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    a : array_like
+        Input array.
+    window : int
+        Length of the windows, between 1 and the length of `axis`.
+    func : {'sum', 'mean', 'var', 'std', 'min', 'max', 'median'}, optional
+        Reduction to compute for each window.  Default is 'mean'.
+    axis : int, optional
+        Axis along which the windows slide.  Default is the last axis.
+    ddof : int, optional
+        Delta degrees of freedom of 'var' and 'std', see `var`.
+
+    Returns
+    -------
+    out : ndarray
+        The reductions, with the same shape as `a` except that `axis` has
+        length ``a.shape[axis] - window + 1``.  The types follow the ones of
+        the corresponding reductions, e.g. `sum` of integers gives at least
+        the default integer and `mean` gives floats.
+
+    Raises
+    ------
+    ValueError
+        If `func` is unknown, or `window` is not between 1 and the length
+        of `axis`.
+
+    See Also
+    --------
+    sliding_window_view : View of all the windows of an array.
+    group_reduce : Reductions of values grouped by key.
+
+    Notes
+    -----
+    The windows are not materialized.  Sums, means, variances and extrema
+    are computed in a few passes over the data with ``ufunc.accumulate``
+    on blocks of `window` values, see the module notes.  Their results may
+    differ from the ones of the corresponding reductions of the windows in
+    the last bits, as the values are added in a different order.  Medians
+    partition the windows, a bounded number of them at a time.
+
+    A NaN propagates to the windows that contain it, and to no others.
+
+    Examples
+    --------
+    >>> x = np.array([1., 4., 2., 8., 5., 7.])
+    >>> np.rolling_reduce(x, 3)
+    array([2.33333333, 4.66666667, 5.        , 6.66666667])
+    >>> np.rolling_reduce(x, 3, 'max')
+    array([4., 8., 8., 8.])
+
+    Along the rows of a 2-D array:
+
+    >>> x = np.arange(8).reshape(2, 4)
+    >>> np.rolling_reduce(x, 2, 'sum', axis=1)
+    array([[ 1,  3,  5],
+           [ 9, 11, 13]])
+
+    """
+    if func not in _FUNCS:
+        raise ValueError("unknown reduction %r, expected one of %s"
+                         % (func, ', '.join(_FUNCS)))
+    a = np.asarray(a)
+    if a.ndim == 0:
+        raise ValueError("cannot take windows of a 0-d array")
+    axis = normalize_axis_index(axis, a.ndim)
+    window = int(window)
+    if not 1 <= window <= a.shape[axis]:
+        raise ValueError("window must be between 1 and %d, got %d"
+                         % (a.shape[axis], window))
+    a = np.moveaxis(a, axis, -1)
+
+    if func == 'sum':
+        out = _rolling_sum(a, window, np.add.reduce(a[..., :0], -1).dtype)
+    elif func == 'mean':
+        out = _rolling_sum(a, window, _mean_type(a.dtype))
+        out = np.true_divide(out, window, out=out)
+    elif func in ('var', 'std'):
+        out = _rolling_var(a, window, ddof)
+        if func == 'std':
+            out = np.sqrt(out, out=out)
+    elif func == 'min':
+        out = _rolling_extremum(a, window, np.minimum)
+    elif func == 'max':
+        out = _rolling_extremum(a, window, np.maximum)
+    else:
+        out = _rolling_median(a, window)
+    return np.moveaxis(out, -1, axis)
@@ -8,8 +8,9 @@ NumPy reference guide.
 from __future__ import division, absolute_import, print_function
 
 import numpy as np
+from numpy.core.numeric import normalize_axis_tuple
 
-__all__ = ['broadcast_to', 'broadcast_arrays']
+__all__ = ['broadcast_to', 'broadcast_arrays', 'sliding_window_view']
 
 
 class DummyArray(object):
@@ -112,6 +113,117 @@ def as_strided(x, shape=None, strides=None, subok=False, writeable=True):
     return view
 
 
+def sliding_window_view(x, window_shape, axis=None, subok=False,
+                        writeable=False):
+    """
+    Create a sliding window view into the array.
+
+    Every window of shape `window_shape` that fits in `x` along the given
+    axes becomes one entry of the result, without copying any data.  This
+    is a safe alternative to computing the shape and strides for
+    `as_strided` by hand.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    x : array_like
+        Array to create the sliding window view from.
+    window_shape : int or tuple of int
+        Size of the window over each axis that takes part in the sliding
+        window.  If `axis` is not given, must have as many entries as `x`
+        has dimensions.
+    axis : int or tuple of int, optional
+        Axis or axes along which the sliding window is applied.  By
+        default, the window slides over all axes and `window_shape[i]`
+        refers to axis `i` of `x`.  An axis may be repeated, to take
+        several windows along it.
+    subok : bool, optional
+        If True, subclasses are preserved, otherwise the returned array is
+        forced to be a base-class array (default).
+    writeable : bool, optional
+        If True, the view is writeable when `x` is.  Default is False, as
+        the windows overlap and writing to one element affects several
+        windows.
+
+    Returns
+    -------
+    view : ndarray
+        Sliding window view of the array.  The axes of `x` are kept, each
+        one shortened by ``window_shape - 1`` along the windowed axes, and
+        the window dimensions are appended at the end.
+
+    Raises
+    ------
+    ValueError
+        If a window is negative or larger than the axis it slides over.
+
+    See Also
+    --------
+    as_strided : Create a view from arbitrary shape and strides.
+    rolling_reduce : Reduce every sliding window along an axis.
+
+    Notes
+    -----
+    Reducing the windows of the view, as in ``view.sum(axis=-1)``, takes a
+    time proportional to the size of the windows for every output value.
+    For the common reductions along one axis, `rolling_reduce` is faster.
+
+    Examples
+    --------
+    >>> x = np.arange(6)
+    >>> np.lib.stride_tricks.sliding_window_view(x, 3)
+    array([[0, 1, 2],
+           [1, 2, 3],
+           [2, 3, 4],
+           [3, 4, 5]])
+
+    Windows over the last axis of a 2-D array:
+
+    >>> x = np.arange(8).reshape(2, 4)
+    >>> v = np.lib.stride_tricks.sliding_window_view(x, 2, axis=-1)
+    >>> v.shape
+    (2, 3, 2)
+    >>> v[1, 2]
+    array([6, 7])
+
+    """
+    window_shape = (tuple(window_shape) if np.iterable(window_shape)
+                    else (window_shape,))
+    x = np.array(x, copy=False, subok=subok)
+
+    window_shape_array = np.array(window_shape)
+    if np.any(window_shape_array < 0):
+        raise ValueError('`window_shape` cannot contain negative values')
+
+    if axis is None:
+        axis = tuple(range(x.ndim))
+        if len(window_shape) != len(axis):
+            raise ValueError('Since axis is `None`, must provide '
+                             'window_shape for all dimensions of `x`; '
+                             'got {} window_shape elements and `x.ndim` '
+                             'is {}.'.format(len(window_shape), x.ndim))
+    else:
+        axis = normalize_axis_tuple(axis, x.ndim, allow_duplicate=True)
+        if len(window_shape) != len(axis):
+            raise ValueError('Must provide matching length window_shape and '
+                             'axis; got {} window_shape elements and {} axes '
+                             'elements.'.format(len(window_shape), len(axis)))
+
+    out_strides = x.strides + tuple(x.strides[ax] for ax in axis)
+
+    # note: same axis can be windowed repeatedly
+    x_shape_trimmed = list(x.shape)
+    for ax, dim in zip(axis, window_shape):
+        if x_shape_trimmed[ax] < dim:
+            raise ValueError(
+                'window shape cannot be larger than input array shape')
+        x_shape_trimmed[ax] -= dim - 1
+    out_shape = tuple(x_shape_trimmed) + window_shape
+    return as_strided(x, strides=out_strides, shape=out_shape,
+                      subok=subok, writeable=writeable)
+
+
 def _broadcast_to(array, shape, subok, readonly):
     shape = tuple(shape) if np.iterable(shape) else (shape,)
     array = np.array(array, copy=False, subok=subok)
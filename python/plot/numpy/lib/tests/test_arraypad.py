@@ -4,7 +4,8 @@
 from __future__ import division, absolute_import, print_function
 
 import numpy as np
-from numpy.testing import (assert_array_equal, assert_raises, assert_allclose,)
+from numpy.testing import (assert_array_equal, assert_raises, assert_allclose,
+                           assert_equal, assert_)
 from numpy.lib import pad
 
 
@@ -988,6 +989,43 @@ class TestNdarrayPadWidth(object):
         assert_array_equal(a, b)
 
 
+class TestInPlace(object):
+    modes = ['constant', 'edge', 'linear_ramp', 'maximum', 'mean', 'median',
+             'minimum', 'reflect', 'symmetric', 'wrap']
+
+    def test_input_unchanged(self):
+        a = np.arange(24.).reshape(2, 3, 4)
+        b = a.copy()
+        for mode in self.modes:
+            res = pad(a, ((1, 7), (0, 3), (5, 2)), mode)
+            assert_array_equal(a, b)
+            assert_array_equal(res[1:3, 0:3, 5:9], a)
+            assert_(not np.may_share_memory(res, a))
+
+    def test_large_pad_3d(self):
+        # Padding one axis at a time gives the same result
+        a = np.arange(60).reshape(3, 4, 5)
+        for mode in ['reflect', 'symmetric', 'wrap']:
+            for reflect_type in ['even', 'odd']:
+                kwargs = {} if mode == 'wrap' else {
+                    'reflect_type': reflect_type}
+                res = pad(a, 11, mode, **kwargs)
+                expected = a
+                for axis in range(3):
+                    width = [(0, 0)] * 3
+                    width[axis] = (11, 11)
+                    expected = pad(expected, width, mode, **kwargs)
+                assert_array_equal(res, expected)
+
+    def test_dtype_preserved(self):
+        a = np.array([True, False, False])
+        assert_equal(pad(a, 2, 'reflect', reflect_type='odd').dtype, bool)
+        a = np.array([1, 'a', None], dtype=object)
+        assert_array_equal(pad(a, 2, 'edge'),
+                           np.array([1, 1, 1, 'a', None, None, None],
+                                    dtype=object))
+
+
 class TestUnicodeInput(object):
     def test_unicode_mode(self):
         constant_mode = u'constant'
@@ -1,12 +1,15 @@
 from __future__ import division, absolute_import, print_function
 
+import os
 from operator import mul
 from functools import reduce
 
 import numpy as np
 from numpy.random import randint
 from numpy.lib import Arrayterator
-from numpy.testing import assert_
+from numpy.testing import (
+    assert_, assert_equal, assert_array_equal, assert_raises, tempdir
+    )
 
 
 def test():
@@ -47,6 +50,69 @@ def test():
     # Check that all elements are iterated correctly
     assert_(list(c.flat) == list(d.flat))
 
+
+def test_order():
+    a = np.arange(3 * 4 * 5).reshape(3, 4, 5)
+    for var, order, first in [(a, 'C', [0, 1, 2, 3]),
+                              (a, 'F', [0, 20, 40, 5]),
+                              (a, 'K', [0, 1, 2, 3]),
+                              (np.asfortranarray(a), 'K', [0, 20, 40, 5])]:
+        blocks = list(Arrayterator(var, 7, order=order))
+        for block in blocks:
+            assert_(block.size <= 7)
+        assert_array_equal(blocks[0].ravel(order=order.replace('K', 'A')
+                                           )[:4], first)
+        values = np.concatenate([block.ravel() for block in blocks])
+        assert_array_equal(np.sort(values), a.ravel())
+    assert_raises(ValueError, Arrayterator, a, 7, order='A')
+
+
+def test_prefetch():
+    a = np.arange(100.).reshape(10, 10)
+    it = Arrayterator(a, 15, prefetch=2)
+    blocks = list(it)
+    assert_equal([b.shape for b in blocks],
+                 [s.shape for s in Arrayterator(a, 15)])
+    for block, expected in zip(blocks, Arrayterator(a, 15)):
+        assert_array_equal(block, expected)
+        assert_(not np.may_share_memory(block, a))
+    assert_equal(it[2:5].prefetch, 2)
+
+    # Stopping early or failing reads end the reading thread
+    blocks = iter(it)
+    next(blocks)
+    blocks.close()
+
+    class Failing(object):
+        shape = (5,)
+        ndim = 1
+
+        def __getitem__(self, index):
+            raise IOError("cannot read")
+
+    assert_raises(IOError, list, Arrayterator(Failing(), 2, prefetch=1))
+
+
+def test_memmap_map():
+    a = np.asfortranarray(np.arange(2700.).reshape(30, 90))
+    with tempdir() as tmpdir:
+        filename = os.path.join(tmpdir, 'big.npy')
+        np.save(filename, a)
+        m = np.load(filename, mmap_mode='r')
+        it = Arrayterator(m, 90, order='K', prefetch=3)
+        sums = list(it.map(np.sum, workers=3))
+        assert_equal(len(sums), 30)
+        assert_array_equal(sums, a.sum(axis=0).reshape(-1, 3).sum(axis=1))
+        del m, it
+
+    def fail(block):
+        raise KeyError(block.size)
+
+    assert_raises(KeyError, list, Arrayterator(a, 10).map(fail, workers=2))
+    # bad arguments fail at the call, not on the first result
+    assert_raises(ValueError, Arrayterator(a, 10).map, np.sum, 0)
+    assert_raises(TypeError, Arrayterator(a, 10).map, None)
+
 if __name__ == '__main__':
     from numpy.testing import run_module_suite
     run_module_suite()
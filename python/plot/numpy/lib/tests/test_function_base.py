@@ -17,10 +17,10 @@ import numpy.lib.function_base as nfb
 from numpy.random import rand
 from numpy.lib import (
     add_newdoc_ufunc, angle, average, bartlett, blackman, corrcoef, cov,
-    delete, diff, digitize, extract, flipud, gradient, hamming, hanning,
-    histogram, histogramdd, i0, insert, interp, kaiser, meshgrid, msort,
-    piecewise, place, rot90, select, setxor1d, sinc, split, trapz, trim_zeros,
-    unwrap, unique, vectorize
+    CovAccumulator, delete, diff, digitize, extract, flipud, gradient,
+    hamming, hanning, histogram, histogramdd, i0, insert, interp,
+    Interpolator, kaiser, meshgrid, msort, piecewise, place, rot90, select,
+    setxor1d, sinc, split, trapz, trim_zeros, unwrap, unique, vectorize
 )
 
 from numpy.compat import long
@@ -2341,6 +2341,66 @@ class TestCov(object):
                         self.res1)
 
 
+class TestCovAccumulator(object):
+
+    def accumulate(self, x, chunks, rowvar=True, blocksize=None, **kwargs):
+        # one accumulator per chunk, merged as workers would be
+        acc = CovAccumulator(rowvar, blocksize)
+        axis = 1 if rowvar else 0
+        bounds = np.linspace(0, x.shape[axis], chunks + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            part = CovAccumulator(rowvar, blocksize)
+            weights = dict((k, v[start:stop]) for k, v in kwargs.items())
+            part.add(x.take(np.arange(start, stop), axis=axis), **weights)
+            acc.merge(part)
+        return acc
+
+    def test_chunks(self):
+        x = rand(4, 100) + 1e6
+        for chunks in [1, 3, 10]:
+            for blocksize in [None, 7]:
+                acc = self.accumulate(x, chunks, blocksize=blocksize)
+                assert_equal(acc.count, 100)
+                assert_allclose(acc.mean, x.mean(axis=1))
+                assert_allclose(acc.cov(), cov(x))
+                assert_allclose(acc.cov(bias=True), cov(x, bias=True))
+                assert_allclose(acc.corrcoef(), corrcoef(x))
+        acc = self.accumulate(x.T, 3, rowvar=False)
+        assert_allclose(acc.cov(), cov(x))
+
+    def test_weights(self):
+        x = rand(3, 50)
+        f = np.arange(50) % 4
+        a = rand(50)
+        for kwargs in [dict(fweights=f), dict(aweights=a),
+                       dict(fweights=f, aweights=a)]:
+            for ddof in [0, 1, 2]:
+                acc = self.accumulate(x, 4, blocksize=5, **kwargs)
+                assert_allclose(acc.cov(ddof=ddof), cov(x, ddof=ddof, **kwargs))
+
+    def test_1D_and_complex(self):
+        x = rand(20)
+        y = rand(20) * 1j
+        acc = CovAccumulator()
+        acc.add(x[:10], y[:10])
+        acc.add(x[10:], y[10:])
+        assert_allclose(acc.cov(), cov(x, y))
+        acc = CovAccumulator()
+        acc.add(x)
+        assert_allclose(acc.cov(), cov(x))
+        assert_equal(acc.corrcoef(), 1.)
+
+    def test_errors(self):
+        acc = CovAccumulator()
+        assert_raises(ValueError, acc.cov)
+        acc.add(rand(2, 5))
+        assert_raises(ValueError, acc.add, rand(3, 5))
+        assert_raises(RuntimeError, acc.add, rand(2, 5), fweights=[1, 2])
+        other = CovAccumulator()
+        other.add(rand(3, 5))
+        assert_raises(ValueError, acc.merge, other)
+
+
 class Test_I0(object):
 
     def test_simple(self):
@@ -2780,6 +2840,74 @@ class TestInterp(object):
         assert_almost_equal(np.interp(x, xp, fp, period=360), y)
 
 
+class TestInterpolator(object):
+
+    def test_exceptions(self):
+        assert_raises(ValueError, Interpolator, [], [])
+        assert_raises(ValueError, Interpolator, [0], [1, 2])
+        assert_raises(ValueError, Interpolator, [0, 1], [1, 2], period=0)
+        assert_raises(ValueError, Interpolator, [0, 1], [1, 2], threads=0)
+
+    def test_matches_interp(self):
+        np.random.seed(1234)
+        # regular, clustered, and repeated data points
+        for xp in [np.linspace(-1, 1, 101),
+                   np.sort(np.random.standard_cauchy(100)),
+                   np.repeat(np.arange(20.), 3), np.array([0.5]),
+                   np.array([0., 1.])]:
+            fp = np.random.random(len(xp))
+            x = np.concatenate((np.random.uniform(-1.2, 1.2, 500),
+                                xp, [np.nan, np.inf, -np.inf]))
+            for f, kwargs in [(fp, {}), (fp, dict(left=-1, right=2)),
+                              (fp + 1j * fp[::-1], {})]:
+                interpolator = Interpolator(xp, f, **kwargs)
+                for xx in [x, np.sort(x[:500]), np.sort(x[:500])[::-1],
+                           x[:500].reshape(-1, 2, 5)]:
+                    assert_equal(interpolator(xx), interp(xx, xp, f, **kwargs))
+                assert_equal(interpolator(0.3), interp(0.3, xp, f, **kwargs))
+
+    def test_complex_exact(self):
+        # more and fewer queries than data points, which interp evaluates
+        # differently for complex data
+        np.random.seed(1234)
+        for i in range(50):
+            xp = np.sort(np.random.uniform(-5, 5, 200))
+            fp = np.random.randn(200) + 1j * np.random.randn(200)
+            interpolator = Interpolator(xp, fp)
+            for n in [300, 50]:
+                x = np.random.uniform(-6, 6, n)
+                assert_array_equal(interpolator(x), interp(x, xp, fp))
+
+    def test_no_warnings(self):
+        xp = np.linspace(0, 10, 100)
+        fp = np.sin(xp)
+        interpolator = Interpolator(xp, fp)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for x in [[5.5, 11., 1.2], [5.5, np.nan, 1.2, np.inf],
+                      [np.nan, 1., 2.], [2., 1., np.nan]]:
+                assert_equal(interpolator(x), interp(x, xp, fp))
+
+    def test_period(self):
+        x = [-180, -170, -185, 185, -10, -5, 0, 365]
+        xp = [190, -190, 350, -350]
+        fp = [5, 10, 3, 4]
+        interpolator = Interpolator(xp, fp, period=360)
+        assert_equal(interpolator(x), interp(x, xp, fp, period=360))
+        assert_equal(interpolator(-180), interp(-180, xp, fp, period=360))
+
+    def test_chunks(self):
+        xp = np.linspace(0, 10, 1000)
+        fp = np.sin(xp)
+        x = np.random.uniform(-1, 11, 1000)
+        for threads in [1, 3]:
+            interpolator = Interpolator(xp, fp, threads=threads)
+            interpolator.chunksize = 64
+            assert_equal(interpolator(x), interp(x, xp, fp))
+            x.sort()
+            assert_equal(interpolator(x), interp(x, xp, fp))
+
+
 def compare_results(res, desired):
     for i in range(len(desired)):
         assert_array_equal(res[i], desired[i])
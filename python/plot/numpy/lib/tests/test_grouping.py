@@ -0,0 +1,140 @@
+"""Test functions for the grouped reductions.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+from numpy.testing import (
+    run_module_suite, assert_, assert_equal, assert_almost_equal,
+    assert_raises
+    )
+from numpy.lib.grouping import group_reduce, GroupAccumulator
+
+
+_FUNCS = ('count', 'sum', 'mean', 'var', 'std', 'min', 'max', 'first',
+          'last')
+
+
+def reference(keys, values, func):
+    # Reduction of every group, one group at a time
+    ufuncs = {'count': len, 'sum': np.sum, 'mean': np.mean, 'var': np.var,
+              'std': np.std, 'min': np.min, 'max': np.max,
+              'first': lambda v, axis: v[0], 'last': lambda v, axis: v[-1]}
+    out = []
+    for k in np.unique(keys):
+        v = values[keys == k]
+        out.append(len(v) if func == 'count' else ufuncs[func](v, axis=0))
+    return np.array(out)
+
+
+class TestGroupReduce(object):
+
+    def setup(self):
+        rng = np.random.RandomState(7)
+        self.keys = [rng.randint(-3, 5, 100).astype(np.int8),
+                     rng.randint(0, 10**9, 100),
+                     rng.choice(['a', 'bc', 'd'], 100),
+                     rng.rand(100).round(1)]
+        self.values = [rng.rand(100), rng.randint(0, 50, 100),
+                       rng.rand(100, 2) + 1j * rng.rand(100, 2)]
+
+    def test_reductions(self):
+        for keys in self.keys:
+            for values in self.values:
+                for method in ['auto', 'sort']:
+                    uniq, res = group_reduce(keys, values, _FUNCS, method)
+                    assert_equal(uniq, np.unique(keys))
+                    for func in _FUNCS:
+                        assert_almost_equal(res[func],
+                                            reference(keys, values, func))
+
+    def test_single(self):
+        keys = np.array([2, 1, 2, 3, 1])
+        values = np.array([1., 2., 3., 4., 5.])
+        uniq, res = group_reduce(keys, values)
+        assert_equal(uniq, [1, 2, 3])
+        assert_equal(res, [7., 4., 4.])
+        uniq, res = group_reduce(keys, funcs='count', method='hash')
+        assert_equal(res, [2, 2, 1])
+
+    def test_dtypes(self):
+        keys = np.array([0, 1, 0])
+        values = np.array([100, 100, 100], dtype=np.int8)
+        uniq, res = group_reduce(keys, values, ('sum', 'mean', 'max'))
+        assert_equal(res['sum'], [200, 100])
+        assert_equal(res['sum'].dtype, np.add.reduce(values).dtype)
+        assert_equal(res['mean'].dtype, np.float64)
+        assert_equal(res['max'].dtype, np.int8)
+        values = values.astype(np.float32)
+        uniq, res = group_reduce(keys, values, ('sum', 'mean', 'var'))
+        for func in ('sum', 'mean', 'var'):
+            assert_equal(res[func].dtype, np.float32)
+
+    def test_multiple_columns(self):
+        k1 = np.array([1, 0, 1, 1, 0])
+        k2 = np.array(['b', 'a', 'a', 'b', 'a'])
+        values = np.arange(5.)
+        for method in ['auto', 'sort']:
+            uniq, res = group_reduce([k1, k2], values, method=method)
+            assert_equal(uniq.dtype.names, ('f0', 'f1'))
+            assert_equal(uniq.tolist(), [(0, b'a'), (1, b'a'), (1, b'b')])
+            assert_equal(res, [5., 2., 3.])
+        keys = np.array([(1, 2), (0, 5), (1, 2)],
+                        dtype=[('x', int), ('y', int)])
+        for method in ['hash', 'sort']:
+            uniq, res = group_reduce(keys, [1, 2, 3], 'last', method)
+            assert_equal(uniq.tolist(), [(0, 5), (1, 2)])
+            assert_equal(res, [2, 3])
+
+    def test_empty(self):
+        uniq, res = group_reduce(np.array([], int), np.array([]), _FUNCS)
+        assert_equal(len(uniq), 0)
+        for func in _FUNCS:
+            assert_equal(len(res[func]), 0)
+
+    def test_errors(self):
+        assert_raises(ValueError, group_reduce, [1, 2], [1, 2], 'median')
+        assert_raises(ValueError, group_reduce, [1, 2], [1, 2, 3])
+        assert_raises(ValueError, group_reduce, [1, 2], None, 'sum')
+        assert_raises(ValueError, group_reduce, [1, 2], [1, 2], 'sum', 'tree')
+        assert_raises(ValueError, group_reduce, [0.5, 1], [1, 2], 'sum',
+                      'hash')
+        assert_raises(ValueError, group_reduce, [0, 10**9], [1, 2], 'sum',
+                      'hash')
+
+
+class TestGroupAccumulator(object):
+
+    def test_chunks_and_merge(self):
+        rng = np.random.RandomState(3)
+        keys = rng.randint(0, 8, 200)
+        for values in [rng.rand(200), rng.randint(-9, 9, (200, 3))]:
+            uniq, control = group_reduce(keys, values, _FUNCS)
+            workers = []
+            for lo in range(0, 200, 60):
+                acc = GroupAccumulator(_FUNCS)
+                for start in range(lo, min(lo + 60, 200), 25):
+                    stop = min(start + 25, lo + 60)
+                    acc.add(keys[start:stop], values[start:stop])
+                workers.append(acc)
+            for acc in workers[1:]:
+                workers[0].merge(acc)
+            res_uniq, res = workers[0].result()
+            assert_equal(res_uniq, uniq)
+            for func in _FUNCS:
+                assert_almost_equal(res[func], control[func])
+
+    def test_result(self):
+        acc = GroupAccumulator('var')
+        assert_raises(ValueError, acc.result)
+        acc.add(['a', 'b', 'a'], [1., 2., 3.])
+        acc.add(['c', 'a'], [4., 5.])
+        uniq, res = acc.result(ddof=1)
+        assert_equal(uniq, ['a', 'b', 'c'])
+        assert_almost_equal(res[0], 4.)
+        assert_(np.isnan(res[1:]).all())
+        assert_raises(ValueError, acc.merge, GroupAccumulator('sum'))
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -585,6 +585,78 @@ class TestNanFunctions_MeanVarStd(SharedNanFunctionsTestsMixin):
                     assert_(len(w) == 0)
 
 
+class TestNanFunctions_Blocked(object):
+    # The tiled sum/mean/var path, forced on small arrays by shrinking the
+    # tile size, must agree with the reference path.
+
+    nanfuncs = [np.nansum, np.nanmean, np.nanvar, np.nanstd]
+
+    def setup(self):
+        from numpy.lib import nanfunctions
+        self.nanfunctions = nanfunctions
+        self.block = nanfunctions._NAN_BLOCK
+
+    def teardown(self):
+        self.nanfunctions._NAN_BLOCK = self.block
+
+    def reference(self, f, *args, **kwargs):
+        self.nanfunctions._NAN_BLOCK = np.inf
+        try:
+            return f(*args, **kwargs)
+        finally:
+            self.nanfunctions._NAN_BLOCK = 7
+
+    def test_matches_reference(self):
+        self.nanfunctions._NAN_BLOCK = 7
+        mat = np.arange(2 * 5 * 11, dtype=float).reshape(2, 5, 11) ** 0.5
+        mat[:, ::3, 1::4] = np.nan
+        mat[0, 1] = np.nan
+        with suppress_warnings() as sup:
+            sup.filter(RuntimeWarning)
+            for a in [mat, mat.transpose(2, 0, 1), mat.astype(np.float32),
+                      mat * (1 + 1j), mat[:, ::2, ::3]]:
+                for f in self.nanfuncs:
+                    for axis in [None, 0, 1, -1]:
+                        for keepdims in [False, True]:
+                            res = f(a, axis=axis, keepdims=keepdims)
+                            tgt = self.reference(f, a, axis=axis,
+                                                 keepdims=keepdims)
+                            assert_equal(res.dtype, tgt.dtype)
+                            assert_equal(res.shape, tgt.shape)
+                            assert_almost_equal(res, tgt, decimal=4)
+
+    def test_ddof_and_out(self):
+        self.nanfunctions._NAN_BLOCK = 7
+        a = _ndat.repeat(5, axis=1)
+        for f in [np.nanvar, np.nanstd]:
+            for ddof in [0, 1]:
+                out = np.empty(a.shape[0])
+                res = f(a, axis=1, ddof=ddof, out=out)
+                assert_(res is out)
+                tgt = [np.std(d.repeat(5), ddof=ddof) ** 2 for d in _rdat]
+                if f is np.nanstd:
+                    tgt = np.sqrt(tgt)
+                assert_almost_equal(res, tgt)
+
+    def test_allnans(self):
+        self.nanfunctions._NAN_BLOCK = 7
+        mat = np.full((3, 4), np.nan)
+        mat[0] = 1
+        for f in [np.nanmean, np.nanvar]:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                res = f(mat, axis=1)
+                assert_equal(np.isnan(res), [False, True, True])
+                assert_(len(w) == 1)
+                assert_(issubclass(w[0].category, RuntimeWarning))
+        assert_equal(np.nansum(mat, axis=1), [4, 0, 0])
+
+    def test_no_copy_needed(self):
+        # Integer arrays have no NaNs and are passed through as is.
+        a = np.arange(10)
+        assert_(self.nanfunctions._replace_nan(a, 0)[0] is a)
+
+
 class TestNanFunctions_Median(object):
 
     def test_mutation(self):
@@ -10,7 +10,8 @@ from numpy.testing import (
 from numpy.lib.recfunctions import (
     drop_fields, rename_fields, get_fieldstructure, recursive_fill_fields,
     find_duplicates, merge_arrays, append_fields, stack_arrays, join_by,
-    repack_fields)
+    repack_fields, structured_to_unstructured, unstructured_to_structured,
+    to_columns, from_columns)
 get_names = np.lib.recfunctions.get_names
 get_names_flat = np.lib.recfunctions.get_names_flat
 zip_descr = np.lib.recfunctions.zip_descr
@@ -205,6 +206,81 @@ class TestRecFunctions(object):
         assert_(repack_fields(dt).type is np.record)
 
 
+    def test_structured_to_unstructured(self):
+        a = np.zeros(4, dtype=[('a', 'i4'), ('b', 'f4', (2,)), ('c', 'f8')])
+        a['a'] = np.arange(4)
+        a['b'] = [[1, 2]] * 4
+        a['c'] = 3
+        out = structured_to_unstructured(a)
+        assert_equal(out, [[i, 1, 2, 3] for i in range(4)])
+        assert_equal(out.dtype, np.float64)
+        assert_equal(structured_to_unstructured(a, dtype='i4').dtype,
+                     np.int32)
+        assert_raises(TypeError, structured_to_unstructured, a, dtype='i4',
+                      casting='safe')
+
+        b = np.array([(1, (4, 5)), (3, (6, 7))],
+                     dtype=[('x', 'i4'), ('y', [('p', 'i4'), ('q', 'i4')])])
+        assert_equal(unstructured_to_structured(
+                        structured_to_unstructured(b), b.dtype), b)
+        assert_raises(ValueError, structured_to_unstructured, np.arange(3))
+
+    def test_structured_to_unstructured_view(self):
+        # evenly spaced fields of the same type are viewed
+        dt = np.dtype({'names': ['a', 'b', 'c'], 'formats': ['f4'] * 3,
+                       'offsets': [0, 8, 16], 'itemsize': 24})
+        a = np.zeros(3, dtype=dt)
+        out = structured_to_unstructured(a)
+        assert_(np.may_share_memory(out, a))
+        out[:, 1] = 5
+        assert_equal(a['b'], [5, 5, 5])
+        assert_(not np.may_share_memory(
+                    structured_to_unstructured(a, copy=True), a))
+        assert_(not np.may_share_memory(
+                    structured_to_unstructured(a, dtype='f8'), a))
+        # unevenly spaced fields are copied
+        dt = np.dtype({'names': ['a', 'b', 'c'], 'formats': ['f4'] * 3,
+                       'offsets': [0, 4, 16], 'itemsize': 24})
+        a = np.zeros(3, dtype=dt)
+        assert_(not np.may_share_memory(structured_to_unstructured(a), a))
+
+    def test_unstructured_to_structured(self):
+        x = np.arange(12.).reshape(4, 3)
+        out = unstructured_to_structured(x, names=['x', 'y', 'z'])
+        assert_equal(out.dtype.names, ('x', 'y', 'z'))
+        assert_equal(out['y'], x[:, 1])
+        assert_(np.may_share_memory(out, x))
+        out = unstructured_to_structured(x[::2, ::-1])
+        assert_equal(out['f0'], [2., 8.])
+        assert_(not np.may_share_memory(out, x))
+        dt = np.dtype([('a', 'i4'), ('b', 'f4', (2,))])
+        out = unstructured_to_structured(x, dt)
+        assert_equal(out['a'], [0, 3, 6, 9])
+        assert_equal(out['b'], x[:, 1:])
+        assert_raises(ValueError, unstructured_to_structured, x[:, :2], dt)
+        assert_raises(ValueError, unstructured_to_structured, x, dt,
+                      names=['a', 'b'])
+
+    def test_columns(self):
+        a = np.array([(1, [1., 2.], b'a'), (2, [3., 4.], b'b')],
+                     dtype=[('x', 'i4'), ('y', 'f8', (2,)), ('z', 'S2')])
+        cols = to_columns(a)
+        assert_equal(list(cols.keys()), ['x', 'y', 'z'])
+        assert_equal(cols['y'], [[1, 2], [3, 4]])
+        assert_(cols['y'].flags.c_contiguous)
+        assert_(not np.may_share_memory(cols['x'], a))
+        assert_(np.may_share_memory(to_columns(a, copy=False)['x'], a))
+        assert_equal(from_columns(cols), a)
+        assert_equal(from_columns(cols, dtype=a.dtype), a)
+        assert_equal(from_columns(cols, dtype=a.dtype.descr), a)
+        out = from_columns(cols, dtype=[('z', 'S1'), ('x', 'f8')])
+        assert_equal(out['x'], [1., 2.])
+        out = from_columns(cols, names=['z', 'x'])
+        assert_equal(out.dtype.names, ('z', 'x'))
+        assert_equal(out['x'], [1, 2])
+        assert_raises(ValueError, from_columns, {'a': [1, 2], 'b': [1]})
+
+
 class TestRecursiveFillFields(object):
     # Test recursive_fill_fields.
     def test_simple_flexible(self):
@@ -400,6 +476,22 @@ class TestAppendFields(object):
                            dtype=[('A', '|S3'), ('B', float), ('C', int)],)
         assert_equal(test, control)
 
+    def test_append_same_size(self):
+        # Test the single pass of arrays of the same size
+        (w, x, _, _) = self.data
+        test = append_fields(w, ('A', 'B'), data=[[10, 20], [1., 2.]])
+        control = ma.array([(1, (2, 3.0), 10, 1.), (4, (5, 6.0), 20, 2.)],
+                           mask=[(0, (0, 0), 0, 0), (0, (0, 0), 0, 0)],
+                           dtype=[('a', int),
+                                  ('b', [('ba', float), ('bb', int)]),
+                                  ('A', int), ('B', float)],)
+        assert_equal(test, control)
+        assert_equal(test.mask, control.mask)
+        test = append_fields(x, 'A', data=[10, 20], usemask=False,
+                             asrecarray=True)
+        assert_(isinstance(test, np.recarray))
+        assert_equal(test.A, [10, 20])
+
     def test_append_on_nested(self):
         # Test append_fields on nested fields
         w = self.data[0]
@@ -755,6 +847,73 @@ class TestJoinBy(object):
 
         assert_equal(res.dtype, expected_dtype)
 
+    def test_many_to_many(self):
+        a = np.array([(1, 10), (2, 20), (1, 11), (3, 30)],
+                     dtype=[('k', int), ('x', int)])
+        b = np.array([(1, 100), (1, 101), (2, 200), (4, 400)],
+                     dtype=[('k', int), ('y', int)])
+        dtype = [('k', int), ('x', int), ('y', int)]
+        for method in ['auto', 'hash', 'sort']:
+            res = join_by('k', a, b, usemask=False, method=method)
+            control = np.array([(1, 10, 100), (1, 10, 101), (1, 11, 100),
+                                (1, 11, 101), (2, 20, 200)], dtype=dtype)
+            assert_equal(res, control)
+
+            res = join_by('k', a, b, jointype='outer', method=method)
+            control = ma.array([(1, 10, 100), (1, 10, 101), (1, 11, 100),
+                                (1, 11, 101), (2, 20, 200), (3, 30, -1),
+                                (4, -1, 400)],
+                               mask=[(0, 0, 0)] * 5 + [(0, 0, 1), (0, 1, 0)],
+                               dtype=dtype)
+            assert_equal(res, control)
+            assert_equal(res.mask, control.mask)
+
+    def test_methods(self):
+        a, b = self.a, self.b
+        for jointype in ['inner', 'outer', 'leftouter']:
+            control = join_by(('a', 'b'), a, b, jointype, method='sort')
+            test = join_by(('a', 'b'), a, b, jointype, method='hash')
+            assert_equal(test, control)
+            assert_equal(test.mask, control.mask)
+        c = np.array([(0.5, 1)], dtype=[('a', float), ('e', int)])
+        assert_raises(ValueError, join_by, 'a', a, c, method='hash')
+        assert_raises(ValueError, join_by, 'a', a, b, method='merge')
+
+    def test_negative_narrow_keys(self):
+        for kt in ['i1', 'i2']:
+            a = np.array([(-128 + 127 * (kt == 'i1'), 1), (-5, 2), (3, 3)],
+                         dtype=[('k', kt), ('x', int)])
+            b = np.array([(3, 30), (-5, 20), (100, 40)],
+                         dtype=[('k', kt), ('y', int)])
+            dtype = [('k', kt), ('x', int), ('y', int)]
+            control = np.array([(-5, 2, 20), (3, 3, 30)], dtype=dtype)
+            for method in ['hash', 'sort']:
+                res = join_by('k', a, b, usemask=False, method=method)
+                assert_equal(res, control)
+        # keys of the two sides with different signedness
+        a = np.array([(-1, 1), (2, 2)], dtype=[('k', 'i1'), ('x', int)])
+        b = np.array([(2, 20), (255, 40)], dtype=[('k', 'u1'), ('y', int)])
+        res = join_by('k', a, b, usemask=False, method='hash')
+        assert_equal(res['x'], [2])
+        assert_equal(res['y'], [20])
+
+    def test_chunks(self):
+        from numpy.lib import recfunctions
+        chunk = recfunctions._JOIN_CHUNK
+        a, b = self.a, self.b
+        controls = [join_by('a', a, r2, 'outer', defaults={'d': -5})
+                    for r2 in (b, b[:4])]
+        try:
+            recfunctions._JOIN_CHUNK = 3
+            for method in ['hash', 'sort']:
+                for (r2, control) in zip((b, b[:4]), controls):
+                    test = join_by('a', a, r2, 'outer', defaults={'d': -5},
+                                   method=method)
+                    assert_equal(test, control)
+                    assert_equal(test.filled()['d'][test.mask['d']], -5)
+        finally:
+            recfunctions._JOIN_CHUNK = chunk
+
 
 class TestJoinBy2(object):
     @classmethod
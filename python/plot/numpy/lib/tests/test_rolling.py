@@ -0,0 +1,79 @@
+"""Test functions for the rolling reductions.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+from numpy.testing import (
+    run_module_suite, assert_, assert_equal, assert_almost_equal,
+    assert_allclose, assert_raises
+    )
+from numpy.lib.rolling import rolling_reduce
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+_REDUCTIONS = {'sum': np.sum, 'mean': np.mean, 'var': np.var, 'std': np.std,
+               'min': np.min, 'max': np.max, 'median': np.median}
+
+
+class TestRollingReduce(object):
+
+    def test_reductions(self):
+        rng = np.random.RandomState(5)
+        for a in [rng.rand(50), rng.randint(-20, 20, (4, 13)),
+                  rng.rand(3, 7, 5).astype(np.float32)]:
+            for axis in range(-1, a.ndim):
+                for window in [1, 2, 5, a.shape[axis]]:
+                    window = min(window, a.shape[axis])
+                    windows = sliding_window_view(a, window, axis)
+                    for func, reduction in _REDUCTIONS.items():
+                        res = rolling_reduce(a, window, func, axis)
+                        expected = reduction(windows, axis=-1)
+                        assert_equal(res.dtype, expected.dtype)
+                        assert_allclose(res, expected, rtol=1e-5, atol=1e-5)
+
+    def test_ddof_and_complex(self):
+        a = np.arange(10.) + 1j * np.arange(10.) ** 2
+        windows = sliding_window_view(a, 4)
+        for ddof in [0, 1]:
+            assert_almost_equal(rolling_reduce(a, 4, 'var', ddof=ddof),
+                                windows.var(axis=-1, ddof=ddof))
+        assert_almost_equal(rolling_reduce(a, 4, 'sum'), windows.sum(-1))
+
+    def test_precision(self):
+        # Round-off does not grow along the axis, even far from zero
+        rng = np.random.RandomState(0)
+        a = 1e6 + rng.rand(100000)
+        expected = sliding_window_view(a, 10).var(axis=-1)
+        assert_allclose(rolling_reduce(a, 10, 'var'), expected, rtol=1e-5)
+        expected = sliding_window_view(a, 10).sum(axis=-1)
+        assert_allclose(rolling_reduce(a, 10, 'sum'), expected, rtol=1e-14)
+
+    def test_nan(self):
+        a = np.arange(12.)
+        a[5] = np.nan
+        for func in ['sum', 'mean', 'var', 'min', 'max']:
+            res = rolling_reduce(a, 3, func)
+            assert_equal(np.isnan(res), [0, 0, 0, 1, 1, 1, 0, 0, 0, 0])
+
+    def test_median_chunks(self):
+        import numpy.lib.rolling as rolling
+        a = np.random.RandomState(2).rand(3, 40)
+        expected = np.median(sliding_window_view(a, 7, -1), axis=-1)
+        old = rolling._MEDIAN_BLOCK
+        try:
+            rolling._MEDIAN_BLOCK = 30
+            assert_equal(rolling_reduce(a, 7, 'median'), expected)
+        finally:
+            rolling._MEDIAN_BLOCK = old
+
+    def test_errors(self):
+        assert_raises(ValueError, rolling_reduce, [1, 2, 3], 2, 'prod')
+        assert_raises(ValueError, rolling_reduce, [1, 2, 3], 0)
+        assert_raises(ValueError, rolling_reduce, [1, 2, 3], 4)
+        assert_raises(ValueError, rolling_reduce, 1, 1)
+        assert_(rolling_reduce([1, 2, 3], 3, 'max') == 3)
+
+
+if __name__ == "__main__":
+    run_module_suite()
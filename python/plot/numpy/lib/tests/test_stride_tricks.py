@@ -7,7 +7,8 @@ from numpy.testing import (
     assert_raises, assert_
     )
 from numpy.lib.stride_tricks import (
-    as_strided, broadcast_arrays, _broadcast_shape, broadcast_to
+    as_strided, broadcast_arrays, _broadcast_shape, broadcast_to,
+    sliding_window_view
 )
 
 def assert_shapes_correct(input_shapes, expected_shape):
@@ -434,5 +435,48 @@ def test_reference_types():
     assert_array_equal(expected, actual)
 
 
+class TestSlidingWindowView(object):
+    def test_1d(self):
+        arr = np.arange(5)
+        arr_view = sliding_window_view(arr, 2)
+        expected = np.array([[0, 1],
+                             [1, 2],
+                             [2, 3],
+                             [3, 4]])
+        assert_array_equal(arr_view, expected)
+        assert_(np.may_share_memory(arr_view, arr))
+        assert_(not arr_view.flags.writeable)
+
+    def test_2d(self):
+        i, j = np.ogrid[:3, :4]
+        arr = 10*i + j
+        shape = (2, 2)
+        arr_view = sliding_window_view(arr, shape)
+        assert_equal(arr_view.shape, (2, 3, 2, 2))
+        assert_array_equal(arr_view[1, 2], [[12, 13], [22, 23]])
+
+    def test_axis(self):
+        arr = np.arange(24).reshape(2, 3, 4)
+        arr_view = sliding_window_view(arr, 2, axis=-1)
+        assert_equal(arr_view.shape, (2, 3, 3, 2))
+        assert_array_equal(arr_view[1, 2, 1], arr[1, 2, 1:3])
+        arr_view = sliding_window_view(arr, (2, 2), axis=(2, 2))
+        assert_equal(arr_view.shape, (2, 3, 2, 2, 2))
+        assert_array_equal(arr_view[0, 0, 1], [[1, 2], [2, 3]])
+
+    def test_writeable(self):
+        arr = np.arange(5)
+        view = sliding_window_view(arr, 2, writeable=True)
+        view[0, 1] = -1
+        assert_equal(arr[1], -1)
+
+    def test_errors(self):
+        arr = np.arange(6).reshape(2, 3)
+        assert_raises(ValueError, sliding_window_view, arr, (-1, 2))
+        assert_raises(ValueError, sliding_window_view, arr, (2,))
+        assert_raises(ValueError, sliding_window_view, arr, (2, 2), axis=0)
+        assert_raises(ValueError, sliding_window_view, arr, (3, 2))
+
+
 if __name__ == "__main__":
     run_module_suite()
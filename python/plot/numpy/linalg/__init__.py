@@ -42,6 +42,18 @@ Exceptions
 LinAlgError     Indicates a failed linear algebra operation
 =============== ==========================================================
 
+=============== ==========================================================
+Batched operations
+==========================================================================
+LinalgWorkspace Reusable, threaded solver for stacks of small matrices
+=============== ==========================================================
+
+================ =========================================================
+Incremental solvers
+==========================================================================
+IncrementalLstsq Least squares solver updated and downdated by rows
+================ =========================================================
+
 """
 from __future__ import division, absolute_import, print_function
 
@@ -27,6 +27,14 @@ Tensor operations:
 - tensorsolve     Solve a linear tensor equation
 - tensorinv       Calculate an inverse of a tensor
 
+Batched operations:
+
+- LinalgWorkspace Reusable, threaded solver for stacks of small matrices
+
+Incremental solvers:
+
+- IncrementalLstsq Least squares solver updated and downdated by rows
+
 Exceptions:
 
 - LinAlgError     Indicates a failed linear algebra operation
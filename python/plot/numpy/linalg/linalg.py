@@ -14,8 +14,12 @@ from __future__ import division, absolute_import, print_function
 __all__ = ['matrix_power', 'solve', 'tensorsolve', 'tensorinv', 'inv',
            'cholesky', 'eigvals', 'eigvalsh', 'pinv', 'slogdet', 'det',
            'svd', 'eig', 'eigh', 'lstsq', 'norm', 'qr', 'cond', 'matrix_rank',
-           'LinAlgError', 'multi_dot']
+           'LinAlgError', 'multi_dot', 'LinalgWorkspace', 'IncrementalLstsq']
 
+import math
+import operator
+import sys
+import threading
 import warnings
 
 from numpy.core import (
@@ -2519,3 +2523,618 @@ def _multi_dot(arrays, order, i, j):
     else:
         return dot(_multi_dot(arrays, order, i, order[i, j]),
                    _multi_dot(arrays, order, order[i, j] + 1, j))
+
+
+# Batched small-matrix kernels
+
+# Number of matrices the closed-form kernels process at a time, so that
+# their per-element temporaries stay in cache.
+_CF_BLOCK = 8192
+
+
+def _cf_det(m, rows, cols, memo):
+    # Determinant of the sub-matrix of m (nested lists of equally shaped
+    # arrays, one per matrix element) on the given rows and columns, by
+    # Laplace expansion along the first row.  Minors are memoized, as the
+    # cofactors of a 4x4 matrix share all of their 2x2 minors.
+    key = (rows, cols)
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+    if len(rows) == 1:
+        r = m[rows[0]][cols[0]]
+    elif len(rows) == 2:
+        (r0, r1), (c0, c1) = rows, cols
+        r = m[r0][c0]*m[r1][c1] - m[r0][c1]*m[r1][c0]
+    else:
+        r = 0
+        for j, c in enumerate(cols):
+            term = m[rows[0]][c] * _cf_det(m, rows[1:], cols[:j] + cols[j+1:],
+                                           memo)
+            r = r + term if j % 2 == 0 else r - term
+    memo[key] = r
+    return r
+
+
+def _cf_cofactors(m):
+    n = len(m)
+    memo = {}
+    idx = tuple(range(n))
+    c = [[None]*n for i in range(n)]
+    for i in range(n):
+        for j in range(n):
+            d = _cf_det(m, idx[:i] + idx[i+1:], idx[:j] + idx[j+1:], memo)
+            c[i][j] = d if (i + j) % 2 == 0 else -d
+    return c
+
+
+def _cf_elements(a):
+    # Split a stack (K, M, M) into nested lists of contiguous (K,) arrays,
+    # one per matrix element, which the element-wise kernels stream through
+    # much faster than strided views.
+    n = a.shape[-1]
+    t = a.reshape(a.shape[0], n * n).T.copy()
+    return [[t[i * n + j] for j in range(n)] for i in range(n)]
+
+
+def _cf_blocked(kernel):
+    # Apply a closed-form kernel to blocks of _CF_BLOCK matrices at a time.
+    def blocked(out, *args):
+        for lo in range(0, len(out), _CF_BLOCK):
+            kernel(out[lo:lo + _CF_BLOCK], *[x[lo:lo + _CF_BLOCK] for x in args])
+    return blocked
+
+
+@_cf_blocked
+def _cf_det_kernel(out, a):
+    m = _cf_elements(a)
+    idx = tuple(range(len(m)))
+    out[...] = _cf_det(m, idx, idx, {})
+
+
+def _cf_adjugate(a):
+    # Transposed cofactors and determinant, raising for singular matrices.
+    m = _cf_elements(a)
+    c = _cf_cofactors(m)
+    n = len(m)
+    det = m[0][0] * c[0][0]
+    for j in range(1, n):
+        det = det + m[0][j] * c[0][j]
+    if not det.all():
+        raise LinAlgError("Singular matrix")
+    return c, det
+
+
+@_cf_blocked
+def _cf_inv_kernel(out, a):
+    c, det = _cf_adjugate(a)
+    rdet = 1 / det
+    for i in range(len(c)):
+        for j in range(len(c)):
+            multiply(c[j][i], rdet, out=out[:, i, j])
+
+
+@_cf_blocked
+def _cf_solve_kernel(out, a, b):
+    # b is (K, M, N); x = adj(a) b / det(a), one output row at a time.
+    c, det = _cf_adjugate(a)
+    rdet = (1 / det)[:, newaxis]
+    n = len(c)
+    for i in range(n):
+        row = c[0][i][:, newaxis] * b[:, 0, :]
+        for j in range(1, n):
+            row += c[j][i][:, newaxis] * b[:, j, :]
+        multiply(row, rdet, out=out[:, i, :])
+
+
+class LinalgWorkspace(object):
+    """
+    Reusable workspace for repeated linear algebra on stacks of matrices.
+
+    The functions in `numpy.linalg` check and convert their arguments on
+    every call and then loop over a stack of matrices in a single thread.
+    A workspace does the checks and type resolution once for a fixed stack
+    shape, splits the stack over several threads, and solves stacks of
+    2x2, 3x3 and 4x4 matrices with closed-form kernels that are evaluated
+    element-wise over the whole stack instead of calling LAPACK once per
+    matrix.
+
+    Parameters
+    ----------
+    shape : sequence of ints
+        Shape ``(..., M, M)`` of the coefficient stacks.
+    dtype : data-type, optional
+        Type of the coefficient stacks.  Default is double.
+    threads : int, optional
+        Maximum number of threads the stack is split over.  Default is 1.
+    closed_form : bool, optional
+        Use the closed-form kernels for ``2 <= M <= 4``.  They are a lot faster
+        for large stacks of tiny matrices, but are based on the adjugate
+        and so lose accuracy sooner than LU decomposition for badly
+        conditioned matrices.  Default is True.
+
+    Raises
+    ------
+    LinAlgError
+        If `shape` does not describe a stack of square matrices.
+
+    See Also
+    --------
+    solve, inv, det, eigh
+
+    Notes
+    -----
+    Arrays passed to the methods must have the planned shape; arrays of
+    the planned type are used without any copy or conversion.  The
+    results are identical to the corresponding `numpy.linalg` functions,
+    up to round-off for the closed-form kernels.  A `LinAlgError` is
+    raised if any matrix of the stack is singular, as in `solve` and
+    `inv`.
+
+    Examples
+    --------
+    >>> a = np.random.random((100000, 3, 3)) + 3 * np.eye(3)
+    >>> b = np.random.random((100000, 3))
+    >>> ws = np.linalg.LinalgWorkspace(a.shape, threads=4)
+    >>> np.allclose(ws.solve(a, b), np.linalg.solve(a, b))
+    True
+    >>> np.allclose(ws.det(a), np.linalg.det(a))
+    True
+
+    """
+
+    def __init__(self, shape, dtype=double, threads=1, closed_form=True):
+        shape = tuple(operator.index(n) for n in shape)
+        if len(shape) < 2:
+            raise LinAlgError('%d-dimensional array given. Array must be '
+                    'at least two-dimensional' % len(shape))
+        if shape[-1] != shape[-2]:
+            raise LinAlgError('Last 2 dimensions of the array must be square')
+        threads = operator.index(threads)
+        if threads < 1:
+            raise ValueError("threads must be at least 1, got %d" % threads)
+        t, result_t = _commonType(empty(0, dtype=dtype))
+
+        self.shape = shape
+        self.threads = threads
+        self._t = t
+        self._result_t = result_t
+        self._complex = isComplexType(t)
+        self._m = shape[-1]
+        self._count = int(product(shape[:-2]))
+        self._closed_form = bool(closed_form) and 2 <= self._m <= 4
+        self._extobj = get_linalg_error_extobj(_raise_linalgerror_singular)
+        self._eigh_extobj = get_linalg_error_extobj(
+            _raise_linalgerror_eigenvalues_nonconvergence)
+
+        nchunks = max(1, min(threads, self._count))
+        self._edges = [self._count * i // nchunks for i in range(nchunks + 1)]
+
+    def __repr__(self):
+        return ("LinalgWorkspace(shape=%r, dtype=%s, threads=%d)"
+                % (self.shape, self._result_t.__name__, self.threads))
+
+    def _stack(self, a):
+        # Flatten the stack to (K, M, M) in the computation type.
+        a = asarray(a)
+        if a.shape != self.shape:
+            raise ValueError("workspace planned for shape %r, got %r"
+                             % (self.shape, a.shape))
+        if a.dtype.type is not self._t:
+            if isComplexType(a.dtype.type) and not self._complex:
+                raise TypeError("workspace planned for real matrices, got "
+                                "%s" % a.dtype.name)
+            a = a.astype(self._t)
+        elif a.dtype.byteorder not in ('=', '|'):
+            a = _to_native_byte_order(a)
+        return a.reshape((self._count,) + a.shape[-2:])
+
+    def _map(self, kernel, outs, *args):
+        # Run kernel(outs, *args) on slices of the leading stack axis, one
+        # slice per thread.  The kernels release the GIL (LAPACK gufuncs and
+        # element-wise ufuncs), so the threads run concurrently.
+        def run(lo, hi):
+            chunk_outs = tuple(o[lo:hi] for o in outs)
+            kernel(chunk_outs[0] if len(outs) == 1 else chunk_outs,
+                   *[x[lo:hi] for x in args])
+
+        bounds = list(zip(self._edges[:-1], self._edges[1:]))
+        if len(bounds) == 1:
+            run(*bounds[0])
+            return
+        errors = []
+
+        def worker(lo, hi):
+            try:
+                run(lo, hi)
+            except BaseException:
+                errors.append(sys.exc_info()[1])
+
+        workers = [threading.Thread(target=worker, args=b) for b in bounds]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        if errors:
+            raise errors[0]
+
+    def _gufunc_kernel(self, gufunc, signature, extobj=None):
+        kwargs = dict(signature=signature)
+        if extobj is not None:
+            kwargs['extobj'] = extobj
+
+        def kernel(out, *args):
+            gufunc(*args, out=out, **kwargs)
+        return kernel
+
+    def det(self, a):
+        """
+        Compute the determinants of a stack of matrices, like `det`.
+
+        Parameters
+        ----------
+        a : (..., M, M) array_like
+            Stack of matrices of the planned shape.
+
+        Returns
+        -------
+        det : (...) array_like
+            Determinant of each matrix.
+        """
+        a = self._stack(a)
+        out = empty(self._count, dtype=self._t)
+        if self._closed_form:
+            kernel = _cf_det_kernel
+        else:
+            kernel = self._gufunc_kernel(
+                _umath_linalg.det, 'D->D' if self._complex else 'd->d')
+        self._map(kernel, (out,), a)
+        return out.reshape(self.shape[:-2]).astype(self._result_t,
+                                                     copy=False)
+
+    def inv(self, a):
+        """
+        Compute the inverses of a stack of matrices, like `inv`.
+
+        Parameters
+        ----------
+        a : (..., M, M) array_like
+            Stack of matrices of the planned shape.
+
+        Returns
+        -------
+        ainv : (..., M, M) ndarray
+            Inverse of each matrix.
+
+        Raises
+        ------
+        LinAlgError
+            If any matrix is singular.
+        """
+        a = self._stack(a)
+        out = empty(a.shape, dtype=self._t)
+        if self._closed_form:
+            kernel = _cf_inv_kernel
+        else:
+            kernel = self._gufunc_kernel(
+                _umath_linalg.inv, 'D->D' if self._complex else 'd->d',
+                self._extobj)
+        self._map(kernel, (out,), a)
+        return out.reshape(self.shape).astype(self._result_t, copy=False)
+
+    def solve(self, a, b):
+        """
+        Solve a stack of linear systems ``a x = b``, like `solve`.
+
+        Parameters
+        ----------
+        a : (..., M, M) array_like
+            Stack of coefficient matrices of the planned shape.
+        b : {(..., M,), (..., M, K)} array_like
+            Ordinate or "dependent variable" values.
+
+        Returns
+        -------
+        x : {(..., M,), (..., M, K)} ndarray
+            Solution to each system.  Returned shape is identical to `b`.
+
+        Raises
+        ------
+        LinAlgError
+            If any matrix is singular.
+        ValueError
+            If `a` or `b` does not match the planned shape.
+        """
+        a = self._stack(a)
+        b = asarray(b)
+        nd = len(self.shape)
+        vector = b.ndim == nd - 1
+        if b.ndim not in (nd - 1, nd) or b.shape[:nd - 2] != self.shape[:-2] \
+                or b.shape[nd - 2] != self._m:
+            raise ValueError("b of shape %r does not match the workspace "
+                             "shape %r" % (b.shape, self.shape))
+        result_t = _commonType(empty(0, dtype=self._result_t), b)[1]
+        b = b.astype(self._t, copy=False)
+        if vector:
+            b = b[..., newaxis]
+        b = b.reshape((self._count, self._m, -1))
+        out = empty(b.shape, dtype=self._t)
+        if self._closed_form:
+            kernel = _cf_solve_kernel
+        else:
+            kernel = self._gufunc_kernel(
+                _umath_linalg.solve, 'DD->D' if self._complex else 'dd->d',
+                self._extobj)
+        self._map(kernel, (out,), a, b)
+        shape = self.shape[:-1] if vector else self.shape[:-1] + b.shape[-1:]
+        return out.reshape(shape).astype(result_t, copy=False)
+
+    def eigh(self, a, UPLO='L'):
+        """
+        Eigen-decompose a stack of Hermitian matrices, like `eigh`.
+
+        Parameters
+        ----------
+        a : (..., M, M) array_like
+            Stack of Hermitian matrices of the planned shape.
+        UPLO : {'L', 'U'}, optional
+            Whether to use the lower or the upper triangular part of `a`.
+
+        Returns
+        -------
+        w : (..., M) ndarray
+            The eigenvalues in ascending order.
+        v : (..., M, M) ndarray
+            The normalized eigenvectors, ``v[..., :, i]`` belongs to
+            ``w[..., i]``.
+        """
+        UPLO = UPLO.upper()
+        if UPLO not in ('L', 'U'):
+            raise ValueError("UPLO argument must be 'L' or 'U'")
+        gufunc = _umath_linalg.eigh_lo if UPLO == 'L' else _umath_linalg.eigh_up
+        a = self._stack(a)
+        w = empty(a.shape[:-1], dtype=double)
+        v = empty(a.shape, dtype=self._t)
+        kernel = self._gufunc_kernel(
+            gufunc, 'D->dD' if self._complex else 'd->dd', self._eigh_extobj)
+        self._map(kernel, (w, v), a)
+        w = w.reshape(self.shape[:-1]).astype(_realType(self._result_t),
+                                              copy=False)
+        return w, v.reshape(self.shape).astype(self._result_t, copy=False)
+
+
+class IncrementalLstsq(object):
+    """
+    Least-squares solver that absorbs and removes rows of the system.
+
+    `lstsq` needs the whole coefficient matrix and factors it on every
+    call.  This solver keeps the triangular factor ``R`` of the QR
+    decomposition of the rows seen so far, the rotated right-hand sides
+    ``Q^H b`` and the sums of squared residuals, which are all that is
+    needed to solve the system.  Blocks of rows are added with `update`
+    and removed with `downdate`, for instance to move a window over the
+    observations, and `solve` may be called at any point.  The data are
+    never read again.
+
+    Parameters
+    ----------
+    n : int
+        Number of unknowns, the number of columns of the coefficient
+        matrix.
+    nrhs : int, optional
+        Number of right-hand sides.  If not given, the right-hand side is
+        a vector, as for a 1-D `b` in `lstsq`.
+    dtype : data-type, optional
+        Type of the system.  Default is double.
+
+    Attributes
+    ----------
+    count : int
+        Number of rows absorbed, minus the number of rows removed.
+
+    See Also
+    --------
+    lstsq
+
+    Notes
+    -----
+    Rows are absorbed by computing the QR decomposition of the current
+    factor stacked over the new rows, which costs
+    ``O((n + nrhs + M) (n + nrhs)**2)`` for ``M`` rows.  Rows are removed
+    one at a time by the rotations of the LINPACK routines ``xCHDD``, in
+    ``O(n**2)`` per row.  A row can only be removed while the factor is
+    nonsingular, that is, while the remaining rows have full column rank.
+
+    Removing rows that were not added gives meaningless results, and
+    rounding errors slowly accumulate when many rows are removed; factor
+    the current window again from time to time if it is moved for a very
+    long time.
+
+    Examples
+    --------
+    Fit a line to a window of 20 points moving over a series:
+
+    >>> t = np.arange(100.)
+    >>> y = 2 * t + 1 + np.random.random(100)
+    >>> a = np.vstack([t, np.ones(100)]).T
+    >>> ls = np.linalg.IncrementalLstsq(2)
+    >>> ls.update(a[:20], y[:20])
+    >>> for i in range(20, 100):
+    ...     ls.update(a[i], y[i])
+    ...     ls.downdate(a[i - 20], y[i - 20])
+    >>> x, resids, rank, s = ls.solve()
+    >>> np.allclose(x, np.linalg.lstsq(a[80:], y[80:], rcond=None)[0])
+    True
+
+    """
+
+    def __init__(self, n, nrhs=None, dtype=double):
+        n = operator.index(n)
+        if n < 1:
+            raise ValueError("n must be at least 1, got %d" % n)
+        if nrhs is not None:
+            nrhs = operator.index(nrhs)
+            if nrhs < 1:
+                raise ValueError("nrhs must be at least 1, got %d" % nrhs)
+        t, result_t = _commonType(empty(0, dtype=dtype))
+
+        self.n = n
+        self.nrhs = nrhs
+        self.count = 0
+        self._k = 1 if nrhs is None else nrhs
+        self._t = t
+        self._result_t = result_t
+        self._complex = isComplexType(t)
+        self._r = zeros((n, n), t)
+        self._z = zeros((n, self._k), t)
+        self._rss = zeros(self._k, _linalgRealType(t))
+
+    def __repr__(self):
+        return ("IncrementalLstsq(n=%d, nrhs=%r, dtype=%s)"
+                % (self.n, self.nrhs, self._result_t.__name__))
+
+    def _rows(self, a, b):
+        # Return the rows as (M, n) and (M, nrhs) arrays of the computation
+        # type.
+        a = atleast_2d(asarray(a))
+        b = asarray(b)
+        if a.ndim != 2 or a.shape[1] != self.n:
+            raise LinAlgError('Incompatible dimensions')
+        if b.size != a.shape[0] * self._k:
+            raise LinAlgError('Incompatible dimensions')
+        if not self._complex and (isComplexType(a.dtype.type) or
+                                  isComplexType(b.dtype.type)):
+            raise TypeError("solver created for real systems, got complex "
+                            "rows")
+        return (a.astype(self._t, copy=False),
+                b.reshape(a.shape[0], self._k).astype(self._t, copy=False))
+
+    def update(self, a, b):
+        """
+        Add rows to the system.
+
+        Parameters
+        ----------
+        a : {(n,), (M, n)} array_like
+            Rows of the coefficient matrix.
+        b : {(), (M,), (M, nrhs)} array_like
+            The corresponding rows of the right-hand side.
+        """
+        a, b = self._rows(a, b)
+        if not len(a):
+            return
+        n = self.n
+        m = len(a)
+        stacked = empty((n + m, n + self._k), self._t)
+        stacked[:n, :n] = self._r
+        stacked[:n, n:] = self._z
+        stacked[n:, :n] = a
+        stacked[n:, n:] = b
+        r = qr(stacked, mode='r')
+        self._r = r[:n, :n]
+        self._z = r[:n, n:]
+        # what the new rows add to b outside of the range of the factor
+        self._rss += sum(abs(r[n:, n:])**2, axis=0)
+        self.count += m
+
+    def downdate(self, a, b):
+        """
+        Remove rows from the system.
+
+        Parameters
+        ----------
+        a : {(n,), (M, n)} array_like
+            Rows of the coefficient matrix, previously added by `update`.
+        b : {(), (M,), (M, nrhs)} array_like
+            The corresponding rows of the right-hand side.
+
+        Raises
+        ------
+        LinAlgError
+            If the rows left do not have full column rank.  The solver is
+            then left unchanged.
+        """
+        a, b = self._rows(a, b)
+        n = self.n
+        r = self._r.copy()
+        z = self._z.copy()
+        rss = self._rss.copy()
+        c = [0.] * n
+        s = [0.] * n
+        eps = finfo(self._t).eps * n
+        for x, y in zip(a, b):
+            d = abs(r.diagonal())
+            if not d.min() > eps * d.max():
+                raise LinAlgError("cannot remove rows from a rank deficient "
+                                  "system")
+            p = solve(r.conj().T, x.conj())
+            # rotations that reduce (p, alpha) to (0, 1), computed on
+            # Python scalars as there are only n of them
+            p = p.tolist()
+            norm2 = math.fsum((v * v.conjugate()).real for v in p)
+            if not norm2 < 1:
+                raise LinAlgError("removing the rows leaves a rank "
+                                  "deficient system")
+            alpha = math.sqrt(1 - norm2)
+            for i in range(n - 1, -1, -1):
+                scale = alpha + math.sqrt((p[i] * p[i].conjugate()).real)
+                u = alpha / scale
+                v = p[i] / scale
+                norm = math.sqrt(u * u + (v * v.conjugate()).real)
+                c[i] = u / norm
+                s[i] = v.conjugate() / norm
+                alpha = scale * norm
+
+            # apply them to the factor, then to the right-hand sides
+            xx = zeros(n, self._t)
+            for i in range(n - 1, -1, -1):
+                tmp = c[i] * xx + s[i] * r[i]
+                r[i] = c[i] * r[i] - s[i].conjugate() * xx
+                xx = tmp
+            zeta = y.copy()
+            for i in range(n):
+                z[i] = (z[i] - s[i].conjugate() * zeta) / c[i]
+                zeta = c[i] * zeta - s[i] * z[i]
+            rss -= abs(zeta)**2
+            # round-off of an exact fit
+            maximum(rss, 0, out=rss)
+
+        self._r = r
+        self._z = z
+        self._rss = rss
+        self.count -= len(a)
+
+    def solve(self, rcond=None):
+        """
+        Return the least-squares solution of the rows currently absorbed.
+
+        Parameters
+        ----------
+        rcond : float, optional
+            Cut-off ratio for small singular values, as in `lstsq`.
+            Default is the machine precision times the larger of the number
+            of rows and `n`.
+
+        Returns
+        -------
+        x : {(n,), (n, nrhs)} ndarray
+            Least-squares solution.
+        residuals : {(1,), (nrhs,)} ndarray
+            Sums of squared residuals of each right-hand side.  Unlike in
+            `lstsq`, they are also returned for rank deficient systems.
+        rank : int
+            Rank of the coefficient matrix.
+        s : (n,) ndarray
+            Singular values of the coefficient matrix.
+        """
+        if rcond is None:
+            rcond = finfo(self._t).eps * max(self.count, self.n)
+        x, _, rank, sv = lstsq(self._r, self._z, rcond)
+        resids = self._rss + sum(abs(dot(self._r, x) - self._z)**2, axis=0)
+        if self.nrhs is None:
+            x = x[:, 0]
+        result_real_t = _realType(self._result_t)
+        return (x.astype(self._result_t, copy=False),
+                resids.astype(result_real_t, copy=False), rank,
+                sv.astype(result_real_t, copy=False))
@@ -1718,5 +1718,122 @@ class TestMultiDot(object):
         assert_raises(ValueError, multi_dot, [np.random.random((3, 3))])
 
 
+class TestLinalgWorkspace(object):
+
+    def _stack(self, m, dtype, shape=(3, 5)):
+        np.random.seed(1234)
+        a = np.random.random(shape + (m, m)) + m * np.eye(m)
+        if np.dtype(dtype).kind == 'c':
+            a = a + 1j * np.random.random(shape + (m, m))
+        return a.astype(dtype)
+
+    def test_matches_linalg(self):
+        for m in range(1, 6):
+            for dtype in [single, double, csingle, cdouble]:
+                a = self._stack(m, dtype)
+                b = a[..., 0]
+                bb = a[..., :2]
+                for closed_form in [True, False]:
+                    for threads in [1, 4]:
+                        ws = linalg.LinalgWorkspace(a.shape, dtype, threads,
+                                                    closed_form)
+                        for x, y in [(ws.det(a), linalg.det(a)),
+                                     (ws.inv(a), linalg.inv(a)),
+                                     (ws.solve(a, b), linalg.solve(a, b)),
+                                     (ws.solve(a, bb), linalg.solve(a, bb))]:
+                            assert_equal(x.dtype, y.dtype)
+                            assert_almost_equal(x, y, single_decimal=4,
+                                                double_decimal=10)
+
+    def test_eigh(self):
+        a = self._stack(3, cdouble)
+        a = a + a.swapaxes(-1, -2).conj()
+        for UPLO in ['L', 'U']:
+            ws = linalg.LinalgWorkspace(a.shape, cdouble, threads=2)
+            w, v = ws.eigh(a, UPLO)
+            w_ref, v_ref = linalg.eigh(a, UPLO)
+            assert_almost_equal(w, w_ref)
+            assert_almost_equal(np.abs(v), np.abs(v_ref))
+        assert_raises(ValueError, ws.eigh, a, 'X')
+
+    def test_singular(self):
+        a = self._stack(3, double)
+        a[1, 2] = 0
+        for closed_form in [True, False]:
+            ws = linalg.LinalgWorkspace(a.shape, closed_form=closed_form,
+                                        threads=2)
+            assert_raises(LinAlgError, ws.inv, a)
+            assert_raises(LinAlgError, ws.solve, a, a[..., 0])
+            assert_equal(ws.det(a)[1, 2], 0)
+
+    def test_invalid(self):
+        assert_raises(LinAlgError, linalg.LinalgWorkspace, (3,))
+        assert_raises(LinAlgError, linalg.LinalgWorkspace, (3, 2, 3))
+        assert_raises(ValueError, linalg.LinalgWorkspace, (3, 3), threads=0)
+        ws = linalg.LinalgWorkspace((4, 3, 3))
+        assert_raises(ValueError, ws.inv, np.eye(3))
+        a = np.ones((4, 3, 3))
+        for b in [np.ones((4, 2)), np.ones(4), np.ones((4, 3, 1, 1)), 1.]:
+            assert_raises(ValueError, ws.solve, a, b)
+            assert_raises(ValueError, linalg.solve, a, b)
+        assert_raises(ValueError, linalg.LinalgWorkspace((3, 3)).solve,
+                      np.eye(3), 1.)
+        assert_raises(TypeError, ws.det, np.ones((4, 3, 3), dtype=complex))
+
+
+class TestIncrementalLstsq(object):
+
+    def _system(self, dtype, m=40, n=4, nrhs=2):
+        np.random.seed(1234)
+        a = np.random.random((m, n))
+        b = np.random.random((m, nrhs))
+        if np.dtype(dtype).kind == 'c':
+            a = a + 1j * np.random.random((m, n))
+            b = b + 1j * np.random.random((m, nrhs))
+        return a.astype(dtype), b.astype(dtype)
+
+    def test_sliding_window(self):
+        for dtype in [double, cdouble]:
+            a, b = self._system(dtype)
+            for nrhs, bb in [(None, b[:, 0]), (2, b)]:
+                ls = linalg.IncrementalLstsq(4, nrhs, dtype)
+                ls.update(a[:10], bb[:10])
+                for i in range(10, 40, 3):
+                    ls.update(a[i:i + 3], bb[i:i + 3])
+                    ls.downdate(a[i - 10:i - 7], bb[i - 10:i - 7])
+                    assert_equal(ls.count, 10)
+                    x, resids, rank, s = ls.solve()
+                    x_ref, resids_ref, rank_ref, s_ref = linalg.lstsq(
+                        a[i - 7:i + 3], bb[i - 7:i + 3], rcond=None)
+                    assert_equal(x.dtype, x_ref.dtype)
+                    assert_almost_equal(x, x_ref)
+                    assert_almost_equal(resids, resids_ref)
+                    assert_equal(rank, rank_ref)
+                    assert_almost_equal(s, s_ref)
+
+    def test_rank_deficient(self):
+        a, b = self._system(double)
+        a[:, 3] = a[:, 0] + a[:, 1]
+        ls = linalg.IncrementalLstsq(4, 2)
+        ls.update(a, b)
+        x, resids, rank, s = ls.solve()
+        x_ref, resids_ref, rank_ref, s_ref = linalg.lstsq(a, b, rcond=None)
+        assert_equal(rank, 3)
+        assert_almost_equal(x, x_ref)
+        assert_almost_equal(resids, ((b - dot(a, x))**2).sum(axis=0))
+        # the rows cannot be removed, and the solver is left unchanged
+        assert_raises(LinAlgError, ls.downdate, a[:2], b[:2])
+        assert_equal(ls.count, 40)
+        assert_almost_equal(ls.solve()[0], x)
+
+    def test_invalid(self):
+        assert_raises(ValueError, linalg.IncrementalLstsq, 0)
+        ls = linalg.IncrementalLstsq(3)
+        assert_raises(LinAlgError, ls.update, np.ones((2, 4)), np.ones(2))
+        assert_raises(LinAlgError, ls.update, np.ones((2, 3)), np.ones(3))
+        assert_raises(TypeError, ls.update, np.ones((2, 3)),
+                      np.ones(2, dtype=complex))
+
+
 if __name__ == "__main__":
     run_module_suite()
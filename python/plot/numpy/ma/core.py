@@ -851,8 +851,27 @@ class _DomainSafeDivide(object):
             self.tolerance = np.finfo(float).tiny
         # don't call ma ufuncs from __array_wrap__ which would fail for scalars
         a, b = np.asarray(a), np.asarray(b)
-        with np.errstate(invalid='ignore'):
-            return umath.absolute(a) * self.tolerance >= umath.absolute(b)
+        with np.errstate(invalid='ignore', over='ignore'):
+            abs_a, abs_b = umath.absolute(a), umath.absolute(b)
+            if (np.result_type(abs_a, self.tolerance) != np.float64 or
+                    np.frexp(self.tolerance)[0] != 0.5):
+                return abs_a * self.tolerance >= abs_b
+            # Scaling by a power of two is exact, and scaling b up rather
+            # than a down avoids the slow arithmetic on denormals, but for
+            # the nonzero b that are already below the tolerance.
+            out = abs_a >= abs_b * (1. / self.tolerance)
+            tiny = (abs_b < self.tolerance) & (abs_b != 0)
+            if tiny.any():
+                out = np.where(tiny, abs_a * self.tolerance >= abs_b, out)
+            return out
+
+
+# With the default tolerance, the float quotients of the values outside of
+# the domain of _DomainSafeDivide are not finite or at least about 1 / tiny
+# in magnitude, so that the domain only needs to be checked when there are
+# such quotients.
+_quotient_ufuncs = (umath.divide, umath.true_divide, umath.floor_divide)
+_huge_quotient = 2. ** 1021
 
 
 class _DomainGreater(object):
@@ -887,6 +906,38 @@ class _DomainGreaterEqual(object):
             return umath.less(x, self.critical_value)
 
 
+def _copy_mask(m):
+    """
+    Copy of the mask `m` for the result of an operation, nomask if `m` is
+    nomask.  Copying is much cheaper than combining `m` with a mask of
+    False, and keeps the result and the operand independent.
+
+    """
+    if not isinstance(m, ndarray):
+        return m
+    return m.copy()
+
+
+def _binary_mask(a, b, shape):
+    """
+    Mask of the result of shape `shape` of a binary operation on `a` and
+    `b`, nomask if none of them is masked.
+
+    """
+    (ma, mb) = (getmask(a), getmask(b))
+    if ma is nomask:
+        if mb is nomask:
+            return nomask
+        elif mb.shape == shape:
+            return _copy_mask(mb)
+        return umath.logical_or(getmaskarray(a), mb)
+    elif mb is nomask:
+        if ma.shape == shape:
+            return _copy_mask(ma)
+        return umath.logical_or(ma, getmaskarray(b))
+    return umath.logical_or(ma, mb)
+
+
 class _MaskedUFunc(object):
     def __init__(self, ufunc):
         self.f = ufunc
@@ -935,16 +986,19 @@ class _MaskedUnaryOperation(_MaskedUFunc):
             # they are masked. To avoid this we suppress warnings.
             with np.errstate(divide='ignore', invalid='ignore'):
                 result = self.f(d, *args, **kwargs)
-            # Make a mask
+            # Make a mask, only if there are invalid values
             m = ~umath.isfinite(result)
             m |= self.domain(d)
-            m |= getmask(a)
+            if m.any():
+                m |= getmask(a)
+            else:
+                m = _copy_mask(getmask(a))
         else:
             # Case 1.2. : Function without a domain
             # Get the result and the mask
             with np.errstate(divide='ignore', invalid='ignore'):
                 result = self.f(d, *args, **kwargs)
-            m = getmask(a)
+            m = _copy_mask(getmask(a))
 
         if not result.ndim:
             # Case 2.1. : The result is scalarscalar
@@ -1012,20 +1066,10 @@ class _MaskedBinaryOperation(_MaskedUFunc):
         # Get the data, as ndarray
         (da, db) = (getdata(a), getdata(b))
         # Get the result
-        with np.errstate():
-            np.seterr(divide='ignore', invalid='ignore')
+        with np.errstate(divide='ignore', invalid='ignore'):
             result = self.f(da, db, *args, **kwargs)
         # Get the mask for the result
-        (ma, mb) = (getmask(a), getmask(b))
-        if ma is nomask:
-            if mb is nomask:
-                m = nomask
-            else:
-                m = umath.logical_or(getmaskarray(a), mb)
-        elif mb is nomask:
-            m = umath.logical_or(ma, getmaskarray(b))
-        else:
-            m = umath.logical_or(ma, mb)
+        m = _binary_mask(a, b, result.shape)
 
         # Case 1. : scalar
         if not result.ndim:
@@ -1158,31 +1202,38 @@ class _DomainedBinaryOperation(_MaskedUFunc):
         # Get the result
         with np.errstate(divide='ignore', invalid='ignore'):
             result = self.f(da, db, *args, **kwargs)
-        # Get the mask as a combination of the source masks and invalid
+        # Get the invalid values and the ones outside of the domain
         m = ~umath.isfinite(result)
-        m |= getmask(a)
-        m |= getmask(b)
-        # Apply the domain
         domain = ufunc_domain.get(self.f, None)
         if domain is not None:
-            m |= domain(da, db)
+            check = True
+            if self.f in _quotient_ufuncs and result.dtype.kind == 'f':
+                with np.errstate(invalid='ignore'):
+                    check = not (umath.absolute(result) < _huge_quotient).all()
+            if check:
+                m |= domain(da, db)
+        # Combine with the source masks
+        if m.any():
+            m |= getmask(a)
+            m |= getmask(b)
+        else:
+            m = _binary_mask(a, b, result.shape)
         # Take care of the scalar case first
-        if (not m.ndim):
+        if (not result.ndim):
             if m:
                 return masked
             else:
                 return result
-        # When the mask is True, put back da if possible
-        # any errors, just abort; impossible to guarantee masked values
-        try:
-            np.copyto(result, 0, casting='unsafe', where=m)
-            # avoid using "*" since this may be overlaid
-            masked_da = umath.multiply(m, da)
-            # only add back if it can be cast safely
-            if np.can_cast(masked_da.dtype, result.dtype, casting='safe'):
-                result += masked_da
-        except Exception:
-            pass
+        # When the mask is True, put back da if it can be cast safely, else
+        # 0.  Any errors, just abort; impossible to guarantee masked values
+        if m is not nomask and m.any():
+            try:
+                if np.can_cast(da.dtype, result.dtype, casting='safe'):
+                    np.copyto(result, da, where=m)
+                else:
+                    np.copyto(result, 0, casting='unsafe', where=m)
+            except Exception:
+                pass
 
         # Transforms to a (subclass of) MaskedArray
         masked_result = result.view(get_masked_subclass(a, b))
@@ -2910,6 +2961,15 @@ class MaskedArray(ndarray):
         Copies some attributes of obj to self.
 
         """
+        if type(obj) is ndarray:
+            # Plain arrays, as the results of the masked operations, have
+            # none of the attributes: use the defaults
+            _optinfo = {}
+            self.__dict__.update(_fill_value=None, _hardmask=False,
+                                 _sharedmask=False, _isfield=False,
+                                 _baseclass=ndarray, _optinfo=_optinfo,
+                                 _basedict=_optinfo)
+            return
         if isinstance(obj, ndarray):
             _baseclass = type(obj)
         else:
@@ -2980,7 +3040,9 @@ class MaskedArray(ndarray):
             # heuristic it's not bad.) In all other cases, we make a copy of
             # the mask, so that future modifications to 'self' do not end up
             # side-effecting 'obj' as well.
-            if (obj.__array_interface__["data"][0]
+            if _mask is nomask:
+                pass
+            elif (obj.__array_interface__["data"][0]
                     != self.__array_interface__["data"][0]):
                 _mask = _mask.copy()
         else:
@@ -3865,7 +3927,23 @@ class MaskedArray(ndarray):
                 res = data.astype(rdtype)
                 _recursive_printoption(res, mask, masked_print_option)
         else:
-            res = self.filled(self.fill_value)
+            data = self
+            # Filling copies the whole array, so for big arrays that will be
+            # summarized only fill the corners, as long as they are still
+            # big enough to be summarized the same way.
+            options = np.get_printoptions()
+            if self.size > options['threshold']:
+                print_width = (self._print_width if self.ndim > 1
+                               else self._print_width_1d)
+                ind = builtins.max(print_width // 2, options['edgeitems'] + 1)
+                corners = self
+                for axis in range(self.ndim):
+                    if corners.shape[axis] > 2 * ind:
+                        arr = np.split(corners, (ind, -ind), axis=axis)
+                        corners = concatenate((arr[0], arr[2]), axis=axis)
+                if corners.size > options['threshold']:
+                    data = corners
+            res = data.filled(self.fill_value)
         return res
 
     def __str__(self):
@@ -3906,9 +3984,17 @@ class MaskedArray(ndarray):
 
         prefix = 'masked_{}('.format(name)
 
+        # check the first and last elements before scanning the whole mask,
+        # as a large array is rarely fully masked
+        mask = self._mask
+        if mask is nomask or mask.dtype.names is not None or mask.size == 0:
+            all_masked = np.all(mask)
+        else:
+            all_masked = (mask.flat[0] and mask.flat[-1] and np.all(mask))
+
         dtype_needed = (
             not np.core.arrayprint.dtype_is_implied(self.dtype) or
-            np.all(self.mask) or
+            all_masked or
             self.size == 0
         )
 
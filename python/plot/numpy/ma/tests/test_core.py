@@ -1618,6 +1618,70 @@ class TestMaskedArrayArithmetic(object):
         assert_equal(test.mask, control.mask)
         assert_equal(a.mask, [0, 0, 0, 0, 1])
 
+    def test_result_mask_independent(self):
+        # Results with the mask of an operand do not share it
+        for op in [lambda x: sin(x), lambda x: x + 1, lambda x: 2. * x,
+                   lambda x: x / 2., lambda x: log(x + 1)]:
+            a = array([[1., 2.], [3., 4.]], mask=[[0, 1], [0, 0]])
+            test = op(a)
+            test[1, 0] = masked
+            test[0, 1] = 0
+            assert_equal(a.mask, [[0, 1], [0, 0]])
+            assert_equal(test.mask, [[0, 0], [1, 0]])
+
+            test = op(a)
+            test.mask[1, 1] = True
+            test += array([[1, 1], [1, 1]], mask=[[1, 0], [0, 0]])
+            assert_equal(a.mask, [[0, 1], [0, 0]])
+            assert_equal(test.mask, [[1, 1], [0, 1]])
+
+            # Views of the result share its mask
+            test = op(a)
+            row = test[1]
+            col = test.T[0]
+            row[1] = masked
+            col[0] = masked
+            assert_equal(a.mask, [[0, 1], [0, 0]])
+            assert_equal(test.mask, [[1, 1], [0, 1]])
+
+            # Neither does modifying the operand change the result
+            test = op(a)
+            a[0, 0] = masked
+            a.mask[1, 1] = True
+            assert_equal(test.mask, [[0, 1], [0, 0]])
+            getmask(test)[1, 0] = True
+            assert_equal(test.mask, [[0, 1], [1, 0]])
+            assert_equal(a.mask, [[1, 1], [0, 1]])
+
+        a = array([1., 2., 3.], mask=[0, 1, 0])
+        test = a * np.ones(3)
+        a[0] = masked
+        assert_equal(test.mask, [0, 1, 0])
+
+    def test_lazy_nomask(self):
+        # No mask is made when there is no masked or invalid value
+        x = array([1., 2., 4.])
+        for test in [x / 2, 2 / x, x // 2, sqrt(x), log(x), x + 1]:
+            assert_(test.mask is nomask)
+        test = x / array([1., 0., 2.])
+        assert_equal(test.mask, [0, 1, 0])
+
+    def test_safe_divide_domain(self):
+        # Tiny and huge values are masked as with |a| * tiny >= |b|
+        tiny = np.finfo(float).tiny
+        values = np.array([0., 1., -1.5, 4., 1e300, -1e-300, tiny, 5e-324,
+                           3 * tiny, 0.5 + 2.**-53, np.inf, np.nan])
+        x, y = values[:, None], values[None, :]
+        with np.errstate(all='ignore'):
+            invalid = ~np.isfinite(x / y)
+            control = invalid | (np.abs(x) * tiny >= np.abs(y))
+            assert_equal(divide(x, y).mask, control)
+            assert_equal((array(x) / array(y)).mask, control)
+            x, y = x.astype(np.float32), y.astype(np.float32)
+            invalid = ~np.isfinite(x / y)
+            control = invalid | (np.abs(x) * tiny >= np.abs(y))
+            assert_equal(divide(x, y).mask, control)
+
 
 class TestMaskedArrayAttributes(object):
 
@@ -29,6 +29,14 @@ Base class
 
    PolyBase Obsolete base class for the polynomial classes. Do not use.
 
+Batched fits
+------------
+
+.. autosummary::
+   :toctree: generated/
+
+   SeriesFitter least-squares fits of many series sampled at the same points.
+
 Functions
 ---------
 
@@ -45,11 +53,15 @@ Functions
 """
 from __future__ import division, absolute_import, print_function
 
+import warnings
+
 import numpy as np
+import numpy.linalg as la
 
 __all__ = [
     'RankWarning', 'PolyError', 'PolyDomainError', 'as_series', 'trimseq',
-    'trimcoef', 'getdomain', 'mapdomain', 'mapparms', 'PolyBase']
+    'trimcoef', 'getdomain', 'mapdomain', 'mapparms', 'PolyBase',
+    'SeriesFitter']
 
 #
 # Warnings and Exceptions
@@ -410,3 +422,214 @@ def mapdomain(x, old, new):
     x = np.asanyarray(x)
     off, scl = mapparms(old, new)
     return off + scl*x
+
+
+#
+# Batched least-squares fits
+#
+
+class SeriesFitter(object):
+    """
+    Least-squares fits of many series sampled at the same points.
+
+    The pseudo-Vandermonde matrix of the sample points is factored once,
+    after which fitting any number of data sets, in one call or over many
+    calls, is a single matrix product with its pseudo-inverse.  The fits
+    are the ones of the ``*fit`` function of the same basis, e.g. `polyfit`
+    for `polyvander` or `chebfit` for `chebvander`.
+
+    .. versionadded:: 1.15.0
+
+    Parameters
+    ----------
+    vander : callable
+        The pseudo-Vandermonde function of the basis, called as
+        ``vander(x, deg)``, e.g. `numpy.polynomial.chebyshev.chebvander`.
+    x : array_like, shape (`M`,)
+        x-coordinates of the `M` sample points.
+    deg : int or 1-D array_like
+        Degree of the fitting series, or list of the degrees of the terms
+        to include, as for `polyfit`.
+    rcond : float, optional
+        Relative condition number of the fit.  Singular values smaller
+        than `rcond`, relative to the largest singular value, are ignored.
+        The default value is ``len(x)*eps``.
+    w : array_like, shape (`M`,), optional
+        Weights of the sample points, as for `polyfit`.
+
+    Attributes
+    ----------
+    x : ndarray
+        The sample points.
+    rank : int
+        The rank of the scaled pseudo-Vandermonde matrix.
+    singular_values : ndarray
+        The singular values of the scaled pseudo-Vandermonde matrix.
+
+    Warns
+    -----
+    RankWarning
+        If the pseudo-Vandermonde matrix is rank deficient.
+
+    See Also
+    --------
+    numpy.polynomial.polynomial.polyfit
+
+    Notes
+    -----
+    With `K` data sets, fitting costs ``O(M*K*deg)`` operations in a matrix
+    product instead of a least-squares solve, and the fitted values are
+    another matrix product with the pseudo-Vandermonde matrix.
+
+    Examples
+    --------
+    >>> from numpy.polynomial import polynomial as P, polyutils as pu
+    >>> x = np.linspace(0, 1, 5)
+    >>> fitter = pu.SeriesFitter(P.polyvander, x, 1)
+    >>> y = np.stack([1 + 2*x, 3 - x, x**2], axis=1)
+    >>> fitter.fit(y)
+    array([[ 1. ,  3. , -0.125],
+           [ 2. , -1. ,  1.   ]])
+    >>> fitter.detrend(y)[:, 2]
+    array([ 0.125 , -0.0625, -0.125 , -0.0625,  0.125 ])
+
+    """
+
+    def __init__(self, vander, x, deg, rcond=None, w=None):
+        x = np.asarray(x) + 0.0
+        deg = np.asarray(deg)
+        if deg.ndim > 1 or deg.dtype.kind not in 'iu' or deg.size == 0:
+            raise TypeError("deg must be an int or non-empty 1-D array of int")
+        if deg.min() < 0:
+            raise ValueError("expected deg >= 0")
+        if x.ndim != 1:
+            raise TypeError("expected 1D vector for x")
+        if x.size == 0:
+            raise TypeError("expected non-empty vector for x")
+
+        self._vander = vander
+        self.x = x
+        if deg.ndim == 0:
+            self._lmax = int(deg)
+            self._deg = None
+            van = vander(x, self._lmax)
+        else:
+            deg = np.sort(deg)
+            self._lmax = int(deg[-1])
+            self._deg = deg
+            van = vander(x, self._lmax)[:, deg]
+        self._van = van
+
+        lhs = van
+        if w is not None:
+            w = np.asarray(w) + 0.0
+            if w.ndim != 1:
+                raise TypeError("expected 1D vector for w")
+            if len(x) != len(w):
+                raise TypeError("expected x and w to have same length")
+            lhs = lhs * w[:, None]
+        self._w = w
+
+        if rcond is None:
+            rcond = len(x)*np.finfo(x.dtype).eps
+        self.rcond = rcond
+
+        # Scale the columns as the fit functions do, then keep the
+        # pseudo-inverse of the singular value decomposition.
+        if issubclass(lhs.dtype.type, np.complexfloating):
+            scl = np.sqrt((np.square(lhs.real) + np.square(lhs.imag)).sum(0))
+        else:
+            scl = np.sqrt(np.square(lhs).sum(0))
+        scl[scl == 0] = 1
+        u, s, vt = la.svd(lhs/scl, full_matrices=False)
+        keep = s > rcond*s.max()
+        self.rank = int(keep.sum())
+        self.singular_values = s
+        vt = vt[keep] / s[keep, None]
+        self._pinv = np.dot(vt.conj().T, u[:, keep].conj().T) / scl[:, None]
+
+        if self.rank != van.shape[1]:
+            msg = "The fit may be poorly conditioned"
+            warnings.warn(msg, RankWarning, stacklevel=2)
+
+    def fit(self, y):
+        """
+        Coefficients of the fits of data sets sampled at `x`.
+
+        Parameters
+        ----------
+        y : array_like, shape (`M`, ...)
+            The data, with the sample points along the first axis and any
+            number of independent data sets along the others.
+
+        Returns
+        -------
+        coef : ndarray, shape (`deg` + 1, ...)
+            The coefficients of the fits, from low to high degree along the
+            first axis.  Coefficients of the terms not included in `deg` are
+            zero.
+
+        """
+        y = np.asarray(y) + 0.0
+        if y.ndim < 1 or len(y) != len(self.x):
+            raise TypeError("expected y to have the length of x along its "
+                            "first axis")
+        shape = y.shape[1:]
+        y = y.reshape(len(y), -1)
+        if self._w is not None:
+            y = y * self._w[:, None]
+        c = np.dot(self._pinv, y)
+        if self._deg is not None:
+            cc = np.zeros((self._lmax + 1, c.shape[1]), dtype=c.dtype)
+            cc[self._deg] = c
+            c = cc
+        return c.reshape((self._lmax + 1,) + shape)
+
+    def values(self, coef, x=None):
+        """
+        Values of series at the sample points or at other points.
+
+        Parameters
+        ----------
+        coef : array_like, shape (`deg` + 1, ...)
+            Coefficients of any number of series, as returned by `fit`.
+        x : array_like, shape (`N`,), optional
+            Points of evaluation.  Defaults to the sample points.
+
+        Returns
+        -------
+        values : ndarray, shape (`M`, ...) or (`N`, ...)
+            The values of the series, with the points along the first axis.
+
+        """
+        coef = np.asarray(coef)
+        if len(coef) != self._lmax + 1:
+            raise ValueError("expected %d coefficients along the first axis"
+                             % (self._lmax + 1))
+        if x is None:
+            van = self._van
+            if self._deg is not None:
+                coef = coef[self._deg]
+        else:
+            van = self._vander(np.asarray(x) + 0.0, self._lmax)
+        shape = coef.shape[1:]
+        values = np.dot(van, coef.reshape(len(coef), -1))
+        return values.reshape(van.shape[:-1] + shape)
+
+    def detrend(self, y):
+        """
+        Residuals of the fits of data sets sampled at `x`.
+
+        Parameters
+        ----------
+        y : array_like, shape (`M`, ...)
+            The data, as for `fit`.
+
+        Returns
+        -------
+        residuals : ndarray, shape (`M`, ...)
+            `y` minus the values of its fits at `x`.
+
+        """
+        y = np.asarray(y) + 0.0
+        return y - self.values(self.fit(y))
@@ -6,7 +6,7 @@ from __future__ import division, absolute_import, print_function
 import numpy as np
 import numpy.polynomial.polyutils as pu
 from numpy.testing import (
-    assert_almost_equal, assert_raises, assert_equal, assert_,
+    assert_almost_equal, assert_raises, assert_equal, assert_, assert_warns,
     run_module_suite
     )
 
@@ -106,5 +106,53 @@ class TestDomain(object):
         assert_almost_equal(res, tgt)
 
 
+class TestSeriesFitter(object):
+
+    def test_fit(self):
+        from numpy.polynomial import polynomial, chebyshev, hermite
+        rng = np.random.RandomState(1)
+        x = rng.rand(20)
+        y = rng.rand(20, 6)
+        w = rng.rand(20)
+        for (vander, fit) in [(polynomial.polyvander, polynomial.polyfit),
+                              (chebyshev.chebvander, chebyshev.chebfit),
+                              (hermite.hermvander, hermite.hermfit)]:
+            for deg in [3, [0, 1, 3]]:
+                for weights in [None, w]:
+                    fitter = pu.SeriesFitter(vander, x, deg, w=weights)
+                    tgt = fit(x, y, deg, w=weights)
+                    assert_almost_equal(fitter.fit(y), tgt)
+                    assert_almost_equal(fitter.fit(y[:, 1]), tgt[:, 1])
+                    res = fitter.fit(y.reshape(20, 2, 3))
+                    assert_almost_equal(res, tgt.reshape(4, 2, 3))
+
+    def test_values(self):
+        from numpy.polynomial import chebyshev
+        x = np.linspace(-1, 1, 9)
+        y = np.stack([x**3, 1 - x, x**2 + 2*x], axis=1)
+        fitter = pu.SeriesFitter(chebyshev.chebvander, x, [0, 1, 3])
+        coef = fitter.fit(y)
+        assert_almost_equal(fitter.values(coef),
+                            chebyshev.chebval(x, coef).T)
+        assert_almost_equal(fitter.values(coef, [0.5, 2]),
+                            chebyshev.chebval([0.5, 2], coef).T)
+        assert_almost_equal(fitter.detrend(y), y - fitter.values(coef))
+        assert_almost_equal(fitter.detrend(y)[:, :2], 0)
+        assert_raises(ValueError, fitter.values, coef[:2])
+
+    def test_errors(self):
+        from numpy.polynomial import polynomial
+        vander = polynomial.polyvander
+        assert_raises(TypeError, pu.SeriesFitter, vander, [[1.]], 1)
+        assert_raises(TypeError, pu.SeriesFitter, vander, [], 1)
+        assert_raises(ValueError, pu.SeriesFitter, vander, [1.], -1)
+        assert_raises(TypeError, pu.SeriesFitter, vander, [1., 2.], 1,
+                      w=[1.])
+        fitter = pu.SeriesFitter(vander, [1., 2., 3.], 1)
+        assert_raises(TypeError, fitter.fit, [1., 2.])
+        assert_warns(pu.RankWarning, pu.SeriesFitter, vander,
+                     [1., 1., 1.], 2)
+
+
 if __name__ == "__main__":
     run_module_suite()
@@ -78,6 +78,12 @@ standard_normal      Standard normal distribution.
 standard_t           Standard Student's t-distribution.
 ==================== =========================================================
 
+==================== =========================================================
+Parallel streams
+==============================================================================
+Philox               Counter-based generator with independent streams.
+==================== =========================================================
+
 ==================== =========================================================
 Internal functions
 ==============================================================================
@@ -102,6 +108,9 @@ with warnings.catch_warnings():
 ranf = random = sample = random_sample
 __all__.extend(['ranf', 'random', 'sample'])
 
+from .philox import *
+__all__.extend(['Philox'])
+
 def __RandomState_ctor():
     """Return a RandomState instance.
 
@@ -0,0 +1,416 @@
+"""
+Counter-based random streams - philox.py
+
+`Philox` is a counter-based generator: every output block is a pure
+function of a key (the seed), a stream number and the position of the
+block.  This gives independent, reproducible streams for parallel workers
+and lets one large array be filled by several threads with exactly the
+same result as a single thread.
+
+"""
+from __future__ import division, absolute_import, print_function
+
+__all__ = ['Philox']
+
+import binascii
+import operator
+import os
+import sys
+import threading
+
+from numpy.core import (asarray, empty, arange, full, uint32, uint64,
+                        float64, multiply, sqrt, log1p, cos, sin, pi,
+                        broadcast)
+
+_MASK32 = 0xffffffff
+_MASK64 = 0xffffffffffffffff
+
+# Philox4x32 multipliers and Weyl key increments (Salmon et al., 2011).
+_PHILOX_M0 = uint64(0xD2511F53)
+_PHILOX_M1 = uint64(0xCD9E8D57)
+_PHILOX_W0 = 0x9E3779B9
+_PHILOX_W1 = 0xBB67AE85
+_PHILOX_ROUNDS = 10
+
+# Number of counter blocks generated at a time, which bounds the size of
+# the temporaries.  Each block yields two doubles.
+_CHUNK_BLOCKS = 2 ** 16
+
+
+def _philox4x32(key, stream, start, count):
+    """
+    Philox4x32-10 output blocks ``start, ..., start + count - 1``.
+
+    The block index is the low and the stream number the high half of the
+    128-bit counter.  Returns the four 32-bit output words of every block
+    as uint64 arrays.
+    """
+    # the block index wraps around at 2**64, as the counter of advance
+    ctr = arange(count, dtype=uint64) + uint64(start)
+    c0 = ctr & uint64(_MASK32)
+    c1 = ctr >> uint64(32)
+    c2 = full(count, stream & _MASK32, dtype=uint64)
+    c3 = full(count, stream >> 32, dtype=uint64)
+    k0, k1 = key & _MASK32, key >> 32
+    mask = uint64(_MASK32)
+    shift = uint64(32)
+    for _ in range(_PHILOX_ROUNDS):
+        p0 = c0 * _PHILOX_M0
+        p1 = c2 * _PHILOX_M1
+        c0, c1, c2, c3 = ((p1 >> shift) ^ c1 ^ uint64(k0), p1 & mask,
+                          (p0 >> shift) ^ c3 ^ uint64(k1), p0 & mask)
+        k0 = (k0 + _PHILOX_W0) & _MASK32
+        k1 = (k1 + _PHILOX_W1) & _MASK32
+    return c0, c1, c2, c3
+
+
+def _res53(a, b):
+    # Double in [0, 1) from two 32-bit words, as randomkit's genrand_res53.
+    return ((a >> uint64(5)).astype(float64) * 67108864.0 +
+            (b >> uint64(6)).astype(float64)) / 9007199254740992.0
+
+
+def _fill_uniform(out, words):
+    c0, c1, c2, c3 = words
+    out[0::2] = _res53(c0, c1)[:len(out[0::2])]
+    out[1::2] = _res53(c2, c3)[:len(out[1::2])]
+
+
+def _fill_normal(out, words):
+    # Box-Muller transform; each block gives one pair of normals.
+    c0, c1, c2, c3 = words
+    r = sqrt(-2.0 * log1p(-_res53(c0, c1)))
+    theta = _res53(c2, c3)
+    multiply(theta, 2 * pi, out=theta)
+    out[0::2] = (r * cos(theta))[:len(out[0::2])]
+    out[1::2] = (r * sin(theta))[:len(out[1::2])]
+
+
+def _fill_exponential(out, words):
+    _fill_uniform(out, words)
+    log1p(-out, out=out)
+    multiply(out, -1.0, out=out)
+
+
+def _fill_raw(out, words):
+    for i, w in enumerate(words):
+        out[i::4] = w[:len(out[i::4])]
+
+
+def _param_size(size, *params):
+    # As in RandomState, array parameters give the shape of the output when
+    # no size is given.
+    if size is None:
+        size = broadcast(*params).shape or None
+    return size
+
+
+def _random_key():
+    return int(binascii.hexlify(os.urandom(8)), 16)
+
+
+class Philox(object):
+    """
+    Philox(seed=None, stream=0, threads=1)
+
+    Counter-based random number generator with independent streams.
+
+    `Philox` implements the Philox4x32-10 generator of Salmon et al.
+    Instead of updating a hidden state, it encrypts a counter with the
+    seed as key, so that any block of output can be computed directly.
+    This is used in two ways:
+
+    * Every ``(seed, stream)`` pair selects one of 2**64 non-overlapping
+      streams of length 2**66 values, so that workers given different
+      stream numbers, or generators obtained from `spawn`, draw
+      statistically independent variates.
+    * Large requests are split over ``threads`` threads, each computing
+      its own part of the output.  The result does not depend on the
+      number of threads.
+
+    The sequence produced by `Philox` is not the one of `RandomState`,
+    which remains the default generator of `numpy.random`.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Key of the generator, an integer in ``[0, 2**64)``.  By default a
+        key is read from ``os.urandom``.
+    stream : int, optional
+        Stream number in ``[0, 2**64)``.  Default is 0.
+    threads : int, optional
+        Maximum number of threads used to fill large arrays.  Default is 1.
+
+    Notes
+    -----
+    Every call consumes a whole number of counter blocks of four 32-bit
+    words, i.e. two doubles.  The values returned by a sequence of calls
+    only depend on the seed, the stream and the sizes of the calls.
+
+    References
+    ----------
+    .. [1] J. K. Salmon, M. A. Moraes, R. O. Dror and D. E. Shaw,
+           "Parallel random numbers: as easy as 1, 2, 3", Proceedings of
+           the International Conference for High Performance Computing,
+           Networking, Storage and Analysis, 2011.
+
+    Examples
+    --------
+    One stream per worker:
+
+    >>> gens = [np.random.Philox(1234, stream=i) for i in range(4)]
+    >>> samples = [g.standard_normal(1000) for g in gens]
+
+    A single large array filled by several threads:
+
+    >>> x = np.random.Philox(1234, threads=4).random_sample(10**6)
+    >>> y = np.random.Philox(1234, threads=1).random_sample(10**6)
+    >>> np.array_equal(x, y)
+    True
+
+    """
+
+    def __init__(self, seed=None, stream=0, threads=1):
+        if seed is None:
+            seed = _random_key()
+        seed = operator.index(seed)
+        stream = operator.index(stream)
+        threads = operator.index(threads)
+        if not 0 <= seed <= _MASK64:
+            raise ValueError("seed must be between 0 and 2**64 - 1")
+        if not 0 <= stream <= _MASK64:
+            raise ValueError("stream must be between 0 and 2**64 - 1")
+        if threads < 1:
+            raise ValueError("threads must be at least 1, got %d" % threads)
+        self.seed = seed
+        self.stream = stream
+        self.threads = threads
+        self.counter = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "Philox(seed=%d, stream=%d, threads=%d)" % (
+            self.seed, self.stream, self.threads)
+
+    def __getstate__(self):
+        return {'seed': self.seed, 'stream': self.stream,
+                'threads': self.threads, 'counter': self.counter}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def advance(self, blocks):
+        """
+        Skip the next `blocks` counter blocks (two doubles each).
+
+        Parameters
+        ----------
+        blocks : int
+            Number of blocks to skip, may be negative.
+        """
+        with self._lock:
+            self.counter = (self.counter + operator.index(blocks)) % 2 ** 64
+
+    def spawn(self, n):
+        """
+        Create `n` new generators with independent streams.
+
+        The 64-bit keys of the children are drawn from this generator, so
+        the result is reproducible and spawning can be nested.  Two
+        children share a key only with probability of order ``n**2 / 2**64``.
+
+        Parameters
+        ----------
+        n : int
+            Number of generators to create.
+
+        Returns
+        -------
+        gens : list of Philox
+            Generators with the same number of threads as this one.
+        """
+        raw = self.random_raw(2 * n).astype(uint64)
+        keys = (raw[0::2] << uint64(32)) | raw[1::2]
+        return [Philox(int(k), 0, self.threads) for k in keys]
+
+    def _take(self, blocks):
+        # Reserve the next `blocks` counter blocks, returning the first.
+        with self._lock:
+            start = self.counter
+            self.counter = (start + blocks) % 2 ** 64
+        return start
+
+    def _generate(self, size, dtype, fill, per_block):
+        if size is None:
+            out = self._generate(1, dtype, fill, per_block)
+            return out[0]
+        out = empty(size, dtype=dtype)
+        flat = out.reshape(-1)
+        nblocks = -(-flat.size // per_block)
+        start = self._take(nblocks)
+
+        def work(lo, hi):
+            # Blocks lo..hi, in chunks that keep the temporaries small.
+            for b in range(lo, hi, _CHUNK_BLOCKS):
+                e = min(b + _CHUNK_BLOCKS, hi)
+                words = _philox4x32(self.seed, self.stream,
+                                    (start + b) % 2 ** 64, e - b)
+                fill(flat[b * per_block:e * per_block], words)
+
+        nthreads = min(self.threads, -(-nblocks // _CHUNK_BLOCKS))
+        if nthreads <= 1:
+            work(0, nblocks)
+            return out
+        edges = [nblocks * i // nthreads for i in range(nthreads + 1)]
+        errors = []
+
+        def worker(lo, hi):
+            try:
+                work(lo, hi)
+            except BaseException:
+                errors.append(sys.exc_info()[1])
+
+        workers = [threading.Thread(target=worker, args=(lo, hi))
+                   for lo, hi in zip(edges[:-1], edges[1:])]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        if errors:
+            raise errors[0]
+        return out
+
+    def random_raw(self, size=None):
+        """
+        Return raw 32-bit output words.
+
+        Parameters
+        ----------
+        size : int or tuple of ints, optional
+            Output shape.  Default is None, in which case a single value is
+            returned.
+
+        Returns
+        -------
+        out : uint32 or ndarray of uint32
+        """
+        return self._generate(size, uint32, _fill_raw, 4)
+
+    def random_sample(self, size=None):
+        """
+        Return random floats in the half-open interval [0.0, 1.0).
+
+        Parameters
+        ----------
+        size : int or tuple of ints, optional
+            Output shape.  Default is None, in which case a single value is
+            returned.
+
+        Returns
+        -------
+        out : float or ndarray of floats
+        """
+        return self._generate(size, float64, _fill_uniform, 2)
+
+    random = random_sample
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        """
+        Draw samples from a uniform distribution over ``[low, high)``.
+
+        Parameters
+        ----------
+        low, high : float or array_like of floats, optional
+            Lower and upper boundary of the output interval.
+        size : int or tuple of ints, optional
+            Output shape.  Default is None, in which case a single value is
+            returned if `low` and `high` are both scalars, and
+            ``np.broadcast(low, high).shape`` samples otherwise.
+
+        Returns
+        -------
+        out : float or ndarray of floats
+        """
+        low, high = asarray(low), asarray(high)
+        u = self.random_sample(_param_size(size, low, high))
+        return low + (high - low) * u
+
+    def standard_normal(self, size=None):
+        """
+        Draw samples from a standard Normal distribution (mean=0, stdev=1).
+
+        Parameters
+        ----------
+        size : int or tuple of ints, optional
+            Output shape.  Default is None, in which case a single value is
+            returned.
+
+        Returns
+        -------
+        out : float or ndarray of floats
+        """
+        return self._generate(size, float64, _fill_normal, 2)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        """
+        Draw samples from a normal (Gaussian) distribution.
+
+        Parameters
+        ----------
+        loc : float or array_like of floats, optional
+            Mean of the distribution.
+        scale : float or array_like of floats, optional
+            Standard deviation of the distribution, non-negative.
+        size : int or tuple of ints, optional
+            Output shape.  Default is None, in which case a single value is
+            returned if `loc` and `scale` are both scalars, and
+            ``np.broadcast(loc, scale).shape`` samples otherwise.
+
+        Returns
+        -------
+        out : float or ndarray of floats
+        """
+        loc, scale = asarray(loc), asarray(scale)
+        if (scale < 0).any():
+            raise ValueError("scale < 0")
+        return loc + scale * self.standard_normal(_param_size(size, loc,
+                                                               scale))
+
+    def standard_exponential(self, size=None):
+        """
+        Draw samples from the standard exponential distribution.
+
+        Parameters
+        ----------
+        size : int or tuple of ints, optional
+            Output shape.  Default is None, in which case a single value is
+            returned.
+
+        Returns
+        -------
+        out : float or ndarray of floats
+        """
+        return self._generate(size, float64, _fill_exponential, 2)
+
+    def exponential(self, scale=1.0, size=None):
+        """
+        Draw samples from an exponential distribution.
+
+        Parameters
+        ----------
+        scale : float or array_like of floats, optional
+            The scale parameter, ``1/lambda``, non-negative.
+        size : int or tuple of ints, optional
+            Output shape.  Default is None, in which case a single value is
+            returned if `scale` is a scalar, and ``np.shape(scale)`` samples
+            otherwise.
+
+        Returns
+        -------
+        out : float or ndarray of floats
+        """
+        scale = asarray(scale)
+        if (scale < 0).any():
+            raise ValueError("scale < 0")
+        return scale * self.standard_exponential(_param_size(size, scale))
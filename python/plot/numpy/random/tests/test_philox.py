@@ -0,0 +1,125 @@
+from __future__ import division, absolute_import, print_function
+
+import pickle
+
+import numpy as np
+from numpy.random.philox import _philox4x32
+from numpy.testing import (
+        run_module_suite, assert_, assert_equal, assert_array_equal,
+        assert_raises,
+        )
+
+
+class TestPhilox4x32(object):
+
+    def _block(self, ctr, key):
+        words = _philox4x32(key[0] | key[1] << 32, ctr[2] | ctr[3] << 32,
+                            ctr[0] | ctr[1] << 32, 1)
+        return [int(w[0]) for w in words]
+
+    def test_known_answers(self):
+        # Test vectors of the Random123 distribution.
+        assert_equal(self._block((0, 0, 0, 0), (0, 0)),
+                     [0x6627e8d5, 0xe169c58d, 0xbc57ac4c, 0x9b00dbd8])
+        m = 0xffffffff
+        assert_equal(self._block((m, m, m, m), (m, m)),
+                     [0x408f276d, 0x41c83b0e, 0xa20bc7c6, 0x6d5451fd])
+        assert_equal(self._block((0x243f6a88, 0x85a308d3, 0x13198a2e,
+                                  0x03707344), (0xa4093822, 0x299f31d0)),
+                     [0xd16cfe09, 0x94fdcceb, 0x5001e420, 0x24126ea1])
+
+
+class TestPhilox(object):
+
+    def test_reproducible(self):
+        for method in ['random_sample', 'standard_normal',
+                       'standard_exponential', 'random_raw']:
+            x = getattr(np.random.Philox(42), method)((3, 5))
+            y = getattr(np.random.Philox(42), method)((3, 5))
+            assert_array_equal(x, y)
+            assert_equal(x.shape, (3, 5))
+
+    def test_threads_do_not_change_result(self):
+        n = 3 * 2 ** 17 + 7
+        for method in ['random_sample', 'standard_normal', 'random_raw']:
+            x = getattr(np.random.Philox(7, threads=1), method)(n)
+            y = getattr(np.random.Philox(7, threads=3), method)(n)
+            assert_array_equal(x, y)
+
+    def test_counter(self):
+        g = np.random.Philox(3)
+        g.random_sample(5)
+        assert_equal(g.counter, 3)
+        x = g.random_sample(4)
+        h = np.random.Philox(3)
+        h.advance(3)
+        assert_array_equal(h.random_sample(4), x)
+        # Values are a function of the position only.
+        assert_array_equal(np.random.Philox(3).random_sample(10)[6:],
+                           x)
+
+    def test_counter_wraparound(self):
+        # The block after 2**64 - 1 is block 0.
+        g = np.random.Philox(3)
+        g.advance(-1)
+        assert_equal(g.counter, 2 ** 64 - 1)
+        x = g.random_sample(6)
+        assert_equal(g.counter, 2)
+        assert_array_equal(x[2:], np.random.Philox(3).random_sample(4))
+        h = np.random.Philox(3)
+        h.advance(2 ** 64 - 1)
+        assert_array_equal(h.random_sample(2), x[:2])
+
+    def test_streams_differ(self):
+        x = np.random.Philox(1, stream=0).random_raw(100)
+        y = np.random.Philox(1, stream=1).random_raw(100)
+        assert_(not (x == y).all())
+        children = np.random.Philox(1).spawn(3)
+        assert_equal(len(set(c.seed for c in children)), 3)
+        assert_equal([c.seed for c in np.random.Philox(1).spawn(3)],
+                     [c.seed for c in children])
+
+    def test_distributions(self):
+        g = np.random.Philox(11)
+        u = g.random_sample(10 ** 5)
+        assert_((u >= 0).all() and (u < 1).all())
+        assert_(abs(u.mean() - 0.5) < 0.01)
+        z = g.normal(2.0, 3.0, 10 ** 5)
+        assert_(abs(z.mean() - 2.0) < 0.05)
+        assert_(abs(z.std() - 3.0) < 0.05)
+        e = g.exponential(2.0, 10 ** 5)
+        assert_((e >= 0).all())
+        assert_(abs(e.mean() - 2.0) < 0.05)
+        v = g.uniform(-1, 1, 10 ** 5)
+        assert_((v >= -1).all() and (v < 1).all())
+        assert_(isinstance(g.random_sample(), float))
+
+    def test_array_parameters(self):
+        # without a size, every parameter set gets its own variate
+        g = np.random.Philox(3)
+        v = g.uniform([0, 10, 20], [1, 11, 21])
+        assert_equal(v.shape, (3,))
+        assert_((v >= [0, 10, 20]).all() and (v < [1, 11, 21]).all())
+        z = g.normal([[0.], [100.]], [1., 2., 3.])
+        assert_equal(z.shape, (2, 3))
+        assert_(len(np.unique(z)) == 6)
+        assert_equal(g.exponential([1., 2.]).shape, (2,))
+        assert_equal(g.normal(0, [1., 2.], size=(4, 2)).shape, (4, 2))
+        assert_(isinstance(g.normal(1., 2.), float))
+
+    def test_pickle(self):
+        g = np.random.Philox(5, stream=2)
+        g.random_sample(3)
+        h = pickle.loads(pickle.dumps(g))
+        assert_array_equal(g.random_raw(8), h.random_raw(8))
+
+    def test_invalid(self):
+        assert_raises(ValueError, np.random.Philox, -1)
+        assert_raises(ValueError, np.random.Philox, 2 ** 64)
+        assert_raises(ValueError, np.random.Philox, 1, stream=-1)
+        assert_raises(ValueError, np.random.Philox, 1, threads=0)
+        assert_raises(ValueError, np.random.Philox(1).normal, 0, -1)
+
+
+if __name__ == "__main__":
+    run_module_suite()
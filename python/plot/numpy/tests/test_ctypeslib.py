@@ -1,11 +1,14 @@
 from __future__ import division, absolute_import, print_function
 
 import sys
+import gc
 
 import numpy as np
-from numpy.ctypeslib import ndpointer, load_library
+from numpy.ctypeslib import ndpointer, load_library, from_address
 from numpy.distutils.misc_util import get_shared_lib_extension
-from numpy.testing import run_module_suite, assert_, assert_raises, dec
+from numpy.testing import (
+    run_module_suite, assert_, assert_equal, assert_raises, dec, SkipTest
+    )
 
 try:
     cdll = None
@@ -20,6 +23,11 @@ try:
 except ImportError:
     _HAS_CTYPE = False
 
+try:
+    import ctypes
+except ImportError:
+    ctypes = None
+
 class TestLoadLibrary(object):
     @dec.skipif(not _HAS_CTYPE,
                 "ctypes not available on this python installation")
@@ -112,6 +120,75 @@ class TestNdpointer(object):
         a1 = ndpointer(dtype=np.float64)
         a2 = ndpointer(dtype=np.float64)
         assert_(a1 == a2)
+        assert_(ndpointer(shape=2) is ndpointer(shape=(2,)))
+        assert_(ndpointer(ndim=1, flags='C') is
+                ndpointer(ndim=1, flags='C_CONTIGUOUS'))
+        assert_(ndpointer(ndim=1) is not ndpointer(ndim=2))
+
+    @dec.skipif(ctypes is None,
+                "ctypes not available on this python installation")
+    def test_call(self):
+        # memmove through a prototype taking ndpointer arguments
+        ptr = ndpointer(dtype=np.float64)
+        proto = ctypes.CFUNCTYPE(ctypes.c_void_p, ptr, ptr, ctypes.c_size_t)
+        memmove = proto(ctypes.cast(ctypes.memmove, ctypes.c_void_p).value)
+
+        src = np.arange(12.).reshape(3, 4)
+        for s in [src, src[:, ::2], src.T, src[:0], src.copy()]:
+            if s is src:
+                s.flags.writeable = False
+            dst = np.zeros_like(s)
+            assert_equal(memmove(dst, s, s.nbytes), dst.ctypes.data or None)
+            if s.flags.contiguous:
+                assert_equal(dst, s)
+            assert_raises(ctypes.ArgumentError, memmove, dst, s.astype(int),
+                          s.nbytes)
+
+
+class TestFromAddress(object):
+    def setup(self):
+        if ctypes is None:
+            raise SkipTest("ctypes not available on this python installation")
+
+    def test_basic(self):
+        buf = (ctypes.c_double * 6)(*range(6))
+        a = from_address(ctypes.addressof(buf), np.double, (2, 3), owner=buf)
+        assert_equal(a, [[0, 1, 2], [3, 4, 5]])
+        a[1, 2] = 10
+        assert_equal(buf[5], 10)
+        assert_(a.base._owner is buf)
+
+        # ctypes pointers, strides and read-only memory
+        p = ctypes.cast(buf, ctypes.POINTER(ctypes.c_double))
+        b = from_address(p, np.double, (3, 2), strides=(8, 24),
+                         readonly=True)
+        assert_equal(b, a.T)
+        assert_(not b.flags.writeable)
+        c = from_address(ctypes.addressof(buf) + 8, np.double, 2,
+                         strides=(16,))
+        assert_equal(c, [1, 3])
+
+    def test_deleter(self):
+        buf = (ctypes.c_int * 4)()
+        deleted = []
+        a = from_address(ctypes.addressof(buf), np.intc, 4,
+                         deleter=lambda p: deleted.append(p.value))
+        view = a[1:]
+        del a
+        gc.collect()
+        assert_equal(deleted, [])
+        view[0] = 1
+        del view
+        gc.collect()
+        assert_equal(deleted, [ctypes.addressof(buf)])
+        assert_equal(buf[1], 1)
+
+    def test_errors(self):
+        assert_raises(ValueError, from_address, 0, np.double, 3)
+        assert_raises(ValueError, from_address, None, np.double, 3)
+        buf = (ctypes.c_double * 6)()
+        assert_raises(ValueError, from_address, ctypes.addressof(buf),
+                      np.double, (2, 3), strides=(8,))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+from __future__ import division, absolute_import, print_function
+
+import os
+import subprocess
+import sys
+import types
+
+import numpy as np
+from numpy._import_tools import LazyModule, lazy_import, import_profile
+from numpy.testing import assert_, assert_equal, run_module_suite
+
+
+def run_python(code, lazy):
+    env = dict(os.environ)
+    env['NUMPY_LAZY_IMPORT'] = '1' if lazy else '0'
+    p = subprocess.Popen([sys.executable, '-c', code], env=env,
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = p.communicate()
+    assert_equal(p.returncode, 0, err.decode('utf-8', 'replace'))
+    return out.decode('utf-8').split()
+
+
+class TestLazyModule(object):
+
+    def test_load_on_access(self):
+        name = 'numpy.tests._lazy_dummy_not_a_module'
+        mod = LazyModule(name)
+        assert_(isinstance(mod, types.ModuleType))
+        assert_('lazy module' in repr(mod))
+
+        try:
+            mod.anything
+        except ImportError:
+            pass
+        else:
+            raise AssertionError("expected an ImportError")
+
+    def test_loaded_modules_are_returned(self):
+        assert_(lazy_import('numpy.core') is np.core)
+
+    def test_on_load(self):
+        called = []
+        mod = LazyModule('numpy.lib.scimath', lambda: called.append(1))
+        assert_equal(mod.sqrt(-1), 1j)
+        assert_equal(called, [1])
+        assert_(mod.sqrt is np.lib.scimath.sqrt)
+
+
+class TestLazyNumpy(object):
+
+    code = ("import sys; import numpy as np; "
+            "print('numpy.ma' in sys.modules); "
+            "print(np.ma.masked_array([1, 2], [0, 1]).sum()); "
+            "print(np.linalg.inv([[2.]])[0, 0]); "
+            "print(np.ndarray.__doc__ is not None)")
+
+    def test_same_namespace(self):
+        code = ("import numpy as np; "
+                "print(' '.join(sorted(np.__all__))); "
+                "print(' '.join(n for n in dir(np) if not n.startswith('_')))")
+        assert_equal(run_python(code, lazy=True),
+                     run_python(code, lazy=False))
+
+    def test_lazy(self):
+        res = run_python(self.code, lazy=True)
+        assert_equal(res, ['False', '1', '0.5', 'True'])
+        res = run_python(self.code, lazy=False)
+        assert_equal(res, ['True', '1', '0.5', 'True'])
+
+
+def test_import_profile():
+    records = import_profile('numpy.compat')
+    names = [rec[1] for rec in records]
+    assert_('numpy.compat' in names)
+    assert_equal(names[-1], '<total>')
+    for depth, name, self_time, total in records:
+        assert_(0 <= self_time <= total)
+
+
+if __name__ == "__main__":
+    run_module_suite()